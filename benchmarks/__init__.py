@@ -0,0 +1 @@
+"""Benchmarks do dashboard. Execute com ``python -m benchmarks.<modulo>``."""
@@ -0,0 +1,61 @@
+"""Compara as janelas móveis vetorizadas com um loop de ``rolling`` por jogador.
+
+Uso: ``python -m benchmarks.forma [linhas] [janela]`` (padrão: 1.000.000 e 5).
+
+Cada cópia sintética tem jogadores próprios, como num dataset com vários
+clubes: o custo do loop cresce com o número de jogadores, o da versão
+vetorizada só com o número de linhas.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from benchmarks import sintetico
+from ituano import forma
+
+
+def _loop_por_jogador(df, janela):
+    # Abordagem ingênua: rolling do pandas jogador a jogador, métrica a métrica
+    jogou = df[df["statistics_minutes_played"] > 0].sort_values(["player_name", "ano", "jogo"])
+    resultado = {}
+    for jogador, linhas in jogou.groupby("player_name", observed=True):
+        minutos = linhas["statistics_minutes_played"].rolling(janela, min_periods=1).sum()
+        metricas = {
+            "gols_p90": 90 * linhas["statistics_goals"].fillna(0).rolling(janela, min_periods=1).sum() / minutos,
+            "nota": linhas["statistics_rating"].rolling(janela, min_periods=1).mean(),
+        }
+        for coluna in ["statistics_expected_goals", "statistics_expected_assists"]:
+            metricas[coluna] = 90 * linhas[coluna].rolling(janela, min_periods=1).sum() / minutos
+        certos = linhas["statistics_accurate_pass"].rolling(janela, min_periods=1).sum()
+        metricas["pass_accuracy"] = certos / linhas["statistics_total_pass"].rolling(janela, min_periods=1).sum()
+        resultado[jogador] = metricas
+    return resultado
+
+
+def _cronometrar(funcao, *args):
+    inicio = time.perf_counter()
+    resultado = funcao(*args)
+    return time.perf_counter() - inicio, resultado
+
+
+def main(n=1_000_000, janela=forma.JANELA_PADRAO):
+    df = sintetico.linhas(n, jogadores_distintos=True)[forma.COLUNAS_FORMA]
+    print(f"Linhas: {len(df):,}  Jogadores: {df['player_name'].nunique():,}  Janela: {janela}")
+
+    tempos = [_cronometrar(forma.calcular, df, janela) for _ in range(3)]
+    tempo_vetorizado, tabela = min(tempos, key=lambda medida: medida[0])
+    print(f"Vetorizado: {tempo_vetorizado:.3f} s")
+
+    tempo_loop, por_jogador = _cronometrar(_loop_por_jogador, df, janela)
+    print(f"Loop por jogador: {tempo_loop:.3f} s")
+    print(f"Speedup: {tempo_loop / tempo_vetorizado:.0f}x")
+
+    jogador, metricas = next(iter(por_jogador.items()))
+    assert np.allclose(tabela.loc[jogador, "gols_p90"].to_numpy(), metricas["gols_p90"].to_numpy())
+    assert np.allclose(tabela.loc[jogador, "nota"].to_numpy(), metricas["nota"].to_numpy(), equal_nan=True)
+
+
+if __name__ == "__main__":
+    main(*(int(argumento) for argumento in sys.argv[1:3]))
@@ -0,0 +1,146 @@
+"""Ingestão incremental contra a reconstrução completa.
+
+Uso: ``python -m benchmarks.ingestao [lotes] [fator]`` (padrão: 12 e 10).
+
+Parte de um CSV sintético com metade das temporadas e ingere o restante em
+lotes, cada lote por dois processos ao mesmo tempo e com linhas do lote
+anterior repetidas: todas as linhas novas devem entrar exatamente uma vez.
+Ao final, o sidecar Parquet, os agregados e as tendências mantidos
+incrementalmente são comparados com os reconstruídos do zero a partir do
+CSV (``AssertionError`` se divergirem), e o tempo de um lote com o de uma
+conversão completa. O mesmo vale para um diretório de dataset
+(``ingestao.ingerir_dataset``), comparado com uma nova conversão do diretório.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from benchmarks import sintetico
+from ituano import agregados, colunar, dados, ingestao, tendencias
+from ituano import dataset as _dataset
+
+# Linhas do lote anterior reenviadas em cada lote
+REPETIDAS = 20
+
+
+def _ordenar(df):
+    return df.sort_values(ingestao.CHAVE).reset_index(drop=True)
+
+
+def _comparar_agregados(incremental, completo):
+    for atributo in ("jogadores", "partidas"):
+        pd.testing.assert_frame_equal(
+            getattr(incremental, atributo).sort_index(), getattr(completo, atributo).sort_index(), check_like=True
+        )
+
+
+def _gravar_lotes(restantes, n_lotes, pasta):
+    """CSVs dos lotes e o número de linhas novas de cada um."""
+    lotes = np.array_split(np.arange(len(restantes)), n_lotes)
+    caminhos = []
+    for i, posicoes in enumerate(lotes):
+        anteriores = lotes[i - 1][-REPETIDAS:] if i else posicoes[:0]
+        caminho = os.path.join(pasta, f"lote-{i}.csv")
+        restantes.iloc[np.concatenate([anteriores, posicoes])].to_csv(caminho, index=False)
+        caminhos.append((caminho, len(posicoes)))
+    return caminhos
+
+
+def _ingerir_lotes(executor, funcao, lotes, destino, depois=None):
+    """Ingere cada lote por dois processos ao mesmo tempo; retorna o tempo de cada lote."""
+    tempos = []
+    for caminho, novas in lotes:
+        inicio = time.perf_counter()
+        resumos = list(executor.map(funcao, [caminho] * 2, [destino] * 2))
+        tempos.append(time.perf_counter() - inicio)
+        assert sum(resumo["incluidas"] for resumo in resumos) == novas, resumos
+        if depois is not None:
+            depois()
+    return tempos
+
+
+def verificar_csv(df, anos_iniciais, lotes, pasta, executor):
+    csv = os.path.join(pasta, "partidas.csv")
+    df[df["ano"].isin(anos_iniciais)].to_csv(csv, index=False)
+    colunar.converter(csv)
+
+    def ler(anos_lidos):
+        return colunar.ler(tendencias.COLUNAS_TENDENCIA, anos=anos_lidos, caminho_csv=csv)
+
+    modelo = tendencias.ModeloTendencias()
+    modelo.atualizar(colunar.versoes_anos(csv), ler)
+    agregados.obter(csv)
+    tempos = _ingerir_lotes(
+        executor, ingestao.ingerir, lotes, csv, lambda: modelo.atualizar(colunar.versoes_anos(csv), ler)
+    )
+
+    incremental = _ordenar(colunar.ler(caminho_csv=csv))
+    agregados_incrementais = agregados.obter(csv)
+    somas_incrementais = modelo.somas()
+
+    inicio = time.perf_counter()
+    colunar.converter(csv)
+    tempo_conversao = time.perf_counter() - inicio
+
+    completo = _ordenar(dados.ler_csv(csv))
+    pd.testing.assert_frame_equal(incremental, completo, check_categorical=False)
+    pd.testing.assert_frame_equal(_ordenar(colunar.ler(caminho_csv=csv)), completo, check_categorical=False)
+    pd.testing.assert_frame_equal(_ordenar(df), completo, check_dtype=False, check_categorical=False)
+    _comparar_agregados(
+        agregados_incrementais, agregados.AgregadosTemporada.construir(completo[agregados.COLUNAS_AGREGADOS])
+    )
+    pd.testing.assert_frame_equal(
+        somas_incrementais, tendencias.somas_temporada(tendencias.observacoes(completo)), check_exact=False
+    )
+    return tempos, tempo_conversao
+
+
+def verificar_dataset(df, anos_iniciais, lotes, pasta, executor):
+    diretorio = os.path.join(pasta, "dataset")
+    os.makedirs(diretorio)
+    df[df["ano"].isin(anos_iniciais)].to_csv(os.path.join(diretorio, "inicial.csv"), index=False)
+    base = _dataset.abrir(diretorio)
+    base.atualizar()
+    tempos = _ingerir_lotes(executor, ingestao.ingerir_dataset, lotes, diretorio)
+
+    selecao = _dataset.Selecao(df["time_alvo"].iloc[0])
+    incremental = _ordenar(base.ler(list(df.columns), selecao))
+
+    inicio = time.perf_counter()
+    shutil.rmtree(base.raiz_colunar)
+    completo = _dataset.DatasetPartidas(diretorio)
+    completo.atualizar()
+    tempo_conversao = time.perf_counter() - inicio
+
+    pd.testing.assert_frame_equal(incremental, _ordenar(completo.ler(list(df.columns), selecao)))
+    pd.testing.assert_frame_equal(
+        incremental, _ordenar(df[list(df.columns)]), check_dtype=False, check_categorical=False
+    )
+    return tempos, tempo_conversao
+
+
+def main(n_lotes=12, fator=10):
+    df = sintetico.escalar(dados.carregar_dados(), fator)
+    anos = np.sort(df["ano"].unique())
+    anos_iniciais = anos[: len(anos) // 2]
+    restantes = df[~df["ano"].isin(anos_iniciais)]
+    print(f"Linhas: {len(df):,}  Temporadas: {len(anos)}  Lotes: {n_lotes} de ~{len(restantes) // n_lotes:,} linhas")
+
+    with tempfile.TemporaryDirectory() as pasta, ProcessPoolExecutor(max_workers=2) as executor:
+        lotes = _gravar_lotes(restantes, n_lotes, pasta)
+        for nome, verificar in [("CSV único", verificar_csv), ("dataset", verificar_dataset)]:
+            tempos, tempo_conversao = verificar(df, anos_iniciais, lotes, pasta, executor)
+            print(f"{nome}: lote (2 processos) mediana {np.median(tempos):.3f} s, máximo {max(tempos):.3f} s; "
+                  f"conversão completa {tempo_conversao:.3f} s")
+    print("Incremental e reconstrução completa coincidem.")
+
+
+if __name__ == "__main__":
+    main(*(int(argumento) for argumento in sys.argv[1:3]))
@@ -0,0 +1,53 @@
+"""Bytes enviados por rerun para exibir o logo, em cada modo.
+
+Executa cada variante com ``AppTest`` e soma o tamanho serializado dos
+elementos gerados (o que vai no delta do websocket a cada rerun).
+
+Uso: ``python -m benchmarks.logo``
+"""
+
+from streamlit.testing.v1 import AppTest
+
+from ituano import assets, dados
+
+_PREAMBULO = f"import sys\nsys.path.insert(0, {dados.RAIZ_PROJETO!r})\nimport streamlit as st\nfrom ituano import assets\n"
+
+VARIANTES = {
+    "base64 inline a cada rerun (antigo)": """
+import base64
+with open(assets.LOGO, "rb") as image_file:
+    encoded = base64.b64encode(image_file.read()).decode()
+st.markdown(f"<div style='text-align: center;'><img src='data:image/png;base64,{encoded}' width='400'/></div>",
+            unsafe_allow_html=True)
+""",
+    "st.image com bytes em cache": """
+_, centro, _ = st.columns([1, 2, 1])
+centro.image(assets.bytes_imagem(largura=400), width=400)
+""",
+    "static serving (app/static)": """
+st.markdown(assets.html_imagem_centralizada(largura=400), unsafe_allow_html=True)
+""",
+}
+
+
+def _bytes_elementos(no):
+    total = 0
+    proto = getattr(no, "proto", None)
+    if proto is not None and hasattr(proto, "ByteSize"):
+        total += proto.ByteSize()
+    for filho in getattr(no, "children", {}).values():
+        total += _bytes_elementos(filho)
+    return total
+
+
+def main():
+    print(f"Logo: {assets.LOGO}")
+    for nome, codigo in VARIANTES.items():
+        app = AppTest.from_string(_PREAMBULO + codigo)
+        app.run()
+        assert not app.exception, app.exception
+        print(f"{nome:<38} {_bytes_elementos(app._tree):>8} bytes/rerun")
+
+
+if __name__ == "__main__":
+    main()
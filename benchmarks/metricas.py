@@ -0,0 +1,49 @@
+"""Compara o cálculo vetorizado das métricas derivadas com o ``apply`` por linha.
+
+Uso: ``python -m benchmarks.metricas [linhas]`` (padrão: 1.000.000).
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from benchmarks import sintetico
+from ituano import metricas
+
+
+def _apply_original(df):
+    # Caminho antigo do Dashboard.py: loop Python linha a linha
+    gols = df.apply(lambda row: row["home_score"] if row["home_or_away"] == "Home" else row["away_score"], axis=1)
+    fez_gol = gols >= 1
+    validos = df[df["statistics_minutes_played"] > 0].copy()
+    validos["gols_por_minuto"] = validos["statistics_goals"] / validos["statistics_minutes_played"]
+    validos["pass_accuracy"] = validos["statistics_accurate_pass"] / validos["statistics_total_pass"]
+    validos["passes_certos_por_minuto"] = validos["statistics_accurate_pass"] / validos["statistics_minutes_played"]
+    return gols, fez_gol, validos
+
+
+def _cronometrar(funcao, *args):
+    inicio = time.perf_counter()
+    funcao(*args)
+    return time.perf_counter() - inicio
+
+
+def main(n=1_000_000):
+    df = sintetico.linhas(n)
+    print(f"Linhas: {len(df):,}")
+
+    tempo_vetorizado = min(_cronometrar(metricas.derivar, df) for _ in range(3))
+    print(f"Vetorizado: {tempo_vetorizado:.3f} s")
+
+    tempo_apply = _cronometrar(_apply_original, df)
+    print(f"apply(axis=1): {tempo_apply:.3f} s")
+    print(f"Speedup: {tempo_apply / tempo_vetorizado:.0f}x")
+
+    # O caminho vetorizado normaliza a caixa de home_or_away
+    esperado = np.where(df["home_or_away"].astype(str).str.lower() == "home", df["home_score"], df["away_score"])
+    assert (metricas.gols_ituano(df).to_numpy() == esperado).all()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,62 @@
+"""Latência da busca de jogadores semelhantes conforme o conjunto cresce.
+
+Uso: ``python -m benchmarks.similaridade [fator ...]`` (padrão: 1 10 100 1000).
+
+O fator 1 é o CSV do Ituano; cada cópia sintética tem jogadores e temporadas
+próprios, até o tamanho de uma liga inteira ao longo de vários anos. Mede a
+construção do índice, a atualização após mudar uma temporada e a latência
+das consultas (p50/p95) nas duas métricas.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from benchmarks import sintetico
+from ituano import dados, similaridade
+
+CONSULTAS = 200
+
+
+def _latencias(indice, metrica, gerador):
+    posicoes = gerador.integers(0, len(indice), CONSULTAS)
+    tempos = []
+    for posicao in posicoes:
+        inicio = time.perf_counter()
+        indice.consultar(posicao, 10, metrica)
+        tempos.append(time.perf_counter() - inicio)
+    return np.percentile(tempos, [50, 95]) * 1000
+
+
+def main(fatores=(1, 10, 100, 1000)):
+    base = dados.carregar_dados()[similaridade.COLUNAS_SIMILARIDADE]
+    gerador = np.random.default_rng(0)
+    print(f"{'fator':>6} {'linhas':>10} {'jogador-temp.':>13} {'construção':>11} {'1 temporada':>12} "
+          f"{'cos p50/p95 (ms)':>17} {'eucl p50/p95 (ms)':>18}")
+    for fator in fatores:
+        df = sintetico.escalar(base, fator, jogadores_distintos=True)
+        anos = sorted(int(ano) for ano in df["ano"].unique())
+        por_ano = dict(tuple(df.groupby("ano", observed=True)))
+
+        def ler(anos_lidos):
+            return df[df["ano"].isin(anos_lidos)] if len(anos_lidos) > 1 else por_ano[anos_lidos[0]]
+
+        indice = similaridade.IndiceSimilaridade()
+        inicio = time.perf_counter()
+        indice.atualizar({ano: 0 for ano in anos}, ler)
+        construcao = time.perf_counter() - inicio
+
+        # Simula a ingestão de uma temporada: só ela é relida
+        inicio = time.perf_counter()
+        indice.atualizar({ano: int(ano == anos[-1]) for ano in anos}, ler)
+        incremental = time.perf_counter() - inicio
+
+        cosseno = _latencias(indice, "cosseno", gerador)
+        euclidiana = _latencias(indice, "euclidiana", gerador)
+        print(f"{fator:>6} {len(df):>10,} {len(indice):>13,} {construcao:>10.2f}s {incremental:>11.2f}s "
+              f"{cosseno[0]:>8.2f}/{cosseno[1]:<8.2f} {euclidiana[0]:>9.2f}/{euclidiana[1]:<8.2f}")
+
+
+if __name__ == "__main__":
+    main(tuple(int(fator) for fator in sys.argv[1:]) or (1, 10, 100, 1000))
@@ -0,0 +1,38 @@
+"""Geração de dados sintéticos a partir do CSV incluído no repositório."""
+
+import numpy as np
+import pandas as pd
+
+from ituano import dados
+
+
+def escalar(df, fator, jogadores_distintos=False):
+    """Replica ``df`` ``fator`` vezes, deslocando ``ano`` a cada cópia.
+
+    Cada cópia vira um novo bloco de temporadas, de modo que agregados por
+    temporada crescem junto com o número de linhas. Com
+    ``jogadores_distintos=True`` cada cópia também tem seus próprios
+    jogadores ("Nome #2", ...), como num dataset com vários clubes.
+    """
+    if fator <= 1:
+        return df.reset_index(drop=True)
+    anos = df["ano"].to_numpy()
+    deslocamento = int(anos.max() - anos.min() + 1)
+    copias = np.repeat(np.arange(fator), len(df))
+    resultado = pd.concat([df] * fator, ignore_index=True)
+    resultado["ano"] = (np.tile(anos, fator) + copias * deslocamento).astype(anos.dtype)
+    if jogadores_distintos:
+        nomes = df["player_name"].astype("category")
+        categorias = nomes.cat.categories.astype(str)
+        codigos = np.tile(nomes.cat.codes.to_numpy(), fator)
+        resultado["player_name"] = pd.Categorical.from_codes(
+            np.where(codigos >= 0, codigos + copias * len(categorias), -1),
+            [f"{nome} #{copia + 1}" for copia in range(fator) for nome in categorias],
+        )
+    return resultado
+
+
+def linhas(n, caminho_csv=dados.CSV_PADRAO, jogadores_distintos=False):
+    """DataFrame tipado com pelo menos ``n`` linhas."""
+    base = dados.carregar_dados(caminho_csv)
+    return escalar(base, -(-n // len(base)), jogadores_distintos)
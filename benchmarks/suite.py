@@ -0,0 +1,179 @@
+"""Suíte de benchmarks das seções de análise, sem Streamlit.
+
+Uso::
+
+    python -m benchmarks.suite [--fatores 1 10 100 1000] [--repeticoes 3]
+                               [--saida resultados.json] [--comparar base.json]
+
+O fator 1 é o CSV incluído no repositório; os demais são cópias sintéticas
+(``benchmarks.sintetico``) com temporadas e jogadores próprios. Cada seção
+(leitura, métricas, agregados, testes, tendências, forma, similaridade) é
+medida ``--repeticoes`` vezes (fica o menor tempo) e mais uma vez com
+``ituano.perfil`` para o pico de memória; ``SECOES_UMA_VEZ`` rodam só a
+execução perfilada.
+
+Com ``--comparar`` as seções mais lentas que a execução de referência além da
+``--tolerancia`` são listadas e o comando sai com código 1.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks import sintetico
+from ituano import agregados, analise, colunar, dados, forma, metricas, perfil, similaridade, tendencias
+
+FATORES = (1, 10, 100, 1000)
+
+# Acima disso o CSV sintético passa de 100 MB e a leitura fica de fora
+MAX_FATOR_LEITURA = 100
+# A conversão só acontece uma vez (as seguintes encontrariam o sidecar válido)
+SECOES_UMA_VEZ = {"conversao_colunar"}
+
+# Os testes entre temporadas comparam todos os pares: com uma temporada nova
+# por cópia sintética o número de pares cresce com o quadrado do fator
+MAX_FATOR_PARES = 100
+
+# Razão de tempo acima da qual uma seção conta como regressão (e ao menos
+# TEMPO_MINIMO segundos de diferença, para ignorar ruído em seções rápidas)
+TOLERANCIA = 1.3
+TEMPO_MINIMO = 0.025
+
+COLUNAS = sorted(
+    set(analise.COLUNAS_ANALISE) | set(forma.COLUNAS_FORMA) | set(similaridade.COLUNAS_SIMILARIDADE)
+    | set(tendencias.COLUNAS_TENDENCIA) | set(agregados.COLUNAS_AGREGADOS)
+)
+# Colunas do DataFrame com métricas derivadas (agregados e passes)
+COLUNAS_DERIVADAS = list(dict.fromkeys(analise.COLUNAS_ANALISE + agregados.COLUNAS_AGREGADOS))
+
+
+def _secoes(contexto):
+    """Seção -> função sem argumentos, na ordem de dependência do dashboard."""
+    df, derivado, ag = contexto["df"], contexto["derivado"], contexto["agregados"]
+    secoes = {}
+    if "csv" in contexto:
+        secoes["leitura_csv"] = lambda: dados.ler_csv(contexto["csv"], COLUNAS)
+        secoes["conversao_colunar"] = lambda: colunar.converter(contexto["csv"])
+        secoes["leitura_colunar"] = lambda: colunar.ler(COLUNAS, caminho_csv=contexto["csv"])
+    secoes.update({
+        "metricas": lambda: metricas.derivar(df[COLUNAS_DERIVADAS]),
+        "agregados": lambda: agregados.AgregadosTemporada.construir(derivado),
+        "destaques": lambda: analise.destaques_por_ano(ag),
+        "passes": lambda: analise.eficiencia_passes(derivado),
+        "tendencias": lambda: analise.tendencias_temporada(df),
+        "forma": lambda: forma.calcular(df),
+        "similaridade": lambda: similaridade.IndiceSimilaridade().atualizar(
+            {ano: 0 for ano in ag.anos}, lambda anos: df),
+    })
+    if contexto["fator"] <= MAX_FATOR_PARES:
+        secoes["testes_pares"] = lambda: analise.estatisticas_temporadas(ag)
+    return secoes
+
+
+def _medir(funcao, repeticoes):
+    """Menor tempo em ``repeticoes`` execuções e o pico de memória de uma execução extra.
+
+    Com ``repeticoes=0`` a própria execução perfilada dá o tempo.
+    """
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    medicao = perfil.Perfil()
+    with medicao.execucao():
+        funcao()
+    return min(tempos, default=medicao.duracao), medicao.pico_mb
+
+
+def rodar_fator(base, fator, repeticoes, pasta, secoes=None):
+    """Mede as seções num conjunto ``fator`` vezes maior que o CSV do repositório."""
+    df = sintetico.escalar(base, fator, jogadores_distintos=True)
+    contexto = {"fator": fator, "df": df}
+    if fator <= MAX_FATOR_LEITURA:
+        if fator == 1:
+            # Cópia: o sidecar Parquet é gerado na pasta temporária, não no repositório
+            contexto["csv"] = shutil.copy(dados.CSV_PADRAO, pasta)
+        else:
+            contexto["csv"] = os.path.join(pasta, f"sintetico-{fator}.csv")
+            df.to_csv(contexto["csv"], index=False)
+    contexto["derivado"] = metricas.derivar(df[COLUNAS_DERIVADAS])
+    contexto["agregados"] = agregados.AgregadosTemporada.construir(contexto["derivado"])
+
+    resultados = []
+    for nome, funcao in _secoes(contexto).items():
+        if secoes and nome not in secoes:
+            continue
+        vezes = 0 if nome in SECOES_UMA_VEZ else repeticoes
+        segundos, pico_mb = _medir(funcao, vezes)
+        resultados.append({"fator": fator, "linhas": len(df), "secao": nome, "s": segundos, "pico_mb": pico_mb})
+        print(f"{fator:>6} {len(df):>10,} {nome:<18} {segundos:>9.3f} s {pico_mb:>9.1f} MB", flush=True)
+    return resultados
+
+
+def ambiente():
+    return {
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "plataforma": platform.platform(),
+        "cpus": os.cpu_count(),
+        "instante": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+
+def comparar(resultados, referencia, tolerancia=TOLERANCIA):
+    """Seções (fator, seção) mais lentas que na ``referencia`` além da tolerância."""
+    anteriores = {(r["fator"], r["secao"]): r["s"] for r in referencia["resultados"]}
+    regressoes = []
+    for r in resultados:
+        anterior = anteriores.get((r["fator"], r["secao"]))
+        if anterior and r["s"] > anterior * tolerancia and r["s"] - anterior > TEMPO_MINIMO:
+            regressoes.append({**r, "referencia_s": anterior, "razao": r["s"] / anterior})
+    return regressoes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fatores", type=int, nargs="+", default=FATORES)
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--secoes", nargs="+", help="mede só estas seções")
+    parser.add_argument("--saida", help="grava os resultados em JSON")
+    parser.add_argument("--comparar", help="JSON de uma execução anterior para detectar regressões")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA)
+    args = parser.parse_args(argv)
+
+    base = dados.carregar_dados()[COLUNAS]
+    print(f"{'fator':>6} {'linhas':>10} {'seção':<18} {'tempo':>11} {'pico':>12}")
+    resultados = []
+    with tempfile.TemporaryDirectory() as pasta:
+        for fator in args.fatores:
+            resultados += rodar_fator(base, fator, args.repeticoes, pasta, args.secoes)
+
+    execucao = {"ambiente": ambiente(), "resultados": resultados}
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            json.dump(execucao, arquivo, ensure_ascii=False, indent=2)
+        print(f"Resultados gravados em {args.saida}")
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as arquivo:
+            regressoes = comparar(resultados, json.load(arquivo), args.tolerancia)
+        for r in regressoes:
+            print(f"REGRESSÃO fator {r['fator']} {r['secao']}: {r['referencia_s']:.3f} s -> {r['s']:.3f} s "
+                  f"({r['razao']:.1f}x)")
+        if regressoes:
+            sys.exit(1)
+        print("Sem regressões em relação à referência.")
+
+
+if __name__ == "__main__":
+    main()
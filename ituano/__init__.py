@@ -0,0 +1 @@
+"""Módulos de apoio ao dashboard de desempenho do Ituano."""
@@ -0,0 +1,237 @@
+"""Agregados materializados por temporada.
+
+Duas tabelas são construídas uma vez por versão dos dados:
+
+- ``jogadores``: jogador x temporada (índice ``ano``, ``player_name``);
+- ``partidas``: partida x temporada (índice ``ano``, ``jogo``).
+
+As colunas base são somas/contagens, de modo que novas linhas de partida
+podem ser incorporadas somando apenas os agregados das temporadas afetadas.
+"""
+
+import threading
+
+import pandas as pd
+
+from ituano import colunar, dados, metricas
+
+COLUNAS_AGREGADOS = [
+    "ano",
+    "jogo",
+    "player_name",
+    "statistics_goals",
+    "statistics_minutes_played",
+    "statistics_accurate_pass",
+    "statistics_total_pass",
+    "home_or_away",
+    "home_score",
+    "away_score",
+]
+
+# Colunas aditivas da tabela de jogadores
+SOMAS_JOGADORES = [
+    "gols", "minutos", "gpm_soma", "gpm_soma_quadrados", "gpm_n", "passes_certos", "passes_totais", "jogos",
+]
+
+
+def _somas_jogadores(df):
+    minutos = df["statistics_minutes_played"].astype("float64")
+    gols = df["statistics_goals"].astype("float64")
+    # Gols por minuto de cada partida, apenas para quem entrou em campo
+    gpm = metricas.gols_por_minuto(df)
+
+    base = pd.DataFrame({
+        "ano": df["ano"],
+        "player_name": df["player_name"],
+        "gols": gols,
+        "minutos": minutos,
+        "gpm_soma": gpm,
+        "gpm_soma_quadrados": gpm ** 2,
+        "gpm_n": gpm.notna(),
+        "passes_certos": df["statistics_accurate_pass"].astype("float64"),
+        "passes_totais": df["statistics_total_pass"].astype("float64"),
+        "jogos": minutos > 0,
+    })
+    somas = base.groupby(["ano", "player_name"], observed=True).sum()
+    return somas.astype({"gpm_n": "int64", "jogos": "int64"})
+
+
+def _derivar_jogadores(somas):
+    jogadores = somas.copy()
+    com_minutos = jogadores["minutos"] > 0
+    jogadores["gols_por_minuto"] = (jogadores["gols"] / jogadores["minutos"]).where(com_minutos)
+    jogadores["gpm_medio"] = (jogadores["gpm_soma"] / jogadores["gpm_n"]).where(jogadores["gpm_n"] > 0)
+    return jogadores.sort_index()
+
+
+def _partidas(df):
+    base = pd.DataFrame({
+        "ano": df["ano"],
+        "jogo": df["jogo"],
+        "gols_ituano": metricas.gols_ituano(df),
+        "player_name": df["player_name"],
+    })
+    partidas = base.groupby(["ano", "jogo"], sort=True).agg(
+        gols_ituano=("gols_ituano", "first"),
+        linhas=("player_name", "size"),
+    )
+    partidas["fez_gol"] = partidas["gols_ituano"] >= 1
+    return partidas
+
+
+class AgregadosTemporada:
+    """Tabelas jogador x temporada e partida x temporada (imutáveis)."""
+
+    def __init__(self, jogadores, partidas):
+        self.jogadores = jogadores
+        self.partidas = partidas
+
+    @classmethod
+    def construir(cls, df):
+        return cls(_derivar_jogadores(_somas_jogadores(df)), _partidas(df))
+
+    @classmethod
+    def construir_em_lotes(cls, lotes):
+        """Constrói incorporando um DataFrame de cada vez (memória limitada ao lote)."""
+        agregados = None
+        for lote in lotes:
+            agregados = cls.construir(lote) if agregados is None else agregados.incorporar(lote)
+        if agregados is None:
+            return cls.construir(pd.DataFrame({coluna: pd.Series(dtype="float64") for coluna in COLUNAS_AGREGADOS}))
+        return agregados
+
+    def incorporar(self, novas_linhas):
+        """Retorna novos agregados somando as linhas de partida recebidas.
+
+        Só as temporadas presentes em ``novas_linhas`` são recalculadas; as
+        demais são reaproveitadas como estão.
+        """
+        if novas_linhas.empty:
+            return self
+        anos = set(novas_linhas["ano"].unique())
+
+        afetados = self.jogadores[self.jogadores.index.get_level_values("ano").isin(anos)]
+        somas = pd.concat([afetados[SOMAS_JOGADORES], _somas_jogadores(novas_linhas)])
+        somas = somas.groupby(level=["ano", "player_name"], observed=True).sum()
+        intactos = self.jogadores[~self.jogadores.index.get_level_values("ano").isin(anos)]
+        jogadores = pd.concat([intactos, _derivar_jogadores(somas)]).sort_index()
+
+        partidas = pd.concat([self.partidas, _partidas(novas_linhas)])
+        partidas = partidas.groupby(level=["ano", "jogo"]).agg(
+            {"gols_ituano": "first", "linhas": "sum", "fez_gol": "first"}
+        )
+        return AgregadosTemporada(jogadores, partidas)
+
+    def substituir_temporadas(self, anos, linhas):
+        """Retorna novos agregados com as temporadas ``anos`` reconstruídas a partir de ``linhas``."""
+        jogadores = self.jogadores[~self.jogadores.index.get_level_values("ano").isin(anos)]
+        partidas = self.partidas[~self.partidas.index.get_level_values("ano").isin(anos)]
+        if not linhas.empty:
+            novos = AgregadosTemporada.construir(linhas)
+            jogadores = pd.concat([jogadores, novos.jogadores])
+            partidas = pd.concat([partidas, novos.partidas])
+        return AgregadosTemporada(jogadores.sort_index(), partidas.sort_index())
+
+    @property
+    def anos(self):
+        return sorted(int(ano) for ano in self.jogadores.index.get_level_values("ano").unique())
+
+    def temporada(self, ano):
+        """Tabela de jogadores de uma temporada, indexada por jogador."""
+        return self.jogadores.loc[ano]
+
+    def gols_por_jogador(self, ano):
+        return self.temporada(ano)["gols"]
+
+    def top_eficiencia(self, ano, n=3):
+        """Top ``n`` por gols/minutos somados na temporada."""
+        temporada = self.temporada(ano)
+        temporada = temporada[temporada["minutos"] > 0]
+        return (
+            temporada[["gols", "minutos", "gols_por_minuto"]]
+            .rename(columns={"gols": "statistics_goals", "minutos": "statistics_minutes_played"})
+            .sort_values("gols_por_minuto", ascending=False)
+            .head(n)
+        )
+
+    def top_gpm_medio(self, ano, n=3):
+        """Top ``n`` pela média dos gols por minuto de cada partida."""
+        return self.temporada(ano)["gpm_medio"].nlargest(n)
+
+    def partidas_temporada(self, ano):
+        return self.partidas.loc[ano]
+
+
+class SomasPorTemporada:
+    """Somas por temporada mantidas entre versões dos dados.
+
+    Subclasses definem ``COLUNAS`` (as colunas que ``ler`` deve devolver),
+    ``somar(df)`` (somas com ``ano`` no índice) e ``_montar()``, que recalcula
+    o que depende das somas de todas as temporadas.
+    """
+
+    COLUNAS = []
+
+    def __init__(self):
+        self._versoes = {}
+        self._somas = self.somar(pd.DataFrame(columns=self.COLUNAS))
+        self._lock = threading.Lock()
+        self._montado = False
+
+    def somar(self, df):
+        raise NotImplementedError
+
+    def _montar(self):
+        raise NotImplementedError
+
+    def atualizar(self, versoes, ler):
+        """Sincroniza com ``versoes`` (``{ano: versao}``), lendo só o que mudou.
+
+        ``ler(anos)`` deve devolver as linhas de partida dessas temporadas com
+        ``COLUNAS``. Retorna as temporadas relidas.
+        """
+        with self._lock:
+            alteradas = sorted(ano for ano, versao in versoes.items() if self._versoes.get(ano) != versao)
+            removidas = [ano for ano in self._versoes if ano not in versoes]
+            if alteradas or removidas:
+                mantidas = ~self._somas.index.get_level_values("ano").isin(alteradas + removidas)
+                partes = [self._somas[mantidas]] + ([self.somar(ler(alteradas))] if alteradas else [])
+                self._somas = pd.concat(partes).sort_index()
+                self._versoes = dict(versoes)
+            if alteradas or removidas or not self._montado:
+                self._montar()
+                self._montado = True
+            return alteradas
+
+    def somas(self):
+        """Somas de todas as temporadas (ver ``somar``)."""
+        return self._somas
+
+
+_lock = threading.Lock()
+_cache = {}
+
+
+def obter(caminho_csv=dados.CSV_PADRAO):
+    """Agregados da versão atual dos dados, construídos uma vez por versão.
+
+    Quando só algumas temporadas mudaram (ver ``ituano.ingestao``), apenas
+    elas são relidas e reconstruídas; as demais vêm da versão anterior.
+    """
+    # As versões por temporada vêm de uma única leitura do manifesto e formam
+    # a chave: assim a versão guardada nunca é mais nova que os dados
+    versoes = colunar.versoes_anos(caminho_csv)
+    versao = tuple(sorted(versoes.items())) if versoes is not None else colunar.versao(caminho_csv)
+    with _lock:
+        em_cache = _cache.get(caminho_csv)
+        if em_cache is not None and em_cache[0] == versao:
+            return em_cache[2]
+        if em_cache is not None and em_cache[1] is not None and versoes is not None:
+            anteriores = em_cache[1]
+            alteradas = sorted(ano for ano in set(versoes) | set(anteriores) if versoes.get(ano) != anteriores.get(ano))
+            linhas = colunar.ler(COLUNAS_AGREGADOS, anos=alteradas, caminho_csv=caminho_csv)
+            agregados = em_cache[2].substituir_temporadas(alteradas, linhas)
+        else:
+            agregados = AgregadosTemporada.construir(colunar.ler(COLUNAS_AGREGADOS, caminho_csv=caminho_csv))
+        _cache[caminho_csv] = (versao, versoes, agregados)
+        return agregados
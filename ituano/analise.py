@@ -0,0 +1,237 @@
+"""Núcleo de análise do dashboard, independente do Streamlit.
+
+Funções puras sobre o DataFrame de partidas (com as métricas derivadas de
+``ituano.metricas``) e sobre os agregados de ``ituano.agregados``. As páginas
+do dashboard e o gerador de relatórios (``python -m ituano.relatorio``) usam
+as mesmas funções.
+"""
+
+import numpy as np
+import pandas as pd
+
+from ituano import agregados as _agregados
+from ituano import dados, estatistica, metricas, tendencias
+
+COLUNAS_ANALISE = [
+    "ano",
+    "player_name",
+    "statistics_goals",
+    "statistics_minutes_played",
+    "statistics_accurate_pass",
+    "statistics_total_pass",
+    "home_or_away",
+    "home_score",
+    "away_score",
+    "statistics_expected_goals",
+    "statistics_rating",
+]
+
+# Tabelas de ``eficiencia_passes``: chave -> coluna ordenada
+TABELAS_PASSES = {
+    "mais_passes": "statistics_accurate_pass",
+    "melhor_acerto": "pass_accuracy",
+    "por_minuto": "passes_certos_por_minuto",
+}
+
+# Colunas de ``tendencias.ajustar`` exibidas no relatório
+COLUNAS_TENDENCIAS = [
+    "atuacoes", "temporadas", "inclinacao", "ic_inclinacao_inferior", "ic_inclinacao_superior", "p_valor", "r2",
+]
+
+
+def carregar(caminho_csv=dados.CSV_PADRAO):
+    """DataFrame com métricas derivadas e agregados da versão atual dos dados."""
+    return metricas.obter(COLUNAS_ANALISE, caminho_csv=caminho_csv), _agregados.obter(caminho_csv)
+
+
+def resumo_gols(agregados, ano, n=5, confianca=0.95, intervalos=None):
+    """Gols por jogador na temporada, média com IC e os ``n`` melhores/piores.
+
+    ``intervalos`` é ``estatistica.ic_gols_por_ano`` já calculado (para várias temporadas).
+    """
+    gols_jogadores = agregados.gols_por_jogador(ano)
+    if intervalos is None:
+        intervalos = estatistica.ic_gols_por_ano(agregados, confianca)
+    ic = intervalos.loc[ano]
+    return {
+        "gols_jogadores": gols_jogadores,
+        "media": ic["media"],
+        "intervalo": (ic["limite_inferior"], ic["limite_superior"]),
+        "melhores": gols_jogadores.nlargest(n),
+        "piores": gols_jogadores.nsmallest(n),
+    }
+
+
+def _melhores_passes(passes_df, n):
+    # Ordena só a coluna exibida: a ordem é a mesma que ordenando a tabela inteira
+    return {
+        chave: passes_df[["player_name", coluna]].sort_values(coluna, ascending=False).head(n)
+        for chave, coluna in TABELAS_PASSES.items()
+    }
+
+
+def eficiencia_passes(df, ano=None, n=5):
+    """Atuações com mais passes certos, melhor acerto e mais passes certos por minuto."""
+    if ano is not None:
+        df = df[df["ano"] == ano]
+    return _melhores_passes(df[df["statistics_minutes_played"] > 0], n)
+
+
+def estatisticas_temporadas(agregados):
+    """ICs e testes para todas as temporadas e todos os pares de temporadas."""
+    return {
+        "ic_gols": estatistica.ic_gols_por_ano(agregados),
+        "welch_top3": estatistica.welch_top_gpm(agregados, 3),
+        "z_jogos_com_gol": estatistica.z_jogos_com_gol(agregados),
+        "ic_jogadores": estatistica.ic_gpm_jogadores(agregados),
+    }
+
+
+def teste_top3(agregados, ano_a, ano_b):
+    """Welch entre os Top 3 (média de gols por minuto por partida) de dois anos."""
+    return estatistica.par(estatistica.welch_top_gpm(agregados, 3), ano_a, ano_b)
+
+
+def teste_jogos_com_gol(agregados, ano_a, ano_b):
+    """Teste z da proporção de jogos com pelo menos 1 gol entre dois anos."""
+    return estatistica.par(estatistica.z_jogos_com_gol(agregados), ano_a, ano_b)
+
+
+def top_eficiencia_por_ano(agregados, n=3):
+    """``{ano: agregados.top_eficiencia(ano, n)}`` de todas as temporadas, de uma ordenação só."""
+    top = estatistica.top_eficiencia_por_ano(agregados, n)
+    tabela = top.set_index("player_name")[["gols", "minutos", "gols_por_minuto"]].rename(
+        columns={"gols": "statistics_goals", "minutos": "statistics_minutes_played"}
+    )
+    # ``top`` vem ordenado por ano: cada temporada é uma faixa contígua de linhas
+    anos = top["ano"].to_numpy()
+    inicios = np.flatnonzero(np.r_[True, anos[1:] != anos[:-1]])
+    fins = np.r_[inicios[1:], len(anos)]
+    return {int(anos[inicio]): tabela.iloc[inicio:fim] for inicio, fim in zip(inicios, fins)}
+
+
+def _comparacoes(intervalos):
+    return intervalos[["media", "limite_inferior", "limite_superior", "amplitude"]].reset_index().sort_values("ano")
+
+
+def destaques_por_ano(agregados, n=3, confianca=0.95):
+    """Top ``n`` por eficiência de cada temporada e a tabela de ICs entre anos."""
+    intervalos = estatistica.ic_top_eficiencia(agregados, n, confianca)
+    tops = top_eficiencia_por_ano(agregados, n)
+    limites = zip(intervalos["limite_inferior"].to_numpy(), intervalos["limite_superior"].to_numpy())
+    destaques = [(ano, tops[int(ano)], limite) for ano, limite in zip(intervalos.index, limites)]
+    return destaques, _comparacoes(intervalos)
+
+
+def tendencia_eficiencia(df, ajustes=None):
+    """Regressão linear de gols por minuto por ano sobre todas as atuações com gols registrados.
+
+    ``ajustes`` (de ``tendencias_temporada(df)``) evita refazer o ajuste quando já foi calculado.
+    """
+    jogadores_validos = df[df["statistics_minutes_played"] > 0].dropna(subset=["statistics_goals"])
+    if ajustes is None:
+        ajustes = tendencias_temporada(df)
+    ajuste = ajustes.loc["gols_por_minuto"]
+    return {
+        "dados": jogadores_validos,
+        "tendencia": (ajuste["intercepto"] + ajuste["inclinacao"] * jogadores_validos["ano"]).to_numpy(),
+        "inclinacao": float(ajuste["inclinacao"]),
+        "intercepto": float(ajuste["intercepto"]),
+    }
+
+
+def tendencias_temporada(df):
+    """Tendência anual de todas as métricas de ``ituano.tendencias`` (um ajuste por métrica)."""
+    return tendencias.ajustar(tendencias.somas_temporada(tendencias.observacoes(df)))
+
+
+def projecao_gols(comparacoes_df, partidas=10, minutos=90):
+    """Gols esperados em ``partidas`` jogos completos a partir dos ICs do Top 3."""
+    fator = minutos * partidas
+    return comparacoes_df.assign(
+        gols_esperados_inferior=comparacoes_df["limite_inferior"] * fator,
+        gols_esperados_media=comparacoes_df["media"] * fator,
+        gols_esperados_superior=comparacoes_df["limite_superior"] * fator,
+    )
+
+
+def tabelas_temporadas(df, agregados):
+    """Tabelas de ``relatorio_temporada`` para todas as temporadas de uma vez.
+
+    As tabelas em lote (ICs, Top 3) são calculadas uma única vez e o
+    DataFrame de partidas é agrupado por ano uma única vez.
+    """
+    partidas = agregados.partidas.groupby(level="ano")["fez_gol"]
+    jogaram = df.loc[df["statistics_minutes_played"] > 0, ["ano", "player_name", *TABELAS_PASSES.values()]]
+    return {
+        "ic_gols": estatistica.ic_gols_por_ano(agregados),
+        "ic_top3": estatistica.ic_top_eficiencia(agregados, 3),
+        "top3": top_eficiencia_por_ano(agregados, 3),
+        "passes": {int(ano): _melhores_passes(linhas, 5) for ano, linhas in jogaram.groupby("ano", sort=False)},
+        "partidas": pd.DataFrame({"n": partidas.size(), "proporcao_com_gol": partidas.mean()}),
+    }
+
+
+def relatorio_temporada(df, agregados, ano, tabelas=None):
+    """Todos os resultados por temporada exibidos no dashboard.
+
+    ``tabelas`` vem de ``tabelas_temporadas``; sem ela, as tabelas são calculadas na hora.
+    """
+    if tabelas is None:
+        tabelas = tabelas_temporadas(df[df["ano"] == ano], agregados)
+    gols = resumo_gols(agregados, ano, intervalos=tabelas["ic_gols"])
+    ic_top = tabelas["ic_top3"].loc[ano]
+    partidas = tabelas["partidas"].loc[ano]
+    return {
+        "ano": int(ano),
+        "media_gols_por_jogador": gols["media"],
+        "ic_gols_por_jogador": gols["intervalo"],
+        "artilheiros": gols["melhores"],
+        "menos_gols": gols["piores"],
+        "passes": tabelas["passes"].get(int(ano)) or eficiencia_passes(df.iloc[:0]),
+        "top3_eficiencia": tabelas["top3"][int(ano)],
+        "ic_top3_gols_por_minuto": (ic_top["limite_inferior"], ic_top["limite_superior"]),
+        "partidas": int(partidas["n"]),
+        "proporcao_jogos_com_gol": float(partidas["proporcao_com_gol"]),
+    }
+
+
+def relatorio(df, agregados):
+    """Relatório completo: todas as temporadas, testes entre anos, tendência e projeção."""
+    tabelas = tabelas_temporadas(df, agregados)
+    comparacoes_df = _comparacoes(tabelas["ic_top3"])
+    ajustes = tendencias_temporada(df)
+    tendencia = tendencia_eficiencia(df, ajustes)
+    return {
+        "temporadas": {ano: relatorio_temporada(df, agregados, ano, tabelas) for ano in agregados.anos},
+        "testes_top3": estatistica.welch_top_gpm(agregados, 3),
+        "testes_jogos_com_gol": estatistica.z_jogos_com_gol(agregados),
+        "comparacoes": comparacoes_df,
+        "projecao_10_partidas": projecao_gols(comparacoes_df),
+        "tendencia": {
+            "inclinacao_por_ano": tendencia["inclinacao"],
+            "intercepto": tendencia["intercepto"],
+            "atuacoes": int(len(tendencia["dados"])),
+        },
+        "tendencias": ajustes[COLUNAS_TENDENCIAS],
+        "jogadores_temporada": agregados.jogadores,
+    }
+
+
+def para_json(valor):
+    """Converte os resultados (DataFrames, Series, tipos NumPy) para tipos JSON."""
+    if hasattr(valor, "to_dict") and hasattr(valor, "columns"):
+        # Índice sem nome (RangeIndex ou posições de linha herdadas) não é um dado do registro
+        posicional = all(nome is None for nome in valor.index.names)
+        return [para_json(linha) for linha in valor.reset_index(drop=posicional).to_dict(orient="records")]
+    if hasattr(valor, "to_dict"):
+        return {str(chave): para_json(v) for chave, v in valor.to_dict().items()}
+    if isinstance(valor, dict):
+        return {str(chave): para_json(v) for chave, v in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [para_json(v) for v in valor]
+    if isinstance(valor, np.generic):
+        valor = valor.item()
+    if isinstance(valor, float) and not np.isfinite(valor):
+        return None
+    return valor
@@ -0,0 +1,56 @@
+"""Arquivos estáticos do dashboard (logo).
+
+Com ``server.enableStaticServing`` ativo, o logo é servido pelo Streamlit em
+``app/static/`` e o HTML enviado a cada rerun só contém a URL; o navegador
+baixa e guarda a imagem uma vez. Sem static serving, os bytes da imagem são
+lidos (e, se necessário, reduzidos) uma única vez por processo e exibidos com
+``st.image``, que também envia só uma URL de mídia no rerun.
+"""
+
+import functools
+import io
+import os
+
+from ituano.dados import RAIZ_PROJETO
+
+PASTA_ESTATICA = os.path.join(RAIZ_PROJETO, "static")
+LOGO = os.path.join(PASTA_ESTATICA, "ItuanoFC.png")
+
+# Prefixo de URL do static file serving do Streamlit
+PREFIXO_ESTATICO = "app/static/"
+
+
+def url_estatica(caminho=LOGO):
+    relativo = os.path.relpath(os.path.abspath(caminho), PASTA_ESTATICA)
+    return PREFIXO_ESTATICO + relativo.replace(os.sep, "/")
+
+
+def html_imagem_centralizada(caminho=LOGO, largura=400):
+    """HTML do logo centralizado apontando para a URL estática."""
+    return f"""
+            <div style='text-align: center;'>
+                <img src='{url_estatica(caminho)}' width='{largura}'/>
+            </div>
+            """
+
+
+@functools.lru_cache(maxsize=8)
+def _bytes_imagem(caminho, mtime_ns, largura):
+    with open(caminho, "rb") as arquivo:
+        conteudo = arquivo.read()
+
+    # Só reduz quando a imagem é bem maior que o tamanho exibido (2x para telas retina)
+    from PIL import Image
+
+    imagem = Image.open(io.BytesIO(conteudo))
+    if imagem.width > 2 * largura:
+        altura = round(imagem.height * 2 * largura / imagem.width)
+        buffer = io.BytesIO()
+        imagem.resize((2 * largura, altura), Image.LANCZOS).save(buffer, format="PNG", optimize=True)
+        conteudo = buffer.getvalue()
+    return conteudo
+
+
+def bytes_imagem(caminho=LOGO, largura=400):
+    """Bytes da imagem prontos para exibição, lidos uma vez por processo (e por mtime)."""
+    return _bytes_imagem(os.path.abspath(caminho), os.stat(caminho).st_mtime_ns, largura)
@@ -0,0 +1,420 @@
+"""Cache colunar (Parquet) do CSV de partidas, particionado por ano.
+
+O CSV é convertido para ``<csv>.parquet/dados-<versao>.parquet`` com
+compressão zstd, temporadas em ordem e row groups de ``LINHAS_ROW_GROUP``
+linhas. O manifesto guarda a faixa de linhas de cada temporada; as leituras
+carregam só as colunas e os row groups que cobrem os anos pedidos e usam
+memory mapping. Se o sidecar
+estiver desatualizado em relação ao CSV ele é regenerado; se não for possível
+(pyarrow ausente, disco somente leitura), a leitura cai para o CSV.
+
+Cada temporada tem sua própria versão no manifesto: ``anexar`` acrescenta
+linhas ao CSV e reescreve só as temporadas afetadas, cada uma em
+``ano=AAAA/dados-<versao>.parquet``, de modo que os caches das demais
+temporadas continuam válidos. Cada arquivo e cada row group custam alguns
+milissegundos de metadados por coluna, então quando as temporadas avulsas
+passam de ``MAX_ARQUIVOS_AVULSOS`` tudo volta para um único arquivo.
+"""
+
+import bisect
+import contextlib
+import itertools
+import json
+import os
+import shutil
+import threading
+import time
+
+import pandas as pd
+
+from ituano import dados
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - pyarrow vem junto com o streamlit
+    pa = None
+    pq = None
+
+MANIFESTO = "_origem.json"
+COMPRESSAO = "zstd"
+
+# Row groups pequenos (um por temporada) deixam a leitura completa mais lenta que o CSV
+LINHAS_ROW_GROUP = 65_536
+# Temporadas reescritas por ``anexar`` em arquivos próprios antes da compactação
+MAX_ARQUIVOS_AVULSOS = 8
+
+# Trava entre processos para quem altera o CSV ou regenera o sidecar
+SUFIXO_TRAVA = ".lock"
+TEMPO_TRAVA = 30.0
+
+# Travas de arquivo que a thread corrente já detém (``trava`` é reentrante)
+_travas_thread = threading.local()
+
+
+def diretorio_sidecar(caminho_csv=dados.CSV_PADRAO):
+    return os.path.splitext(os.path.abspath(caminho_csv))[0] + ".parquet"
+
+
+def _arquivo_base(versao_base):
+    return f"dados-{versao_base[:12]}.parquet"
+
+
+def _arquivo_temporada(ano, versao_ano):
+    return os.path.join(f"ano={ano}", f"dados-{versao_ano[:12]}.parquet")
+
+
+def _gravar_temporadas(destino, arquivo, df):
+    """Grava ``df`` num único arquivo, em ordem de temporada.
+
+    Retorna ``{ano: [arquivo, linha_inicial, linhas]}`` para o manifesto.
+    """
+    if df.empty:
+        return {}
+    df = df.sort_values("ano", kind="stable")
+    caminho = os.path.join(destino, arquivo)
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    temporario = f"{caminho}.tmp-{os.getpid()}-{threading.get_ident()}"
+    tabela = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_table(tabela, temporario, row_group_size=LINHAS_ROW_GROUP, compression=COMPRESSAO)
+    os.replace(temporario, caminho)
+
+    locais = {}
+    inicio = 0
+    for ano, linhas in df["ano"].value_counts(sort=False).sort_index().items():
+        locais[str(int(ano))] = [arquivo, inicio, int(linhas)]
+        inicio += int(linhas)
+    return locais
+
+
+def _ler_faixas(caminho, faixas, colunas=None):
+    """Tabelas com as linhas ``[inicio, inicio + linhas)`` de cada faixa, na ordem dada.
+
+    Lê de uma vez só os row groups que cobrem as faixas.
+    """
+    arquivo = pq.ParquetFile(caminho, memory_map=True)
+    metadados = arquivo.metadata
+    limites = list(itertools.accumulate(
+        (metadados.row_group(grupo).num_rows for grupo in range(metadados.num_row_groups)), initial=0
+    ))
+    cobertura = [
+        (bisect.bisect_right(limites, inicio) - 1, bisect.bisect_left(limites, inicio + linhas) - 1)
+        for inicio, linhas in faixas
+    ]
+    grupos = sorted({grupo for primeiro, ultimo in cobertura for grupo in range(primeiro, ultimo + 1)})
+    tabela = arquivo.read_row_groups(grupos, columns=colunas)
+    # Posição de cada row group lido dentro de ``tabela``
+    posicoes = dict(zip(grupos, itertools.accumulate((limites[g + 1] - limites[g] for g in grupos), initial=0)))
+    return [
+        tabela.slice(posicoes[primeiro] + inicio - limites[primeiro], linhas)
+        for (inicio, linhas), (primeiro, _) in zip(faixas, cobertura)
+    ]
+
+
+def _travar(arquivo):
+    """Tenta obter a trava do arquivo sem bloquear."""
+    try:
+        if fcntl is not None:
+            fcntl.flock(arquivo.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            arquivo.seek(0)
+            msvcrt.locking(arquivo.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+def _destravar(arquivo):
+    if fcntl is not None:
+        fcntl.flock(arquivo.fileno(), fcntl.LOCK_UN)
+    else:
+        arquivo.seek(0)
+        msvcrt.locking(arquivo.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextlib.contextmanager
+def trava(caminho_csv=dados.CSV_PADRAO, tempo_max=TEMPO_TRAVA):
+    """Exclusão mútua entre processos (dashboard e ingestão) sobre o CSV e o sidecar.
+
+    A trava é do sistema operacional (``flock``) sobre ``<csv>.lock``, que
+    nunca é apagado: ela é liberada quando o processo que a detém termina,
+    então não há trava abandonada a adivinhar pela idade. Reentrante na
+    mesma thread. Levanta ``TimeoutError`` (um ``OSError``) se a trava não
+    for obtida em ``tempo_max`` segundos; com ``tempo_max=0`` tenta uma vez só.
+    """
+    caminho = os.path.abspath(caminho_csv) + SUFIXO_TRAVA
+    detidas = _travas_thread.__dict__.setdefault("caminhos", set())
+    if caminho in detidas:
+        yield
+        return
+    limite = time.monotonic() + tempo_max
+    with open(caminho, "a+b") as arquivo:
+        while not _travar(arquivo):
+            if time.monotonic() >= limite:
+                raise TimeoutError(f"trava ocupada: {caminho}")
+            time.sleep(0.05)
+        detidas.add(caminho)
+        try:
+            yield
+        finally:
+            detidas.discard(caminho)
+            _destravar(arquivo)
+
+
+def _ler_manifesto(destino):
+    try:
+        with open(os.path.join(destino, MANIFESTO), encoding="utf-8") as arquivo:
+            return json.load(arquivo)
+    except (OSError, ValueError):
+        return None
+
+
+def _gravar_manifesto(destino, manifesto):
+    temporario = os.path.join(destino, f"{MANIFESTO}.tmp-{os.getpid()}")
+    with open(temporario, "w", encoding="utf-8") as arquivo:
+        json.dump(manifesto, arquivo)
+    os.replace(temporario, os.path.join(destino, MANIFESTO))
+
+
+def converter(caminho_csv=dados.CSV_PADRAO, destino=None):
+    """Gera o sidecar Parquet particionado por ano a partir do CSV."""
+    if pq is None:
+        raise RuntimeError("pyarrow não está instalado")
+    destino = destino or diretorio_sidecar(caminho_csv)
+    assinatura = dados.assinatura_arquivo(caminho_csv)
+    hash_csv = dados.hash_arquivo(caminho_csv)
+    df = dados.ler_csv(caminho_csv)
+
+    temporario = f"{destino}.tmp-{os.getpid()}-{threading.get_ident()}"
+    shutil.rmtree(temporario, ignore_errors=True)
+    os.makedirs(temporario)
+    arquivos = _gravar_temporadas(temporario, _arquivo_base(hash_csv), df)
+
+    anos = sorted(int(ano) for ano in arquivos)
+    manifesto = {
+        "csv_mtime_ns": assinatura[0],
+        "csv_tamanho": assinatura[1],
+        "csv_hash": hash_csv,
+        "anos": anos,
+        "versoes": {str(ano): hash_csv for ano in anos},
+        "arquivos": arquivos,
+        "colunas": list(df.columns),
+    }
+    _gravar_manifesto(temporario, manifesto)
+
+    shutil.rmtree(destino, ignore_errors=True)
+    os.replace(temporario, destino)
+    return manifesto
+
+
+def manifesto_valido(caminho_csv=dados.CSV_PADRAO, destino=None):
+    """Retorna o manifesto se o sidecar corresponde ao CSV atual, senão None."""
+    destino = destino or diretorio_sidecar(caminho_csv)
+    manifesto = _ler_manifesto(destino)
+    if manifesto is None or "arquivos" not in manifesto:  # ausente ou de formato antigo
+        return None
+    assinatura = dados.assinatura_arquivo(caminho_csv)
+    if (manifesto["csv_mtime_ns"], manifesto["csv_tamanho"]) == assinatura:
+        return manifesto
+    if manifesto["csv_hash"] == dados.hash_arquivo(caminho_csv):
+        # mtime mudou sem mudar o conteúdo: grava a assinatura nova para não refazer o hash
+        _renovar_assinatura(caminho_csv, destino, manifesto["csv_hash"], assinatura)
+        return manifesto
+    return None
+
+
+def _renovar_assinatura(caminho_csv, destino, hash_csv, assinatura):
+    try:
+        # Sem esperar: com a trava ocupada, a próxima validação tenta de novo
+        with trava(caminho_csv, tempo_max=0):
+            manifesto = _ler_manifesto(destino)
+            # Quem altera o CSV detém a trava: se a assinatura ainda é a mesma, o hash vale para ela
+            if manifesto is not None and manifesto.get("csv_hash") == hash_csv \
+                    and dados.assinatura_arquivo(caminho_csv) == assinatura:
+                manifesto.update(csv_mtime_ns=assinatura[0], csv_tamanho=assinatura[1])
+                _gravar_manifesto(destino, manifesto)
+    except OSError:
+        pass  # trava ocupada ou pasta somente leitura
+
+
+def garantir_sidecar(caminho_csv=dados.CSV_PADRAO):
+    """Regenera o sidecar se necessário. Retorna o manifesto ou None."""
+    manifesto = manifesto_valido(caminho_csv)
+    if manifesto is not None or pq is None:
+        return manifesto
+    try:
+        # A trava também separa as threads deste processo (cada uma abre o arquivo de trava)
+        with trava(caminho_csv):
+            # Outra thread ou processo pode ter acabado de regenerar ou anexar
+            return manifesto_valido(caminho_csv) or converter(caminho_csv)
+    except OSError:
+        return None
+
+
+def anexar(linhas_csv, novas, caminho_csv=dados.CSV_PADRAO):
+    """Anexa linhas ao CSV e reescreve só as temporadas afetadas.
+
+    ``linhas_csv`` é o texto das linhas (sem cabeçalho, na ordem das colunas
+    do CSV) e ``novas`` o DataFrame tipado correspondente. Retorna o novo
+    manifesto, ou None se o sidecar não pôde ser atualizado (ele é então
+    regenerado na próxima leitura).
+    """
+    with trava(caminho_csv):
+        manifesto = manifesto_valido(caminho_csv)
+        with open(caminho_csv, "rb") as arquivo:
+            arquivo.seek(-1, os.SEEK_END)
+            ultimo = arquivo.read(1)
+        with open(caminho_csv, "a", encoding="utf-8", newline="") as arquivo:
+            if ultimo != b"\n":
+                arquivo.write("\n")
+            arquivo.write(linhas_csv)
+        if manifesto is None or pq is None:
+            return None
+        return _atualizar_particoes(caminho_csv, manifesto, novas)
+
+
+def _atualizar_particoes(caminho_csv, manifesto, novas):
+    destino = diretorio_sidecar(caminho_csv)
+    hash_csv = dados.hash_arquivo(caminho_csv)
+    gravados = {local[0] for local in manifesto["arquivos"].values()}
+    for ano, linhas in novas.groupby("ano", sort=True):
+        ano = str(int(ano))
+        if ano in manifesto["arquivos"]:
+            linhas = pd.concat([_ler_temporada(destino, manifesto, ano), linhas], ignore_index=True)
+        linhas = dados.aplicar_schema(linhas[manifesto["colunas"]])
+        arquivo = _arquivo_temporada(ano, hash_csv)
+        manifesto["arquivos"][ano] = _gravar_temporadas(destino, arquivo, linhas)[ano]
+        manifesto["versoes"][ano] = hash_csv
+        gravados.add(arquivo)
+
+    avulsos = {local[0] for local in manifesto["arquivos"].values() if os.path.dirname(local[0])}
+    if len(avulsos) > MAX_ARQUIVOS_AVULSOS:
+        # Compacta: o conteúdo não muda, então as versões das temporadas ficam
+        todas = [_ler_temporada(destino, manifesto, ano) for ano in sorted(manifesto["arquivos"], key=int)]
+        todas = dados.aplicar_schema(pd.concat(todas, ignore_index=True))
+        manifesto["arquivos"] = _gravar_temporadas(destino, _arquivo_base(hash_csv), todas)
+    substituidos = gravados - {local[0] for local in manifesto["arquivos"].values()}
+
+    assinatura = dados.assinatura_arquivo(caminho_csv)
+    manifesto.update(
+        csv_mtime_ns=assinatura[0],
+        csv_tamanho=assinatura[1],
+        csv_hash=hash_csv,
+        anos=sorted(int(ano) for ano in manifesto["versoes"]),
+    )
+    _gravar_manifesto(destino, manifesto)
+    # Leituras em andamento (memory map) mantêm os arquivos antigos abertos
+    for arquivo in substituidos:
+        os.remove(os.path.join(destino, arquivo))
+        if os.path.dirname(arquivo):
+            with contextlib.suppress(OSError):  # ainda tem a versão de outra leitura
+                os.rmdir(os.path.join(destino, os.path.dirname(arquivo)))
+    return manifesto
+
+
+def _ler_temporada(destino, manifesto, ano):
+    arquivo, inicio, linhas = manifesto["arquivos"][ano]
+    tabela = _ler_faixas(os.path.join(destino, arquivo), [(inicio, linhas)])[0]
+    return dados.aplicar_schema(tabela.to_pandas())
+
+
+def _ler_parquet(destino, particoes, colunas):
+    """Lê as ``particoes`` (``(arquivo, linha_inicial, linhas)``), na ordem dada.
+
+    Temporadas seguidas no mesmo arquivo saem numa única leitura. Sem cache
+    próprio: quem chama (``metricas.obter``, ``agregados.obter``) guarda o
+    resultado já derivado, e uma segunda cópia crua só ocuparia memória.
+    """
+    colunas = list(colunas) if colunas else None
+    tabelas = []
+    for arquivo, grupo in itertools.groupby(particoes, key=lambda particao: particao[0]):
+        faixas = [particao[1:] for particao in grupo]
+        tabelas += _ler_faixas(os.path.join(destino, arquivo), faixas, colunas)
+    tabela = pa.concat_tables(tabelas).unify_dictionaries()
+    return tabela.to_pandas()
+
+
+def ler(colunas=None, anos=None, caminho_csv=dados.CSV_PADRAO):
+    """Lê apenas as colunas e os anos pedidos, preferindo o sidecar Parquet.
+
+    No fallback para o CSV o resultado é compartilhado com o cache de
+    ``dados`` e não deve ser modificado in-place.
+    """
+    colunas = tuple(colunas) if colunas else None
+    manifesto = garantir_sidecar(caminho_csv)
+    if manifesto is not None:
+        particoes = [manifesto["arquivos"][str(ano)] for ano in manifesto["anos"] if anos is None or ano in anos]
+        if not particoes:
+            # Anos ainda sem linhas (ex.: o primeiro lote de uma temporada nova): nada a ler do CSV
+            return dados.aplicar_schema(
+                pd.DataFrame({coluna: pd.Series(dtype="object") for coluna in colunas or manifesto["colunas"]})
+            )
+        try:
+            return _ler_parquet(diretorio_sidecar(caminho_csv), particoes, colunas)
+        except (OSError, pa.ArrowException):
+            pass
+
+    # Fallback (sidecar ausente ou desatualizado): CSV em cache do processo
+    df = dados.carregar_dados(caminho_csv)
+    if anos is not None:
+        df = df[df["ano"].isin(list(anos))]
+    if colunas is not None:
+        df = df[list(colunas)]
+    return df
+
+
+def anos_disponiveis(caminho_csv=dados.CSV_PADRAO):
+    manifesto = garantir_sidecar(caminho_csv)
+    if manifesto is not None:
+        return manifesto["anos"]
+    return sorted(int(ano) for ano in dados.carregar_dados(caminho_csv)["ano"].unique())
+
+
+def versao(caminho_csv=dados.CSV_PADRAO, anos=None):
+    """Identificador da versão atual dos dados (hash do CSV).
+
+    Com ``anos``, identifica só essas temporadas: não muda quando linhas de
+    outras temporadas são anexadas.
+    """
+    manifesto = garantir_sidecar(caminho_csv)
+    if manifesto is None:
+        return dados.impressao_digital(caminho_csv)
+    if anos is None:
+        return manifesto["csv_hash"]
+    return tuple(manifesto["versoes"].get(str(ano)) for ano in anos)
+
+
+def versoes_anos(caminho_csv=dados.CSV_PADRAO):
+    """Versão de cada temporada (``{ano: versao}``), ou None sem o sidecar."""
+    manifesto = garantir_sidecar(caminho_csv)
+    if manifesto is None:
+        return None
+    return {int(ano): versao_ano for ano, versao_ano in manifesto["versoes"].items()}
+
+
+def fonte_atual(caminho_csv=dados.CSV_PADRAO):
+    return "Parquet" if manifesto_valido(caminho_csv) is not None else "CSV"
+
+
+def relatorio_leitura(colunas=None, caminho_csv=dados.CSV_PADRAO):
+    """Compara leitura do CSV (sem e com schema) com a leitura colunar."""
+    relatorio = dados.relatorio_carregamento(caminho_csv)
+    if garantir_sidecar(caminho_csv) is None:
+        return relatorio
+
+    inicio = time.perf_counter()
+    df = ler(colunas, caminho_csv=caminho_csv)
+    tempo = time.perf_counter() - inicio
+    relatorio.loc["parquet (colunas usadas)"] = [tempo, dados.memoria_mb(df)]
+    return relatorio
+
+
+if __name__ == "__main__":
+    manifesto = converter()
+    print(f"Sidecar gerado em {diretorio_sidecar()} (anos: {manifesto['anos']})")
@@ -0,0 +1,163 @@
+"""Carregamento dos dados de partidas do Ituano.
+
+O CSV é lido uma única vez por processo com um schema de tipos explícito e
+mantido em cache. O cache é invalidado quando o arquivo muda (mtime/tamanho e,
+se necessário, hash do conteúdo).
+"""
+
+import hashlib
+import os
+import threading
+import time
+
+import pandas as pd
+
+RAIZ_PROJETO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CSV_PADRAO = os.path.join(RAIZ_PROJETO, "dados-completos-Ituano.csv")
+
+# Valores tratados como ausentes já na leitura (o CSV usa "NA")
+VALORES_NA = ["NA", ""]
+
+COLUNAS_CATEGORICAS = [
+    "time_alvo",
+    "home_or_away",
+    "home_team",
+    "away_team",
+    "stadium",
+    "tournament",
+    "home_manager",
+    "away_manager",
+    "player_name",
+    "player_position",
+]
+
+COLUNAS_INTEIRAS = {
+    "ano": "int16",
+    "jogo": "int16",
+    "home_score": "int8",
+    "away_score": "int8",
+    "player_number": "int16",
+}
+
+COLUNAS_BOOLEANAS = {
+    "player_sub": "bool",
+    "player_captain": "boolean",
+}
+
+# Todas as colunas statistics_* têm ausentes, então ficam em float32
+TIPO_ESTATISTICAS = "float32"
+
+_lock = threading.Lock()
+_cache = {}
+
+
+def schema(colunas):
+    """Retorna o dicionário de dtypes para as colunas informadas."""
+    tipos = {}
+    for coluna in colunas:
+        if coluna in COLUNAS_INTEIRAS:
+            tipos[coluna] = COLUNAS_INTEIRAS[coluna]
+        elif coluna in COLUNAS_BOOLEANAS:
+            tipos[coluna] = COLUNAS_BOOLEANAS[coluna]
+        elif coluna in COLUNAS_CATEGORICAS:
+            tipos[coluna] = "category"
+        elif coluna.startswith("statistics_"):
+            tipos[coluna] = TIPO_ESTATISTICAS
+    return tipos
+
+
+def ler_csv(caminho, colunas=None):
+    """Lê o CSV aplicando o schema tipado (sem cache)."""
+    cabecalho = pd.read_csv(caminho, nrows=0).columns
+    return pd.read_csv(
+        caminho,
+        usecols=colunas,
+        dtype=schema(cabecalho),
+        na_values=VALORES_NA,
+        keep_default_na=False,
+    )
+
+
+def aplicar_schema(df):
+    """Converte as colunas de ``df`` para os tipos do schema (ex.: após ler Parquet)."""
+    tipos = {coluna: tipo for coluna, tipo in schema(df.columns).items() if str(df[coluna].dtype) != tipo}
+    return df.astype(tipos) if tipos else df
+
+
+def assinatura_arquivo(caminho):
+    info = os.stat(caminho)
+    return info.st_mtime_ns, info.st_size
+
+
+def hash_arquivo(caminho, tamanho_bloco=1 << 20):
+    h = hashlib.sha1()
+    with open(caminho, "rb") as arquivo:
+        for bloco in iter(lambda: arquivo.read(tamanho_bloco), b""):
+            h.update(bloco)
+    return h.hexdigest()
+
+
+def memoria_mb(df):
+    return df.memory_usage(deep=True).sum() / 1024 ** 2
+
+
+class _EntradaCache:
+    def __init__(self, assinatura, hash_conteudo, df):
+        self.assinatura = assinatura
+        self.hash = hash_conteudo
+        self.df = df
+
+
+def _entrada(caminho):
+    caminho = os.path.abspath(caminho)
+    assinatura = assinatura_arquivo(caminho)
+    with _lock:
+        entrada = _cache.get(caminho)
+        if entrada is not None and entrada.assinatura == assinatura:
+            return entrada
+
+        # mtime mudou: só relê se o conteúdo realmente mudou
+        hash_conteudo = hash_arquivo(caminho)
+        if entrada is not None and entrada.hash == hash_conteudo:
+            entrada.assinatura = assinatura
+            return entrada
+
+        entrada = _EntradaCache(assinatura, hash_conteudo, ler_csv(caminho))
+        _cache[caminho] = entrada
+        return entrada
+
+
+def carregar_dados(caminho=CSV_PADRAO):
+    """Retorna o DataFrame tipado do CSV, compartilhado entre sessões.
+
+    O DataFrame retornado não deve ser modificado in-place.
+    """
+    return _entrada(caminho).df
+
+
+def impressao_digital(caminho=CSV_PADRAO):
+    """Hash do conteúdo atualmente carregado para o arquivo."""
+    return _entrada(caminho).hash
+
+
+def relatorio_carregamento(caminho=CSV_PADRAO):
+    """Compara tempo de leitura e memória com e sem o schema tipado."""
+    inicio = time.perf_counter()
+    sem_schema = pd.read_csv(caminho)
+    tempo_sem_schema = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    com_schema = ler_csv(caminho)
+    tempo_com_schema = time.perf_counter() - inicio
+
+    return pd.DataFrame(
+        {
+            "tempo_s": [tempo_sem_schema, tempo_com_schema],
+            "memoria_mb": [memoria_mb(sem_schema), memoria_mb(com_schema)],
+        },
+        index=["sem schema", "com schema"],
+    )
+
+
+if __name__ == "__main__":
+    print(relatorio_carregamento().to_string(float_format="{:.3f}".format))
@@ -0,0 +1,508 @@
+"""Dataset de várias equipes e temporadas, com filtros aplicados na leitura.
+
+Um diretório com CSVs no schema de ``dados-completos-Ituano.csv`` (por
+exemplo um arquivo por clube e temporada, em qualquer estrutura de pastas) é
+convertido para Parquet particionado em ``time_alvo=<clube>/ano=<ano>/``
+dentro de ``<diretorio>/_colunar``. A conversão é incremental: só CSVs novos
+ou alterados são reprocessados. Cada versão de um CSV grava arquivos com nome
+próprio e os substituídos só são apagados depois do manifesto novo, então uma
+leitura durante a conversão vê a versão anterior inteira ou a nova inteira.
+
+O manifesto guarda um índice (arquivo, time_alvo, ano, tournament, linhas)
+usado para listar clubes/temporadas/torneios sem ler os dados. As leituras
+usam ``pyarrow.dataset`` sobre os arquivos que o manifesto lista para o
+clube e as temporadas da seleção, com filtro por torneio, e ``lotes()``
+entrega os dados em blocos de tamanho limitado, de
+modo que a memória depende da seleção e do tamanho do lote, não do tamanho
+total do dataset. Sem pyarrow, as leituras percorrem apenas os CSVs que
+contêm a seleção, em blocos.
+"""
+
+import functools
+import glob
+import hashlib
+import itertools
+import json
+import os
+import threading
+import time
+from urllib.parse import quote
+
+import pandas as pd
+
+from ituano import agregados as _agregados
+from ituano import colunar, dados, metricas
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - pyarrow vem junto com o streamlit
+    pa = None
+    ds = None
+    pq = None
+
+PASTA_COLUNAR = "_colunar"
+MANIFESTO = "_manifesto.json"
+COLUNAS_INDICE = ["time_alvo", "ano", "tournament"]
+PARTICOES = ["time_alvo", "ano"]
+COMPRESSAO = "zstd"
+TAMANHO_LOTE = 250_000
+
+# Intervalo mínimo (s) entre verificações de arquivos alterados no diretório
+INTERVALO_VERIFICACAO = 2.0
+
+_TIPOS_ARROW = {
+    "category": "string",
+    "float32": "float32",
+    "int16": "int16",
+    "int8": "int8",
+    "bool": "bool_",
+    "boolean": "bool_",
+}
+
+
+class Selecao:
+    """Recorte do dataset: um clube e, opcionalmente, temporadas e torneios.
+
+    ``anos=None`` são todas as temporadas; uma sequência vazia, nenhuma
+    (ex.: ``restringir_anos`` sem interseção).
+    """
+
+    def __init__(self, time_alvo, anos=None, torneios=None):
+        self.time_alvo = time_alvo
+        self.anos = tuple(sorted(int(ano) for ano in anos)) if anos is not None else None
+        self.torneios = tuple(sorted(torneios)) if torneios else None
+
+    def chave(self):
+        return (self.time_alvo, self.anos, self.torneios)
+
+    def __eq__(self, outra):
+        return isinstance(outra, Selecao) and self.chave() == outra.chave()
+
+    def __hash__(self):
+        return hash(self.chave())
+
+    def __repr__(self):
+        return f"Selecao(time_alvo={self.time_alvo!r}, anos={self.anos}, torneios={self.torneios})"
+
+    def vazia(self):
+        return self.anos == ()
+
+    def restringir_anos(self, anos):
+        """Interseção das temporadas da seleção com ``anos`` (pode ser vazia)."""
+        if anos is None:
+            return self
+        anos = set(int(ano) for ano in anos)
+        if self.anos is not None:
+            anos &= set(self.anos)
+        return Selecao(self.time_alvo, anos, self.torneios)
+
+
+def _esquema_arrow(colunas):
+    tipos = dados.schema(colunas)
+    return pa.schema([(coluna, getattr(pa, _TIPOS_ARROW[tipos[coluna]])()) for coluna in colunas])
+
+
+def _pasta_particao(time_alvo, ano):
+    """Pasta da partição, relativa a ``raiz_colunar``."""
+    return os.path.join(f"time_alvo={quote(str(time_alvo), safe='')}", f"ano={ano}")
+
+
+def _indexar(df):
+    indice = df.groupby(COLUNAS_INDICE, observed=True).size().reset_index(name="linhas")
+    return [[str(t), int(a), str(c), int(n)] for t, a, c, n in indice.itertuples(index=False)]
+
+
+class DatasetPartidas:
+    def __init__(self, diretorio):
+        self.diretorio = os.path.abspath(diretorio)
+        self.raiz_colunar = os.path.join(self.diretorio, PASTA_COLUNAR)
+        self._lock = threading.Lock()
+        self._manifesto = None
+        self._verificado_em = 0.0
+
+    # Descoberta e conversão
+
+    def arquivos(self):
+        """CSVs do diretório (recursivo), como caminhos relativos."""
+        caminhos = glob.glob(os.path.join(self.diretorio, "**", "*.csv"), recursive=True)
+        return sorted(os.path.relpath(caminho, self.diretorio) for caminho in caminhos)
+
+    def _caminho_manifesto(self):
+        return os.path.join(self.raiz_colunar, MANIFESTO)
+
+    def _carregar_manifesto(self):
+        try:
+            with open(self._caminho_manifesto(), encoding="utf-8") as arquivo:
+                return json.load(arquivo)
+        except (OSError, ValueError):
+            return {"arquivos": {}}
+
+    def _gravar_manifesto(self, manifesto):
+        temporario = self._caminho_manifesto() + f".tmp-{os.getpid()}"
+        with open(temporario, "w", encoding="utf-8") as arquivo:
+            json.dump(manifesto, arquivo)
+        os.replace(temporario, self._caminho_manifesto())
+
+    def _converter_arquivo(self, relativo, assinatura):
+        """Converte um CSV para as partições Parquet. Retorna (saidas, indice)."""
+        df = dados.ler_csv(os.path.join(self.diretorio, relativo))
+        # Um nome por versão do CSV: quem leu o manifesto anterior continua lendo os arquivos dele
+        nome = hashlib.sha1(json.dumps([relativo, assinatura]).encode()).hexdigest()[:12]
+        colunas = [coluna for coluna in df.columns if coluna not in PARTICOES]
+        esquema = _esquema_arrow(colunas)
+
+        saidas = []
+        for (time_alvo, ano), parte in df.groupby(PARTICOES, observed=True):
+            saida = os.path.join(_pasta_particao(time_alvo, ano), f"{nome}.parquet")
+            caminho = os.path.join(self.raiz_colunar, saida)
+            os.makedirs(os.path.dirname(caminho), exist_ok=True)
+            parte = parte[colunas].astype({c: object for c in colunas if isinstance(parte[c].dtype, pd.CategoricalDtype)})
+            tabela = pa.Table.from_pandas(parte, schema=esquema, preserve_index=False)
+            temporario = f"{caminho}.tmp-{os.getpid()}"
+            pq.write_table(tabela, temporario, compression=COMPRESSAO)
+            os.replace(temporario, caminho)
+            saidas.append(saida)
+        return saidas, _indexar(df)
+
+    def _indexar_csv(self, relativo):
+        df = dados.ler_csv(os.path.join(self.diretorio, relativo), colunas=COLUNAS_INDICE)
+        return _indexar(df)
+
+    def trava(self, tempo_max=colunar.TEMPO_TRAVA):
+        """Trava entre processos do diretório (conversão e ``ituano.ingestao``)."""
+        return colunar.trava(self.raiz_colunar, tempo_max)
+
+    def _pendente(self, manifesto):
+        """Há CSVs novos, alterados ou removidos em relação ao manifesto?"""
+        atuais = self.arquivos()
+        if set(atuais) != set(manifesto["arquivos"]):
+            return True
+        return any(
+            manifesto["arquivos"][relativo]["assinatura"]
+            != list(dados.assinatura_arquivo(os.path.join(self.diretorio, relativo)))
+            for relativo in atuais
+        )
+
+    def atualizar(self, tempo_max=colunar.TEMPO_TRAVA):
+        """Sincroniza o Parquet e o índice com os CSVs atuais (só o que mudou).
+
+        A conversão acontece sob ``trava(tempo_max)``, já que outro processo
+        pode estar convertendo ou ingerindo no mesmo diretório (``TimeoutError``
+        se ela não vier a tempo).
+        """
+        manifesto = self._manifesto or self._carregar_manifesto()
+        if self._pendente(manifesto):
+            if pq is None:
+                # Só o índice, em memória: nada é gravado
+                with self._lock:
+                    manifesto = self._sincronizar({"arquivos": dict(manifesto["arquivos"])})
+            else:
+                with self.trava(tempo_max), self._lock:
+                    # Quem detinha a trava pode ter acabado de converter os mesmos arquivos
+                    manifesto = self._sincronizar(self._carregar_manifesto())
+        manifesto.setdefault("versao", "vazio")
+        self._manifesto = manifesto
+        self._verificado_em = time.monotonic()
+        return manifesto
+
+    def _sincronizar(self, manifesto):
+        atuais = self.arquivos()
+        mudou = False
+        # Apagados só depois do manifesto novo: até lá, são eles que os leitores enxergam
+        substituidas = []
+
+        for relativo in set(manifesto["arquivos"]) - set(atuais):
+            substituidas += manifesto["arquivos"].pop(relativo)["saidas"]
+            mudou = True
+
+        for relativo in atuais:
+            assinatura = list(dados.assinatura_arquivo(os.path.join(self.diretorio, relativo)))
+            anterior = manifesto["arquivos"].get(relativo)
+            if anterior is not None and anterior["assinatura"] == assinatura:
+                continue
+            if anterior is not None:
+                substituidas += anterior["saidas"]
+            if pq is not None:
+                os.makedirs(self.raiz_colunar, exist_ok=True)
+                saidas, indice = self._converter_arquivo(relativo, assinatura)
+            else:
+                saidas, indice = [], self._indexar_csv(relativo)
+            manifesto["arquivos"][relativo] = {"assinatura": assinatura, "saidas": saidas, "indice": indice}
+            mudou = True
+
+        if mudou:
+            manifesto["versao"] = hashlib.sha1(
+                json.dumps(sorted((k, v["assinatura"]) for k, v in manifesto["arquivos"].items())).encode()
+            ).hexdigest()
+            if pq is not None:
+                self._gravar_manifesto(manifesto)
+                vigentes = {saida for entrada in manifesto["arquivos"].values() for saida in entrada["saidas"]}
+                self._remover_saidas(set(substituidas) - vigentes)
+        return manifesto
+
+    def _remover_saidas(self, saidas):
+        for saida in saidas:
+            caminho = os.path.join(self.raiz_colunar, saida)
+            try:
+                os.remove(caminho)
+            except FileNotFoundError:
+                pass
+            # Pastas de partição que ficaram vazias (ano e depois clube)
+            for pasta in (os.path.dirname(caminho), os.path.dirname(os.path.dirname(caminho))):
+                try:
+                    os.rmdir(pasta)
+                except OSError:
+                    break
+
+    def manifesto(self):
+        """Manifesto atual, reverificando os arquivos no máximo a cada ``INTERVALO_VERIFICACAO`` s.
+
+        Caminho de leitura: não espera pela trava. Se outro processo está
+        convertendo ou ingerindo, fica com o último manifesto gravado e tenta
+        converter de novo na próxima verificação.
+        """
+        if self._manifesto is None or time.monotonic() - self._verificado_em > INTERVALO_VERIFICACAO:
+            try:
+                return self.atualizar(tempo_max=0)
+            except TimeoutError:
+                manifesto = self._carregar_manifesto()
+                manifesto.setdefault("versao", "vazio")
+                self._manifesto = manifesto
+                self._verificado_em = time.monotonic()
+        return self._manifesto
+
+    def versao(self):
+        return self.manifesto()["versao"]
+
+    def versoes_anos(self, time_alvo):
+        """Versão de cada temporada do clube (``{ano: versao}``), numa passada pelo manifesto.
+
+        Muda quando algum CSV com linhas da temporada muda, entra ou sai.
+        """
+        manifesto = self.manifesto()
+        arquivos = {}
+        for relativo, entrada in manifesto["arquivos"].items():
+            for clube, ano, _, _ in entrada["indice"]:
+                if clube == time_alvo:
+                    arquivos.setdefault(ano, set()).add(relativo)
+        return {
+            ano: hashlib.sha1(json.dumps(
+                [[relativo, manifesto["arquivos"][relativo]["assinatura"]] for relativo in sorted(relativos)]
+            ).encode()).hexdigest()
+            for ano, relativos in sorted(arquivos.items())
+        }
+
+    # Índice
+
+    def indice(self, manifesto=None):
+        """DataFrame (arquivo, time_alvo, ano, tournament, linhas) de todas as partições."""
+        manifesto = manifesto or self.manifesto()
+        linhas = [
+            [relativo] + entrada_indice
+            for relativo, entrada in manifesto["arquivos"].items()
+            for entrada_indice in entrada["indice"]
+        ]
+        return pd.DataFrame(linhas, columns=["arquivo"] + COLUNAS_INDICE + ["linhas"])
+
+    def clubes(self):
+        return sorted(self.indice()["time_alvo"].unique())
+
+    def anos(self, time_alvo):
+        indice = self.indice()
+        return sorted(int(ano) for ano in indice.loc[indice["time_alvo"] == time_alvo, "ano"].unique())
+
+    def torneios(self, time_alvo, anos=None):
+        indice = self.indice()
+        indice = indice[indice["time_alvo"] == time_alvo]
+        if anos:
+            indice = indice[indice["ano"].isin(anos)]
+        return sorted(indice["tournament"].unique())
+
+    def linhas(self, selecao):
+        """Número de linhas da seleção, pelo índice (sem ler os dados)."""
+        return int(self._filtrar_indice(selecao)["linhas"].sum())
+
+    def _filtrar_indice(self, selecao, manifesto=None):
+        indice = self.indice(manifesto)
+        mascara = indice["time_alvo"] == selecao.time_alvo
+        if selecao.anos is not None:
+            mascara &= indice["ano"].isin(selecao.anos)
+        if selecao.torneios:
+            mascara &= indice["tournament"].isin(selecao.torneios)
+        return indice[mascara]
+
+    # Leitura
+
+    def _filtro_arrow(self, selecao):
+        filtro = ds.field("time_alvo") == selecao.time_alvo
+        if selecao.anos is not None:
+            filtro &= ds.field("ano").isin(list(selecao.anos))
+        if selecao.torneios:
+            filtro &= ds.field("tournament").isin(list(selecao.torneios))
+        return filtro
+
+    def _saidas(self, manifesto, indice):
+        """Arquivos Parquet do manifesto com as partições (clube, ano) de ``indice``."""
+        pastas = {_pasta_particao(t, a) for t, a in indice[PARTICOES].drop_duplicates().itertuples(index=False)}
+        return [
+            saida
+            for relativo in indice["arquivo"].unique()
+            for saida in manifesto["arquivos"][relativo]["saidas"]
+            if os.path.dirname(saida) in pastas
+        ]
+
+    def _dataset_arrow(self, saidas):
+        particionamento = ds.partitioning(
+            pa.schema([("time_alvo", pa.string()), ("ano", pa.int16())]), flavor="hive"
+        )
+        # Só os arquivos do manifesto: os de uma conversão em andamento ainda não contam
+        return ds.dataset(
+            [os.path.join(self.raiz_colunar, saida) for saida in saidas],
+            format="parquet", partitioning=particionamento, partition_base_dir=self.raiz_colunar,
+        )
+
+    def _lotes_arrow(self, saidas, colunas, selecao, tamanho_lote):
+        """Lotes Arrow das ``saidas``, com o primeiro já lido (arquivo ausente levanta aqui)."""
+        lotes = self._dataset_arrow(saidas).to_batches(
+            columns=colunas, filter=self._filtro_arrow(selecao), batch_size=tamanho_lote
+        )
+        primeiro = next(lotes, None)
+        return itertools.chain([primeiro], lotes) if primeiro is not None else iter(())
+
+    def lotes(self, colunas, selecao, tamanho_lote=TAMANHO_LOTE):
+        """Itera DataFrames tipados da seleção, com no máximo ``tamanho_lote`` linhas cada."""
+        if selecao.time_alvo is None or selecao.vazia():
+            return
+        manifesto = self.manifesto()
+        indice = self._filtrar_indice(selecao, manifesto)
+        if indice.empty:
+            return
+        colunas = list(colunas) if colunas else None
+
+        saidas = self._saidas(manifesto, indice) if pq is not None else []
+        if saidas:
+            try:
+                lotes_arrow = self._lotes_arrow(saidas, colunas, selecao, tamanho_lote)
+            except FileNotFoundError:
+                # Manifesto em memória mais antigo que uma conversão de outro processo: relê uma vez
+                self._manifesto = None
+                manifesto = self.manifesto()
+                saidas = self._saidas(manifesto, self._filtrar_indice(selecao, manifesto))
+                lotes_arrow = self._lotes_arrow(saidas, colunas, selecao, tamanho_lote) if saidas else []
+            for lote in lotes_arrow:
+                if lote.num_rows:
+                    yield dados.aplicar_schema(lote.to_pandas())
+            return
+
+        # Sem pyarrow: só os CSVs que contêm a seleção, lidos em blocos
+        for relativo in indice["arquivo"].unique():
+            leitor = pd.read_csv(
+                os.path.join(self.diretorio, relativo),
+                dtype=dados.schema(pd.read_csv(os.path.join(self.diretorio, relativo), nrows=0).columns),
+                na_values=dados.VALORES_NA,
+                keep_default_na=False,
+                chunksize=tamanho_lote,
+            )
+            for bloco in leitor:
+                mascara = bloco["time_alvo"] == selecao.time_alvo
+                if selecao.anos is not None:
+                    mascara &= bloco["ano"].isin(selecao.anos)
+                if selecao.torneios:
+                    mascara &= bloco["tournament"].isin(selecao.torneios)
+                if mascara.any():
+                    yield bloco.loc[mascara, colunas] if colunas else bloco[mascara]
+
+    def ler(self, colunas, selecao):
+        """DataFrame da seleção inteira (use ``lotes()`` para recortes grandes)."""
+        partes = list(self.lotes(colunas, selecao))
+        if not partes:
+            return dados.aplicar_schema(pd.DataFrame({coluna: pd.Series(dtype="object") for coluna in colunas or []}))
+        return dados.aplicar_schema(pd.concat(partes, ignore_index=True))
+
+
+# Fontes de dados com a mesma interface para o CSV único e para o dataset
+
+
+class FonteCSV:
+    """O CSV único do repositório (sidecar Parquet por ano, ver ``ituano.colunar``)."""
+
+    def __init__(self, caminho_csv=dados.CSV_PADRAO):
+        self.caminho_csv = caminho_csv
+
+    def chave(self):
+        """Identifica a fonte (não a versão): estável entre ingestões."""
+        return ("csv", os.path.abspath(self.caminho_csv))
+
+    def versao(self, anos=None):
+        return colunar.versao(self.caminho_csv, anos)
+
+    def versoes_anos(self):
+        """``{ano: versao}`` de cada temporada, lidas do manifesto de uma vez."""
+        versoes = colunar.versoes_anos(self.caminho_csv)
+        if versoes is None:
+            # Sem sidecar: a versão do CSV inteiro vale para todas as temporadas
+            versao = self.versao()
+            return {ano: versao for ano in self.anos()}
+        return versoes
+
+    def dados(self, colunas, anos=None):
+        return metricas.obter(colunas, anos=anos, caminho_csv=self.caminho_csv)
+
+    def agregados(self):
+        return _agregados.obter(self.caminho_csv)
+
+    def anos(self):
+        return colunar.anos_disponiveis(self.caminho_csv)
+
+
+@functools.lru_cache(maxsize=16)
+def _dados_selecao(dataset, versao, colunas, selecao):
+    return metricas.derivar(dataset.ler(list(colunas), selecao))
+
+
+@functools.lru_cache(maxsize=8)
+def _agregados_selecao(dataset, versao, selecao):
+    # Construídos lote a lote: a memória depende do tamanho do lote, não da seleção
+    return _agregados.AgregadosTemporada.construir_em_lotes(
+        dataset.lotes(_agregados.COLUNAS_AGREGADOS, selecao)
+    )
+
+
+class FonteDataset:
+    """Recorte (clube, temporadas, torneios) de um ``DatasetPartidas``."""
+
+    def __init__(self, dataset, selecao):
+        self.dataset = dataset
+        self.selecao = selecao
+
+    def chave(self):
+        return ("dataset", self.dataset.diretorio, self.selecao.chave())
+
+    def versao(self, anos=None):
+        return (self.dataset.versao(), self.selecao.restringir_anos(anos).chave())
+
+    def versoes_anos(self):
+        """``{ano: versao}`` das temporadas da seleção (a seleção já faz parte de ``chave()``)."""
+        versoes = self.dataset.versoes_anos(self.selecao.time_alvo)
+        if self.selecao.anos is None:
+            return versoes
+        return {ano: versao for ano, versao in versoes.items() if ano in self.selecao.anos}
+
+    def dados(self, colunas, anos=None):
+        selecao = self.selecao.restringir_anos(anos)
+        return _dados_selecao(self.dataset, self.dataset.versao(), tuple(colunas), selecao)
+
+    def agregados(self):
+        return _agregados_selecao(self.dataset, self.dataset.versao(), self.selecao)
+
+    def anos(self):
+        anos = self.dataset.anos(self.selecao.time_alvo)
+        return [ano for ano in anos if self.selecao.anos is None or ano in self.selecao.anos]
+
+
+@functools.lru_cache(maxsize=4)
+def abrir(diretorio):
+    """``DatasetPartidas`` compartilhado do processo para ``diretorio``."""
+    return DatasetPartidas(diretorio)
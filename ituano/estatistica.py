@@ -0,0 +1,166 @@
+"""Estatística em lote: intervalos de confiança e testes para muitos grupos.
+
+As funções trabalham sobre resumos por grupo (n, média, variância) e calculam
+todos os grupos ou todos os pares de grupos de uma vez, com arrays NumPy, em
+vez de uma chamada ao scipy por caso.
+"""
+
+import numpy as np
+import pandas as pd
+
+from ituano.importacoes import importar
+
+
+def resumo_grupos(df, grupo, valor):
+    """n, média e variância amostral (ddof=1) de ``valor`` por ``grupo``, ignorando NaN."""
+    resumo = df.groupby(grupo, observed=True)[valor].agg(["count", "mean", "var"])
+    return resumo.rename(columns={"count": "n", "mean": "media", "var": "variancia"})
+
+
+def resumo_de_somas(n, soma, soma_quadrados):
+    """Resumo a partir de somas acumuladas (útil para agregados incrementais)."""
+    n = np.asarray(n, dtype="float64")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        media = np.where(n > 0, soma / n, np.nan)
+        variancia = np.where(n > 1, (soma_quadrados - n * media ** 2) / (n - 1), np.nan)
+    return n, media, np.maximum(variancia, 0.0)
+
+
+def intervalos_t(resumo, confianca=0.95):
+    """Intervalo t de Student da média para cada linha de ``resumo``.
+
+    Equivale a ``stats.t.interval(confianca, n-1, loc=media, scale=stats.sem(x))``
+    para cada grupo.
+    """
+    stats = importar("scipy.stats")
+    n = resumo["n"].to_numpy(dtype="float64")
+    media = resumo["media"].to_numpy(dtype="float64")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        erro_padrao = np.sqrt(resumo["variancia"].to_numpy(dtype="float64") / n)
+        margem = stats.t.ppf(0.5 + confianca / 2, n - 1) * erro_padrao
+    return pd.DataFrame(
+        {
+            "n": resumo["n"].to_numpy(),
+            "media": media,
+            "erro_padrao": erro_padrao,
+            "limite_inferior": media - margem,
+            "limite_superior": media + margem,
+            "amplitude": 2 * margem,
+        },
+        index=resumo.index,
+    )
+
+
+def _pares(rotulos):
+    i, j = np.triu_indices(len(rotulos), k=1)
+    return i, j, np.asarray(rotulos)
+
+
+def welch_pares(resumo):
+    """Teste t de Welch (bicaudal) para todos os pares de grupos de ``resumo``."""
+    stats = importar("scipy.stats")
+    i, j, rotulos = _pares(resumo.index)
+    n = resumo["n"].to_numpy(dtype="float64")
+    media = resumo["media"].to_numpy(dtype="float64")
+    v = resumo["variancia"].to_numpy(dtype="float64") / n
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        estatistica_t = (media[i] - media[j]) / np.sqrt(v[i] + v[j])
+        # Graus de liberdade de Welch–Satterthwaite
+        gl = (v[i] + v[j]) ** 2 / (v[i] ** 2 / (n[i] - 1) + v[j] ** 2 / (n[j] - 1))
+    return pd.DataFrame({
+        "grupo_a": rotulos[i],
+        "grupo_b": rotulos[j],
+        "t": estatistica_t,
+        "gl": gl,
+        "p_valor": 2 * stats.t.sf(np.abs(estatistica_t), gl),
+    })
+
+
+def z_proporcao_pares(sucessos, n):
+    """Teste z de duas proporções (variância combinada) para todos os pares.
+
+    ``sucessos`` e ``n`` são séries indexadas pelo rótulo do grupo.
+    """
+    stats = importar("scipy.stats")
+    i, j, rotulos = _pares(n.index)
+    x = sucessos.to_numpy(dtype="float64")
+    m = n.to_numpy(dtype="float64")
+    p = x / m
+    p_combinada = (x[i] + x[j]) / (m[i] + m[j])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = (p[i] - p[j]) / np.sqrt(p_combinada * (1 - p_combinada) * (1 / m[i] + 1 / m[j]))
+    return pd.DataFrame({
+        "grupo_a": rotulos[i],
+        "grupo_b": rotulos[j],
+        "p_a": p[i],
+        "p_b": p[j],
+        "z": z,
+        "p_valor": 2 * stats.norm.sf(np.abs(z)),
+    })
+
+
+def par(tabela, a, b):
+    """Linha de uma tabela de pares para (a, b), em qualquer ordem.
+
+    Quando o par está invertido na tabela, as estatísticas com sinal são
+    ajustadas para refletir ``a`` contra ``b``.
+    """
+    linha = tabela[(tabela["grupo_a"] == a) & (tabela["grupo_b"] == b)]
+    if not linha.empty:
+        return linha.iloc[0]
+    linha = tabela[(tabela["grupo_a"] == b) & (tabela["grupo_b"] == a)].iloc[0].copy()
+    linha["grupo_a"], linha["grupo_b"] = a, b
+    for coluna in ("t", "z"):
+        if coluna in linha:
+            linha[coluna] = -linha[coluna]
+    if "p_a" in linha:
+        linha["p_a"], linha["p_b"] = linha["p_b"], linha["p_a"]
+    return linha
+
+
+def top_n_por_grupo(df, grupo, valor, n):
+    """As ``n`` maiores linhas de ``valor`` em cada grupo (sem loop por grupo)."""
+    ordenado = df.dropna(subset=[valor]).sort_values([grupo, valor], ascending=[True, False], kind="stable")
+    return ordenado.groupby(grupo, observed=True, sort=False).head(n)
+
+
+# Tabelas usadas pelo dashboard, calculadas para todas as temporadas/jogadores
+
+
+def ic_gols_por_ano(agregados, confianca=0.95):
+    """IC da média de gols por jogador em cada temporada."""
+    jogadores = agregados.jogadores.reset_index()
+    return intervalos_t(resumo_grupos(jogadores, "ano", "gols"), confianca)
+
+
+def top_eficiencia_por_ano(agregados, n=3):
+    """Top ``n`` de cada temporada por gols/minutos somados."""
+    jogadores = agregados.jogadores.reset_index()
+    return top_n_por_grupo(jogadores[jogadores["minutos"] > 0], "ano", "gols_por_minuto", n)
+
+
+def ic_top_eficiencia(agregados, n=3, confianca=0.95):
+    """IC da média de gols por minuto dos Top ``n`` de cada temporada."""
+    return intervalos_t(resumo_grupos(top_eficiencia_por_ano(agregados, n), "ano", "gols_por_minuto"), confianca)
+
+
+def welch_top_gpm(agregados, n=3):
+    """Welch para todos os pares de temporadas: Top ``n`` por média de gols/minuto por partida."""
+    top = top_n_por_grupo(agregados.jogadores.reset_index(), "ano", "gpm_medio", n)
+    return welch_pares(resumo_grupos(top, "ano", "gpm_medio"))
+
+
+def z_jogos_com_gol(agregados):
+    """Teste z para todos os pares de temporadas: proporção de jogos com gol."""
+    por_ano = agregados.partidas.groupby(level="ano")["fez_gol"].agg(["sum", "size"])
+    return z_proporcao_pares(por_ano["sum"], por_ano["size"])
+
+
+def ic_gpm_jogadores(agregados, confianca=0.95):
+    """IC da média de gols por minuto por partida de cada jogador em cada temporada."""
+    jogadores = agregados.jogadores
+    n, media, variancia = resumo_de_somas(jogadores["gpm_n"], jogadores["gpm_soma"], jogadores["gpm_soma_quadrados"])
+    resumo = pd.DataFrame({"n": jogadores["gpm_n"], "media": media, "variancia": variancia}, index=jogadores.index)
+    return intervalos_t(resumo[resumo["n"] > 1], confianca)
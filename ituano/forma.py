@@ -0,0 +1,140 @@
+"""Forma recente dos jogadores: métricas em janelas móveis sobre as partidas.
+
+As linhas são ordenadas por jogador e partida (``ano``, ``jogo``) e cada
+métrica é uma razão de somas na janela das últimas ``janela`` partidas em que
+o jogador entrou em campo (ex.: gols por 90 = 90 x gols / minutos da janela).
+As somas móveis de todos os jogadores saem de uma única soma acumulada: a
+soma da janela é a diferença entre a acumulada na partida atual e a
+acumulada ``janela`` partidas antes, limitada ao início do grupo. Não há
+loop por jogador.
+"""
+
+import numpy as np
+import pandas as pd
+
+# nome: (numerador, denominador ou None para média simples, escala)
+METRICAS_FORMA = {
+    "gols_p90": ("statistics_goals", "statistics_minutes_played", 90),
+    "xg_p90": ("statistics_expected_goals", "statistics_minutes_played", 90),
+    "xa_p90": ("statistics_expected_assists", "statistics_minutes_played", 90),
+    "nota": ("statistics_rating", None, 1),
+    "pass_accuracy": ("statistics_accurate_pass", "statistics_total_pass", 1),
+}
+
+ROTULOS_FORMA = {
+    "gols_p90": "Gols por 90",
+    "xg_p90": "xG por 90",
+    "xa_p90": "xA por 90",
+    "nota": "Nota média",
+    "pass_accuracy": "Acerto de passe",
+}
+
+COLUNAS_FORMA = ["ano", "jogo", "player_name", "statistics_minutes_played"] + sorted({
+    coluna for numerador, denominador, _ in METRICAS_FORMA.values() for coluna in (numerador, denominador) if coluna
+} - {"statistics_minutes_played"})
+
+JANELA_PADRAO = 5
+
+
+def somas_moveis(valores, inicio_grupo, janela):
+    """Soma de cada linha com as ``janela - 1`` anteriores do mesmo grupo.
+
+    ``valores`` é (séries x linhas), com as linhas já ordenadas por grupo;
+    ``inicio_grupo`` traz, para cada linha, a posição da primeira linha do
+    seu grupo. Cada série é contígua, então a soma acumulada é sequencial.
+    """
+    n = valores.shape[1]
+    acumulada = np.zeros((valores.shape[0], n + 1))
+    np.cumsum(valores, axis=1, out=acumulada[:, 1:])
+    posicao = np.arange(n)
+    inicio = np.maximum(posicao - janela + 1, inicio_grupo)
+    return acumulada[:, posicao + 1] - acumulada[:, inicio]
+
+
+def _inicio_grupos(*chaves):
+    """Posição da primeira linha do grupo de cada linha (linhas ordenadas pelas ``chaves``)."""
+    n = len(chaves[0])
+    novo = np.ones(n, dtype=bool)
+    if n:
+        novo[1:] = np.logical_or.reduce([chave[1:] != chave[:-1] for chave in chaves])
+    return np.maximum.accumulate(np.where(novo, np.arange(n), 0))
+
+
+def calcular(df, janela=JANELA_PADRAO, por_temporada=False):
+    """Métricas móveis de todos os jogadores.
+
+    Considera só as partidas com minutos jogados. Com ``por_temporada=True``
+    a janela recomeça a cada temporada. Retorna uma linha por jogador e
+    partida, indexada por (``player_name``, ``ano``, ``jogo``), com a
+    sequência da partida na carreira do jogador (``partida``), o número de
+    partidas na janela e as métricas de ``METRICAS_FORMA`` (NaN quando a
+    janela não tem dados para a métrica).
+    """
+    jogou = df["statistics_minutes_played"].to_numpy(dtype="float64", na_value=np.nan) > 0
+    # Códigos inteiros do jogador: ordenar e agrupar sem comparar strings
+    nomes = df["player_name"]
+    if not isinstance(nomes.dtype, pd.CategoricalDtype):
+        nomes = nomes.astype("category")
+    categorias = nomes.cat.categories
+    codigos = nomes.cat.codes.to_numpy()[jogou]
+    anos = df["ano"].to_numpy()[jogou]
+    jogos = df["jogo"].to_numpy()[jogou]
+    ordem = np.lexsort((jogos, anos, codigos))
+    codigos, anos, jogos = codigos[ordem], anos[ordem], jogos[ordem]
+    indices = np.flatnonzero(jogou)[ordem]
+
+    def coluna(nome):
+        return df[nome].to_numpy(dtype="float64", na_value=np.nan)[indices]
+
+    inicio_jogador = _inicio_grupos(codigos)
+    inicio_grupo = _inicio_grupos(codigos, anos) if por_temporada else inicio_jogador
+
+    # Numerador e denominador de cada métrica, zerados onde algum dos dois falta.
+    # Nas razões, NA no numerador é zero (ex.: partida sem gol) se a coluna é
+    # registrada na temporada; xG, por exemplo, só existe a partir de 2025.
+    # Nas médias (nota), NA é ausência de nota.
+    numeradores, denominadores = [], []
+    for numerador, denominador, _ in METRICAS_FORMA.values():
+        num = coluna(numerador)
+        if denominador:
+            registrada = np.isin(anos, np.unique(anos[~np.isnan(num)]))
+            num = np.where(np.isnan(num) & registrada, 0.0, num)
+            den = coluna(denominador)
+        else:
+            den = np.where(np.isnan(num), np.nan, 1.0)
+        valido = ~np.isnan(num) & ~np.isnan(den)
+        numeradores.append(np.where(valido, num, 0.0))
+        denominadores.append(np.where(valido, den, 0.0))
+
+    somas = somas_moveis(np.vstack(numeradores + denominadores + [np.ones(len(indices))]), inicio_grupo, janela)
+    k = len(METRICAS_FORMA)
+    # Denominadores são inteiros (minutos, passes, contagem de notas): o limiar
+    # de 0,5 ignora resíduos de arredondamento da diferença de acumuladas
+    with np.errstate(divide="ignore", invalid="ignore"):
+        razoes = np.where(somas[k:2 * k] > 0.5, somas[:k] / somas[k:2 * k], np.nan)
+    razoes *= np.array([escala for _, _, escala in METRICAS_FORMA.values()])[:, None]
+
+    resultado = pd.DataFrame(
+        dict(zip(METRICAS_FORMA, razoes)),
+        index=pd.MultiIndex.from_arrays(
+            [pd.Categorical.from_codes(codigos, categorias), anos, jogos], names=["player_name", "ano", "jogo"]
+        ),
+    )
+    resultado.insert(0, "partida", np.arange(len(indices)) - inicio_jogador + 1)
+    resultado.insert(1, "partidas_janela", somas[-1].astype("int64"))
+    resultado.insert(2, "minutos", coluna("statistics_minutes_played"))
+    return resultado
+
+
+def jogadores(forma, minimo_partidas=1):
+    """Jogadores com pelo menos ``minimo_partidas`` partidas, do que mais jogou ao que menos jogou."""
+    partidas = forma.groupby(level="player_name", sort=False).size()
+    partidas = partidas[partidas >= minimo_partidas]
+    return partidas.sort_values(ascending=False, kind="stable").index.tolist()
+
+
+def linha_do_tempo(forma, jogador):
+    """Recorte de um jogador, pronto para o gráfico (uma linha por partida)."""
+    recorte = forma.xs(jogador, level="player_name").reset_index()
+    recorte["rotulo"] = recorte["ano"].astype(str) + " · J" + recorte["jogo"].astype(str)
+    return recorte
@@ -0,0 +1,103 @@
+"""Cache de figuras (Plotly e matplotlib) compartilhado entre sessões.
+
+As figuras são guardadas em um LRU limitado, com chave
+(versão dos dados, id do gráfico, parâmetros). Figuras matplotlib são
+convertidas para PNG na construção e descartadas em seguida, para que nenhuma
+figura fique viva no servidor.
+"""
+
+import io
+import threading
+import time
+from collections import OrderedDict
+
+TAMANHO_PADRAO = 64
+
+
+class _EstatisticasGrafico:
+    def __init__(self):
+        self.acertos = 0
+        self.falhas = 0
+        self.tempo_construcao = 0.0
+        self.ultimo_render = 0.0
+
+
+class CacheFiguras:
+    """LRU thread-safe de figuras, com estatísticas por gráfico."""
+
+    def __init__(self, tamanho=TAMANHO_PADRAO):
+        self.tamanho = tamanho
+        self._figuras = OrderedDict()
+        self._estatisticas = {}
+        self._lock = threading.Lock()
+
+    def obter(self, versao, grafico, parametros, construir):
+        """Retorna a figura em cache ou a constrói com ``construir()``.
+
+        A figura retornada é compartilhada e não deve ser modificada.
+        """
+        chave = (versao, grafico, parametros)
+        with self._lock:
+            estatisticas = self._estatisticas.setdefault(grafico, _EstatisticasGrafico())
+            if chave in self._figuras:
+                self._figuras.move_to_end(chave)
+                estatisticas.acertos += 1
+                return self._figuras[chave]
+
+        inicio = time.perf_counter()
+        figura = construir()
+        duracao = time.perf_counter() - inicio
+
+        with self._lock:
+            estatisticas.falhas += 1
+            estatisticas.tempo_construcao += duracao
+            self._figuras[chave] = figura
+            self._figuras.move_to_end(chave)
+            while len(self._figuras) > self.tamanho:
+                self._figuras.popitem(last=False)
+        return figura
+
+    def registrar_render(self, grafico, segundos):
+        with self._lock:
+            self._estatisticas.setdefault(grafico, _EstatisticasGrafico()).ultimo_render = segundos
+
+    def taxa_acerto(self):
+        with self._lock:
+            acertos = sum(e.acertos for e in self._estatisticas.values())
+            total = acertos + sum(e.falhas for e in self._estatisticas.values())
+        return acertos / total if total else 0.0
+
+    def estatisticas(self):
+        """Lista de dicionários por gráfico (acertos, falhas, tempos em ms)."""
+        with self._lock:
+            return [
+                {
+                    "grafico": grafico,
+                    "acertos": e.acertos,
+                    "falhas": e.falhas,
+                    "construcao_media_ms": 1000 * e.tempo_construcao / e.falhas if e.falhas else 0.0,
+                    "ultimo_render_ms": 1000 * e.ultimo_render,
+                }
+                for grafico, e in sorted(self._estatisticas.items())
+            ]
+
+    def __len__(self):
+        return len(self._figuras)
+
+    def limpar(self):
+        with self._lock:
+            self._figuras.clear()
+
+
+def png_matplotlib(figura, dpi=200):
+    """Renderiza uma ``matplotlib.figure.Figure`` para PNG e a libera."""
+    buffer = io.BytesIO()
+    try:
+        figura.savefig(buffer, format="png", dpi=dpi, bbox_inches="tight")
+    finally:
+        figura.clear()
+    return buffer.getvalue()
+
+
+# Cache do processo, compartilhado por todas as sessões
+cache = CacheFiguras()
@@ -0,0 +1,100 @@
+"""Verificação de dependências e importação preguiçosa de bibliotecas pesadas.
+
+``verificar_dependencias()`` falha rápido (sem importar nada) quando falta
+algum pacote. ``importar()`` importa sob demanda e registra quanto tempo a
+primeira importação levou, para acompanhar regressões de inicialização.
+Executar ``python -m ituano.importacoes`` mede cada biblioteca em um
+interpretador limpo.
+"""
+
+import importlib
+import importlib.util
+import subprocess
+import sys
+import threading
+import time
+
+# Módulo importável -> pacote do requirements.txt
+DEPENDENCIAS = {
+    "streamlit": "streamlit",
+    "pandas": "pandas",
+    "numpy": "numpy",
+    "pyarrow": "pyarrow",
+    "plotly": "plotly",
+    "scipy": "scipy",
+    "seaborn": "seaborn",
+    "matplotlib": "matplotlib",
+}
+
+# Bibliotecas medidas no relatório de inicialização
+PESADAS = [
+    "streamlit",
+    "pandas",
+    "numpy",
+    "pyarrow",
+    "scipy.stats",
+    "plotly.express",
+    "plotly.graph_objects",
+    "matplotlib.figure",
+    "seaborn",
+]
+
+_lock = threading.Lock()
+_tempos = {}
+
+
+class DependenciaAusente(ImportError):
+    pass
+
+
+def verificar_dependencias():
+    """Levanta ``DependenciaAusente`` listando os pacotes não instalados."""
+    ausentes = [pacote for modulo, pacote in DEPENDENCIAS.items() if importlib.util.find_spec(modulo) is None]
+    if ausentes:
+        raise DependenciaAusente(
+            "Dependências ausentes: " + ", ".join(ausentes) + ". Instale com: pip install -r requirements.txt"
+        )
+
+
+def importar(nome):
+    """``importlib.import_module`` registrando o tempo da primeira importação."""
+    modulo = sys.modules.get(nome)
+    if modulo is not None:
+        return modulo
+    with _lock:
+        inicio = time.perf_counter()
+        modulo = importlib.import_module(nome)
+        _tempos.setdefault(nome, time.perf_counter() - inicio)
+    return modulo
+
+
+def tempos_importacao():
+    """Tempos (s) das importações feitas via ``importar()`` neste processo."""
+    with _lock:
+        return dict(_tempos)
+
+
+def medir_importacao_limpa(nome):
+    """Tempo (s) de ``import nome`` em um interpretador novo, via ``-X importtime``."""
+    resultado = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {nome}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Formato: "import time: self [us] | cumulative | imported package"
+    for linha in reversed(resultado.stderr.splitlines()):
+        partes = [parte.strip() for parte in linha.split("|")]
+        if len(partes) == 3 and partes[2] == nome:
+            return int(partes[1]) / 1e6
+    return float("nan")
+
+
+def relatorio_inicializacao(modulos=PESADAS):
+    return {nome: medir_importacao_limpa(nome) for nome in modulos}
+
+
+if __name__ == "__main__":
+    verificar_dependencias()
+    for nome, segundos in relatorio_inicializacao().items():
+        print(f"{nome:<24} {segundos * 1000:8.1f} ms")
@@ -0,0 +1,250 @@
+"""Ingestão incremental de novas linhas de partida.
+
+Uso::
+
+    python -m ituano.ingestao novas.csv [--csv dados-completos-Ituano.csv]
+    python -m ituano.ingestao novas.csv --dataset <diretorio>
+
+As linhas (mesmo schema de ``dados-completos-Ituano.csv``) são validadas e
+deduplicadas pela chave ``ano`` + ``jogo`` + ``player_name``, entre si e
+contra o que já está armazenado. Depois são anexadas ao CSV e só as
+temporadas afetadas são reescritas no sidecar Parquet (``colunar.anexar``).
+A versão dessas temporadas muda, e com ela apenas os caches que dependem
+delas. O dashboard em execução percebe a nova versão em poucos segundos
+(``paginas.comum.acompanhar_versao``) sem reiniciar o servidor.
+
+No modo ``--dataset`` as linhas novas viram um CSV em ``<diretorio>/ingestao/``
+e apenas esse arquivo é convertido para as partições do dataset.
+"""
+
+import argparse
+import contextlib
+import os
+import time
+
+import pandas as pd
+
+from ituano import colunar, dados
+from ituano import dataset as _dataset
+
+CHAVE = ["ano", "jogo", "player_name"]
+
+# Informações da partida: devem ser iguais em todas as linhas de um mesmo jogo
+COLUNAS_PARTIDA = ["time_alvo", "home_or_away", "home_team", "away_team", "home_score", "away_score", "tournament"]
+COLUNAS_NAO_NEGATIVAS = [
+    "statistics_goals", "statistics_minutes_played", "statistics_total_pass", "statistics_accurate_pass",
+]
+
+# Máximo de linhas citadas por problema na mensagem de erro
+MAX_EXEMPLOS = 5
+
+
+class LinhasInvalidas(ValueError):
+    """As linhas recebidas não passaram na validação."""
+
+    def __init__(self, problemas):
+        self.problemas = problemas
+        super().__init__("; ".join(problemas))
+
+
+def _linhas_arquivo(mascara):
+    # Número da linha no arquivo (cabeçalho = linha 1)
+    numeros = [int(i) + 2 for i in mascara[mascara].index[:MAX_EXEMPLOS]]
+    return ", ".join(map(str, numeros)) + (" ..." if mascara.sum() > MAX_EXEMPLOS else "")
+
+
+def ler_novas(caminho, colunas):
+    """Lê o arquivo de novas linhas nas ``colunas`` do armazenamento.
+
+    Retorna o texto original de cada célula (anexado sem reformatar números,
+    ``NA`` e ``TRUE``/``FALSE``) e o DataFrame tipado correspondente.
+    """
+    texto = pd.read_csv(caminho, dtype=str, keep_default_na=False)
+    problemas = []
+    ausentes = [coluna for coluna in colunas if coluna not in texto.columns]
+    extras = [coluna for coluna in texto.columns if coluna not in colunas]
+    if ausentes:
+        problemas.append(f"colunas ausentes: {', '.join(ausentes)}")
+    if extras:
+        problemas.append(f"colunas desconhecidas: {', '.join(extras)}")
+    if problemas:
+        raise LinhasInvalidas(problemas)
+    try:
+        tipadas = dados.ler_csv(caminho)
+    except (ValueError, TypeError) as erro:
+        raise LinhasInvalidas([f"valores incompatíveis com o schema: {erro}"]) from erro
+    return texto[list(colunas)], tipadas[list(colunas)]
+
+
+def validar(novas, chave=CHAVE):
+    """Lista os problemas encontrados nas linhas tipadas (vazia se estiver tudo certo)."""
+    problemas = []
+    sem_chave = novas[chave].isna().any(axis=1)
+    if sem_chave.any():
+        problemas.append(f"chave ({', '.join(chave)}) incompleta nas linhas {_linhas_arquivo(sem_chave)}")
+
+    for coluna in COLUNAS_NAO_NEGATIVAS:
+        negativos = novas[coluna] < 0
+        if negativos.any():
+            problemas.append(f"{coluna} negativo nas linhas {_linhas_arquivo(negativos)}")
+
+    passes = novas["statistics_accurate_pass"] > novas["statistics_total_pass"]
+    if passes.any():
+        problemas.append(f"mais passes certos que passes totais nas linhas {_linhas_arquivo(passes)}")
+
+    partida = [coluna for coluna in chave if coluna != "player_name"]
+    comparadas = [coluna for coluna in COLUNAS_PARTIDA if coluna not in partida]
+    divergentes = novas.groupby(partida, observed=True)[comparadas].nunique(dropna=False).gt(1)
+    for jogo, colunas in divergentes[divergentes.any(axis=1)].iterrows():
+        problemas.append(f"jogo {'/'.join(map(str, jogo))}: {', '.join(colunas[colunas].index)} diferem entre as linhas")
+    return problemas
+
+
+def _chaves(df, chave):
+    # Como texto: categorias e inteiros de larguras diferentes comparam igual
+    return pd.MultiIndex.from_frame(df[chave].astype("string"))
+
+
+def deduplicar(texto, novas, existentes, chave=CHAVE):
+    """Remove repetições dentro do lote (fica a última) e linhas já armazenadas.
+
+    ``existentes`` são as linhas armazenadas (ao menos a chave e
+    ``COLUNAS_PARTIDA``) das temporadas afetadas. Levanta ``LinhasInvalidas``
+    se um jogo já armazenado chega com placar ou adversário diferentes.
+    """
+    repetidas = novas.duplicated(chave, keep="last")
+    texto, novas = texto[~repetidas], novas[~repetidas]
+
+    ja_armazenadas = _chaves(novas, chave).isin(_chaves(existentes, chave))
+    texto, novas = texto[~ja_armazenadas], novas[~ja_armazenadas]
+
+    partida = [coluna for coluna in chave if coluna != "player_name"]
+    comparadas = [coluna for coluna in COLUNAS_PARTIDA if coluna not in partida]
+    armazenadas = existentes.drop_duplicates(partida).set_index(partida)[comparadas].astype("string")
+    recebidas = novas.drop_duplicates(partida).set_index(partida)[comparadas].astype("string")
+    comuns = recebidas.index.intersection(armazenadas.index)
+    diferentes = recebidas.loc[comuns].ne(armazenadas.loc[comuns]).any(axis=1)
+    if diferentes.any():
+        jogos = ", ".join("/".join(map(str, jogo)) for jogo in diferentes[diferentes].index[:MAX_EXEMPLOS])
+        raise LinhasInvalidas([f"jogos já armazenados com dados da partida diferentes: {jogos}"])
+
+    return texto, novas, {"repetidas_no_lote": int(repetidas.sum()), "ja_armazenadas": int(ja_armazenadas.sum())}
+
+
+def _texto_csv(texto):
+    return texto.to_csv(header=False, index=False, lineterminator="\n")
+
+
+def ingerir(caminho_novas, caminho_csv=dados.CSV_PADRAO, simular=False):
+    """Valida, deduplica e anexa as linhas de ``caminho_novas`` ao CSV de partidas.
+
+    Com ``simular=True`` nada é gravado. Retorna um resumo da ingestão.
+    """
+    colunas = list(pd.read_csv(caminho_csv, nrows=0).columns)
+    texto, novas = ler_novas(caminho_novas, colunas)
+    problemas = validar(novas)
+    if problemas:
+        raise LinhasInvalidas(problemas)
+
+    anos = sorted(int(ano) for ano in novas["ano"].unique())
+    recebidas = len(novas)
+    # Leitura, deduplicação e anexação na mesma trava: outra ingestão não pode
+    # anexar as mesmas linhas entre a leitura e a escrita
+    with contextlib.nullcontext() if simular else colunar.trava(caminho_csv):
+        existentes = colunar.ler(CHAVE + COLUNAS_PARTIDA, anos=anos, caminho_csv=caminho_csv)
+        texto, novas, descartadas = deduplicar(texto, novas, existentes)
+
+        resumo = {
+            "recebidas": recebidas,
+            **descartadas,
+            "incluidas": len(novas),
+            "anos": sorted(int(ano) for ano in novas["ano"].unique()),
+            "versao_anterior": colunar.versao(caminho_csv),
+        }
+        if not novas.empty and not simular:
+            colunar.anexar(_texto_csv(texto), novas, caminho_csv)
+        resumo["versao"] = colunar.versao(caminho_csv)
+    return resumo
+
+
+def ingerir_dataset(caminho_novas, diretorio, simular=False):
+    """Como ``ingerir``, para um diretório de dataset (``ituano.dataset``).
+
+    A chave inclui ``time_alvo``, já que o mesmo jogo pode aparecer para
+    clubes diferentes.
+    """
+    base = _dataset.abrir(diretorio)
+    arquivos = base.arquivos()
+    if not arquivos:
+        raise LinhasInvalidas([f"nenhum CSV em {diretorio} para servir de schema"])
+    colunas = list(pd.read_csv(os.path.join(base.diretorio, arquivos[0]), nrows=0).columns)
+    texto, novas = ler_novas(caminho_novas, colunas)
+    chave = ["time_alvo"] + CHAVE
+    problemas = validar(novas, chave)
+    if problemas:
+        raise LinhasInvalidas(problemas)
+
+    recebidas = len(novas)
+    # Como em ``ingerir``: leitura, deduplicação e gravação na trava do diretório
+    with contextlib.nullcontext() if simular else base.trava():
+        base.atualizar()  # o manifesto em memória pode não ter o lote de outro processo
+        partes = [
+            base.ler(chave + COLUNAS_PARTIDA[1:], _dataset.Selecao(time_alvo, anos=linhas["ano"].unique().tolist()))
+            for time_alvo, linhas in novas.groupby("time_alvo", observed=True)
+        ]
+        existentes = pd.concat(partes, ignore_index=True) if partes else novas.iloc[:0]
+        texto, novas, descartadas = deduplicar(texto, novas, existentes, chave)
+
+        resumo = {
+            "recebidas": recebidas,
+            **descartadas,
+            "incluidas": len(novas),
+            "anos": sorted(int(ano) for ano in novas["ano"].unique()),
+            "versao_anterior": base.versao(),
+        }
+        if not novas.empty and not simular:
+            _gravar_lote(texto, os.path.join(base.diretorio, "ingestao"))
+            base.atualizar()
+        resumo["versao"] = base.versao()
+    return resumo
+
+
+def _gravar_lote(texto, pasta):
+    """Grava o lote como um novo CSV de ``pasta``, sem que ele apareça pela metade."""
+    os.makedirs(pasta, exist_ok=True)
+    nome = time.strftime("%Y%m%d-%H%M%S")
+    destino = os.path.join(pasta, f"{nome}.csv")
+    numero = 1
+    while os.path.exists(destino):  # outra ingestão no mesmo segundo
+        destino = os.path.join(pasta, f"{nome}-{numero}.csv")
+        numero += 1
+    # O nome temporário não termina em .csv: a varredura do dataset não o enxerga
+    temporario = f"{destino}.tmp-{os.getpid()}"
+    texto.to_csv(temporario, index=False, lineterminator="\n")
+    os.replace(temporario, destino)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("novas", help="CSV com as novas linhas de partida")
+    parser.add_argument("--csv", default=dados.CSV_PADRAO, help="CSV de partidas que recebe as linhas")
+    parser.add_argument("--dataset", help="diretório de dataset (em vez do CSV único)")
+    parser.add_argument("--simular", action="store_true", help="valida e deduplica sem gravar")
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    try:
+        if args.dataset:
+            resumo = ingerir_dataset(args.novas, args.dataset, args.simular)
+        else:
+            resumo = ingerir(args.novas, args.csv, args.simular)
+    except LinhasInvalidas as erro:
+        parser.exit(1, "Linhas rejeitadas:\n" + "\n".join(f"- {problema}" for problema in erro.problemas) + "\n")
+
+    for chave, valor in resumo.items():
+        print(f"{chave}: {valor}")
+    print(f"Concluído em {time.perf_counter() - inicio:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Métricas derivadas por linha, calculadas de forma vetorizada.
+
+Todas as funções recebem um DataFrame com o schema do CSV e devolvem séries
+alinhadas ao índice, sem modificar o DataFrame de entrada.
+"""
+
+import functools
+
+import numpy as np
+import pandas as pd
+
+from ituano import colunar, dados
+
+METRICAS = ["gols_ituano", "fez_gol", "gols_por_minuto", "pass_accuracy", "passes_certos_por_minuto"]
+
+
+def _razao(numerador, denominador):
+    """numerador / denominador, NaN quando o denominador não é positivo."""
+    numerador = numerador.to_numpy(dtype="float64", na_value=np.nan)
+    denominador = denominador.to_numpy(dtype="float64", na_value=np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominador > 0, numerador / denominador, np.nan)
+
+
+def eh_mandante(home_or_away):
+    """True quando o time alvo jogou em casa ("home", sem diferenciar caixa)."""
+    if isinstance(home_or_away.dtype, pd.CategoricalDtype):
+        # Normaliza só as categorias e indexa pelos códigos
+        categorias = home_or_away.cat.categories.astype(str).str.strip().str.lower() == "home"
+        codigos = home_or_away.cat.codes.to_numpy()
+        return np.where(codigos >= 0, categorias[codigos], False)
+    return (home_or_away.astype(str).str.strip().str.lower() == "home").to_numpy()
+
+
+def gols_ituano(df):
+    gols = np.where(eh_mandante(df["home_or_away"]), df["home_score"].to_numpy(), df["away_score"].to_numpy())
+    return pd.Series(gols, index=df.index, name="gols_ituano")
+
+
+def fez_gol(df):
+    return (gols_ituano(df) >= 1).rename("fez_gol")
+
+
+def gols_por_minuto(df):
+    return pd.Series(
+        _razao(df["statistics_goals"], df["statistics_minutes_played"]), index=df.index, name="gols_por_minuto"
+    )
+
+
+def pass_accuracy(df):
+    return pd.Series(
+        _razao(df["statistics_accurate_pass"], df["statistics_total_pass"]), index=df.index, name="pass_accuracy"
+    )
+
+
+def passes_certos_por_minuto(df):
+    return pd.Series(
+        _razao(df["statistics_accurate_pass"], df["statistics_minutes_played"]),
+        index=df.index,
+        name="passes_certos_por_minuto",
+    )
+
+
+def derivar(df):
+    """Retorna uma cópia de ``df`` com as métricas cujas colunas de origem existem."""
+    colunas = set(df.columns)
+    novas = {}
+    if {"home_or_away", "home_score", "away_score"} <= colunas:
+        novas["gols_ituano"] = gols_ituano(df)
+        novas["fez_gol"] = novas["gols_ituano"] >= 1
+    if {"statistics_goals", "statistics_minutes_played"} <= colunas:
+        novas["gols_por_minuto"] = gols_por_minuto(df)
+    if {"statistics_accurate_pass", "statistics_total_pass"} <= colunas:
+        novas["pass_accuracy"] = pass_accuracy(df)
+    if {"statistics_accurate_pass", "statistics_minutes_played"} <= colunas:
+        novas["passes_certos_por_minuto"] = passes_certos_por_minuto(df)
+    return df.assign(**novas)
+
+
+@functools.lru_cache(maxsize=32)
+def _derivadas(versao, caminho_csv, colunas, anos):
+    return derivar(colunar.ler(colunas, anos=anos, caminho_csv=caminho_csv))
+
+
+def obter(colunas=None, anos=None, caminho_csv=dados.CSV_PADRAO):
+    """Dados lidos com as métricas derivadas, calculados uma vez por versão.
+
+    O resultado é compartilhado e não deve ser modificado in-place.
+    """
+    colunas = tuple(colunas) if colunas else None
+    anos = tuple(anos) if anos is not None else None
+    return _derivadas(colunar.versao(caminho_csv, anos), caminho_csv, colunas, anos)
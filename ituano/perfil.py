@@ -0,0 +1,202 @@
+"""Perfil de execução opcional: tempo e pico de memória por seção.
+
+``Perfil.execucao()`` envolve um rerun (ou uma rodada de benchmark) e
+``secao(nome)`` marca os trechos medidos dentro dele. Fora de uma execução
+perfilada ``secao`` não faz nada além de consultar uma ``ContextVar``, então
+o código pode ficar instrumentado com o perfil desligado.
+
+O pico de memória vem do ``tracemalloc`` (alocações do Python e do NumPy;
+buffers do pyarrow ficam de fora) e é medido acima da memória em uso no
+início da seção. O pico de RSS do processo (``resource``) completa o quadro.
+
+O ``tracemalloc`` é do processo inteiro e cada seção zera o pico dele, então
+só uma execução por vez mede memória (ex.: duas sessões do dashboard com o
+perfil ligado). As execuções simultâneas ficam com ``memoria_medida=False``:
+pico indisponível, só o RSS.
+"""
+
+import contextlib
+import contextvars
+import functools
+import math
+import threading
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_ativo = contextvars.ContextVar("perfil", default=None)
+
+# Execução que detém o tracemalloc e se foi ela que o ligou
+_trava_memoria = threading.Lock()
+_dono_memoria = None
+_ligou_tracemalloc = False
+
+
+def _reservar_memoria(perfil):
+    """Reserva o tracemalloc para ``perfil``; False se outra execução já mede memória."""
+    global _dono_memoria, _ligou_tracemalloc
+    with _trava_memoria:
+        if _dono_memoria is not None:
+            return False
+        _dono_memoria = perfil
+        # Ligado por fora (ex.: python -X tracemalloc): usa, mas não desliga
+        _ligou_tracemalloc = not tracemalloc.is_tracing()
+        if _ligou_tracemalloc:
+            tracemalloc.start()
+        return True
+
+
+def _liberar_memoria(perfil):
+    global _dono_memoria, _ligou_tracemalloc
+    with _trava_memoria:
+        if _dono_memoria is not perfil:
+            return
+        if _ligou_tracemalloc:
+            tracemalloc.stop()
+        _dono_memoria = None
+        _ligou_tracemalloc = False
+
+
+def _rss_pico_mb():
+    if resource is None:
+        return float("nan")
+    # ru_maxrss é em KiB no Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class _Secao:
+    def __init__(self, nome, nivel):
+        self.nome = nome
+        self.nivel = nivel
+        self.inicio = time.perf_counter()
+        self.duracao = 0.0
+        self.memoria_inicial = 0
+        self.pico = 0
+
+
+class Perfil:
+    """Seções medidas de uma execução, na ordem em que foram abertas."""
+
+    def __init__(self, nome="", memoria=True):
+        self.nome = nome
+        self.memoria = memoria
+        # Se o pico de memória foi de fato medido (ver ``_reservar_memoria``)
+        self.memoria_medida = False
+        self.secoes = []
+        self.duracao = 0.0
+        self.pico_mb = float("nan")
+        self.rss_pico_mb = float("nan")
+        self._pilha = []
+
+    @contextlib.contextmanager
+    def execucao(self):
+        """Ativa o perfil no contexto atual enquanto o bloco executa."""
+        self.memoria_medida = self.memoria and _reservar_memoria(self)
+        token = _ativo.set(self)
+        raiz = self._abrir("total")
+        try:
+            yield self
+        finally:
+            self._fechar(raiz)
+            _ativo.reset(token)
+            if self.memoria_medida:
+                _liberar_memoria(self)
+            self.duracao = raiz.duracao
+            self.pico_mb = raiz.pico / 2**20 if self.memoria_medida else float("nan")
+            self.rss_pico_mb = _rss_pico_mb()
+
+    def _abrir(self, nome):
+        secao = _Secao(nome, len(self._pilha))
+        if self.memoria_medida:
+            atual, pico = tracemalloc.get_traced_memory()
+            # O pico desde o último reset pertence à seção que está aberta
+            if self._pilha:
+                pai = self._pilha[-1]
+                pai.pico = max(pai.pico, pico - pai.memoria_inicial)
+            tracemalloc.reset_peak()
+            secao.memoria_inicial = atual
+        self._pilha.append(secao)
+        self.secoes.append(secao)
+        return secao
+
+    def _fechar(self, secao):
+        secao.duracao = time.perf_counter() - secao.inicio
+        self._pilha.pop()
+        if self.memoria_medida:
+            _, pico = tracemalloc.get_traced_memory()
+            secao.pico = max(secao.pico, pico - secao.memoria_inicial)
+            if self._pilha:
+                pai = self._pilha[-1]
+                pai.pico = max(pai.pico, secao.pico + secao.memoria_inicial - pai.memoria_inicial)
+
+    @contextlib.contextmanager
+    def secao(self, nome):
+        secao = self._abrir(nome)
+        try:
+            yield secao
+        finally:
+            self._fechar(secao)
+
+    def tabela(self):
+        """Uma linha por seção: ``secao`` (recuada pelo nível), ``ms`` e ``pico_mb``."""
+        return [
+            {
+                "secao": "  " * secao.nivel + secao.nome,
+                "ms": secao.duracao * 1000,
+                "pico_mb": secao.pico / 2**20 if self.memoria_medida else float("nan"),
+            }
+            for secao in self.secoes
+        ]
+
+    def resumo(self):
+        """Dicionário serializável em JSON com a execução e suas seções (medidas ausentes viram ``None``)."""
+        return {
+            "nome": self.nome,
+            "memoria_medida": self.memoria_medida,
+            "ms": self.duracao * 1000,
+            "pico_mb": _numero(self.pico_mb),
+            "rss_pico_mb": _numero(self.rss_pico_mb),
+            "secoes": [
+                {"secao": secao.nome, "nivel": secao.nivel, "ms": linha["ms"], "pico_mb": _numero(linha["pico_mb"])}
+                for secao, linha in zip(self.secoes, self.tabela())
+            ],
+        }
+
+
+def _numero(valor):
+    return None if math.isnan(valor) else valor
+
+
+def ativo():
+    """Perfil da execução corrente, ou ``None`` com o perfil desligado."""
+    return _ativo.get()
+
+
+@contextlib.contextmanager
+def secao(nome):
+    """Mede o bloco na execução perfilada corrente (não faz nada sem perfil)."""
+    perfil = _ativo.get()
+    if perfil is None:
+        yield None
+        return
+    with perfil.secao(nome) as medida:
+        yield medida
+
+
+def medir(nome=None):
+    """Decorador: mede cada chamada da função como uma seção."""
+    def decorador(funcao):
+        rotulo = nome or f"{funcao.__module__.rsplit('.', 1)[-1]}.{funcao.__qualname__}"
+
+        @functools.wraps(funcao)
+        def medida(*args, **kwargs):
+            if _ativo.get() is None:
+                return funcao(*args, **kwargs)
+            with secao(rotulo):
+                return funcao(*args, **kwargs)
+        return medida
+    return decorador
@@ -0,0 +1,242 @@
+"""Bootstrap e testes de permutação vetorizados e reproduzíveis.
+
+As reamostragens são geradas em blocos como matrizes de índices
+(``blocos x n``) e reduzidas com NumPy, sem loop Python por reamostra. Cada
+bloco tem sua própria semente derivada de ``semente`` via ``SeedSequence``,
+então o resultado é o mesmo em modo serial ou com ``processos > 1``.
+Os blocos só vão para processos a partir de ``MIN_REAMOSTRAS_PARALELO``
+reamostras, num pool do módulo (forkserver ou spawn, nunca fork: o servidor
+do Streamlit tem várias threads) criado na primeira vez e reaproveitado.
+``tempo_max`` limita o tempo total: blocos que não couberem no orçamento são
+descartados e o número efetivo de reamostras é informado no resultado.
+"""
+
+import itertools
+import math
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+TAMANHO_BLOCO = 2000
+
+# Até esse número de arranjos, a permutação é enumerada exatamente
+MAX_PERMUTACOES_EXATAS = 100_000
+
+# Abaixo disso os processos custam mais do que economizam: mesmo com o pool
+# aberto, devolver cada bloco ao processo principal leva ~1 ms (~0,5 µs por
+# reamostra, contra ~1 µs do cálculo)
+MIN_REAMOSTRAS_PARALELO = 200_000
+
+# Pools por número de processos, compartilhados entre sessões
+_lock_pools = threading.Lock()
+_pools = {}
+
+
+def _sementes(semente, n_reamostras):
+    n_blocos = max(1, math.ceil(n_reamostras / TAMANHO_BLOCO))
+    tamanhos = [TAMANHO_BLOCO] * (n_blocos - 1) + [n_reamostras - TAMANHO_BLOCO * (n_blocos - 1)]
+    return list(zip(np.random.SeedSequence(semente).spawn(n_blocos), tamanhos))
+
+
+def _pool(processos):
+    """Pool de ``processos`` processos do módulo, criado na primeira chamada."""
+    with _lock_pools:
+        executor = _pools.get(processos)
+        if executor is None:
+            metodo = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            executor = ProcessPoolExecutor(max_workers=processos, mp_context=multiprocessing.get_context(metodo))
+            _pools[processos] = executor
+        return executor
+
+
+def _descartar_pool(processos, executor):
+    with _lock_pools:
+        if _pools.get(processos) is executor:
+            del _pools[processos]
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _executar(funcao, args, semente, n_reamostras, processos, tempo_max):
+    """Roda ``funcao(semente_bloco, tamanho, *args)`` para cada bloco e concatena."""
+    blocos = _sementes(semente, n_reamostras)
+    limite = time.perf_counter() + tempo_max if tempo_max else None
+
+    if processos and processos > 1 and n_reamostras >= MIN_REAMOSTRAS_PARALELO:
+        executor = _pool(processos)
+        try:
+            futuros = [executor.submit(funcao, s, tamanho, *args) for s, tamanho in blocos]
+        except BrokenProcessPool:
+            # Um processo do pool morreu: o próximo pedido cria outro, este roda em série
+            _descartar_pool(processos, executor)
+        else:
+            try:
+                restante = max(0.0, limite - time.perf_counter()) if limite else None
+                feitos, _ = wait(futuros, timeout=restante)
+                # Como no modo serial, o primeiro bloco sempre entra, mesmo fora do orçamento
+                feitos.add(futuros[0])
+                # Mantém a ordem dos blocos para o resultado não depender do escalonamento
+                return np.concatenate([futuro.result() for futuro in futuros if futuro in feitos])
+            finally:
+                # O pool continua aberto: só os blocos que nem começaram são cancelados
+                for futuro in futuros:
+                    futuro.cancel()
+
+    resultados = []
+    for s, tamanho in blocos:
+        if limite is not None and resultados and time.perf_counter() > limite:
+            break
+        resultados.append(funcao(s, tamanho, *args))
+    return np.concatenate(resultados)
+
+
+def _bloco_bootstrap_estratificado(semente, tamanho, estratos):
+    rng = np.random.default_rng(semente)
+    soma = np.zeros(tamanho)
+    for numerador, denominador in estratos:
+        indices = rng.integers(0, len(numerador), size=(tamanho, len(numerador)))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            soma += numerador[indices].sum(axis=1) / denominador[indices].sum(axis=1)
+    return soma / len(estratos)
+
+
+def bootstrap_media_razoes(estratos, n_reamostras=10_000, confianca=0.95, semente=None,
+                           processos=None, tempo_max=None):
+    """IC bootstrap (percentil) da média, entre estratos, de soma(num)/soma(den).
+
+    ``estratos`` é uma lista de pares de arrays (numerador, denominador), um por
+    estrato (ex.: um por jogador do Top 3, uma linha por partida). Cada estrato é
+    reamostrado separadamente. Com um único estrato e denominador 1, é o
+    bootstrap da média simples.
+    """
+    estratos = [
+        (np.asarray(numerador, dtype="float64"), np.asarray(denominador, dtype="float64"))
+        for numerador, denominador in estratos
+    ]
+    estimativa = np.mean([num.sum() / den.sum() for num, den in estratos])
+    distribuicao = _executar(
+        _bloco_bootstrap_estratificado, (estratos,), semente, n_reamostras, processos, tempo_max
+    )
+    alfa = (1 - confianca) / 2
+    inferior, superior = np.nanquantile(distribuicao, [alfa, 1 - alfa])
+    return {
+        "estimativa": estimativa,
+        "limite_inferior": inferior,
+        "limite_superior": superior,
+        "reamostras": len(distribuicao),
+    }
+
+
+def bootstrap_media(valores, **kwargs):
+    valores = np.asarray(valores, dtype="float64")
+    return bootstrap_media_razoes([(valores, np.ones_like(valores))], **kwargs)
+
+
+def _bloco_permutacao(semente, tamanho, combinado, n_a):
+    rng = np.random.default_rng(semente)
+    permutados = rng.permuted(np.broadcast_to(combinado, (tamanho, len(combinado))), axis=1)
+    return permutados[:, :n_a].mean(axis=1) - permutados[:, n_a:].mean(axis=1)
+
+
+def permutacao_medias(a, b, n_permutacoes=10_000, semente=None, processos=None, tempo_max=None):
+    """p-valor bicaudal de permutação para a diferença de médias entre ``a`` e ``b``.
+
+    Quando o número de arranjos possíveis é pequeno (ex.: Top 3 x Top 3 = 20),
+    todos são enumerados e o p-valor é exato.
+    """
+    a = np.asarray(a, dtype="float64")
+    b = np.asarray(b, dtype="float64")
+    combinado = np.concatenate([a, b])
+    observado = a.mean() - b.mean()
+    # Tolerância para empates numéricos com o valor observado
+    tolerancia = 1e-12 * max(1.0, abs(observado))
+
+    if math.comb(len(combinado), len(a)) <= MAX_PERMUTACOES_EXATAS:
+        grupos_a = np.array(list(itertools.combinations(range(len(combinado)), len(a))))
+        mascara = np.zeros((len(grupos_a), len(combinado)), dtype=bool)
+        np.put_along_axis(mascara, grupos_a, True, axis=1)
+        soma_a = (mascara * combinado).sum(axis=1)
+        diferencas = soma_a / len(a) - (combinado.sum() - soma_a) / len(b)
+        extremos = np.abs(diferencas) >= abs(observado) - tolerancia
+        return {"diferenca": observado, "p_valor": extremos.mean(), "permutacoes": len(diferencas), "exato": True}
+
+    diferencas = _executar(
+        _bloco_permutacao, (combinado, len(a)), semente, n_permutacoes, processos, tempo_max
+    )
+    extremos = np.count_nonzero(np.abs(diferencas) >= abs(observado) - tolerancia)
+    return {
+        "diferenca": observado,
+        "p_valor": (extremos + 1) / (len(diferencas) + 1),
+        "permutacoes": len(diferencas),
+        "exato": False,
+    }
+
+
+def _bloco_hipergeometrico(semente, tamanho, sucessos, fracassos, n_a):
+    rng = np.random.default_rng(semente)
+    return rng.hypergeometric(sucessos, fracassos, n_a, size=tamanho)
+
+
+def permutacao_proporcoes(sucessos_a, n_a, sucessos_b, n_b, n_permutacoes=10_000, semente=None,
+                          processos=None, tempo_max=None):
+    """p-valor bicaudal de permutação para a diferença entre duas proporções.
+
+    Permutar rótulos de dados 0/1 equivale a sortear quantos sucessos caem no
+    grupo A de uma hipergeométrica, então cada permutação custa O(1).
+    """
+    sucessos = int(sucessos_a + sucessos_b)
+    fracassos = int(n_a + n_b) - sucessos
+    observado = sucessos_a / n_a - sucessos_b / n_b
+
+    em_a = _executar(
+        _bloco_hipergeometrico, (sucessos, fracassos, int(n_a)), semente, n_permutacoes, processos, tempo_max
+    )
+    diferencas = em_a / n_a - (sucessos - em_a) / n_b
+    extremos = np.count_nonzero(np.abs(diferencas) >= abs(observado) - 1e-12)
+    return {
+        "diferenca": observado,
+        "p_valor": (extremos + 1) / (len(diferencas) + 1),
+        "permutacoes": len(diferencas),
+        "exato": False,
+    }
+
+
+# Comparações do dashboard
+
+
+def bootstrap_top_eficiencia(df, agregados, ano, n=3, **opcoes):
+    """IC bootstrap da média de gols por minuto dos Top ``n`` de ``ano``.
+
+    Cada jogador do Top ``n`` é um estrato; suas partidas (linhas de ``df`` com
+    minutos jogados) são reamostradas e a razão gols/minutos é recalculada.
+    """
+    jogadas = df[(df["ano"] == ano) & (df["statistics_minutes_played"] > 0)]
+    estratos = []
+    for jogador in agregados.top_eficiencia(ano, n).index:
+        linhas = jogadas[jogadas["player_name"] == jogador]
+        estratos.append((
+            linhas["statistics_goals"].fillna(0).to_numpy(),
+            linhas["statistics_minutes_played"].to_numpy(),
+        ))
+    return bootstrap_media_razoes(estratos, **opcoes)
+
+
+def permutacao_top_gpm(agregados, ano_a, ano_b, n=3, **opcoes):
+    """Permutação entre os Top ``n`` (média de gols por minuto por partida) de dois anos."""
+    n_permutacoes = opcoes.pop("n_reamostras", 10_000)
+    return permutacao_medias(
+        agregados.top_gpm_medio(ano_a, n), agregados.top_gpm_medio(ano_b, n), n_permutacoes, **opcoes
+    )
+
+
+def permutacao_jogos_com_gol(agregados, ano_a, ano_b, **opcoes):
+    """Permutação da proporção de jogos com pelo menos 1 gol entre dois anos."""
+    n_permutacoes = opcoes.pop("n_reamostras", 10_000)
+    partidas_a = agregados.partidas_temporada(ano_a)["fez_gol"]
+    partidas_b = agregados.partidas_temporada(ano_b)["fez_gol"]
+    return permutacao_proporcoes(
+        partidas_a.sum(), len(partidas_a), partidas_b.sum(), len(partidas_b), n_permutacoes, **opcoes
+    )
@@ -0,0 +1,119 @@
+"""Gera os relatórios de todas as temporadas sem servidor Streamlit.
+
+Uso::
+
+    python -m ituano.relatorio --saida relatorios --formatos json html csv
+
+Escreve ``relatorio.json``, ``relatorio.html`` e um CSV por tabela
+(``<tabela>.csv``) no diretório de saída.
+"""
+
+import argparse
+import json
+import os
+import time
+
+from ituano import analise, dados
+
+FORMATOS = ("json", "html", "csv")
+
+# Tabelas globais exportadas em CSV
+TABELAS_CSV = [
+    "comparacoes", "projecao_10_partidas", "testes_top3", "testes_jogos_com_gol", "tendencias", "jogadores_temporada",
+]
+# Tabelas cujo índice (jogador-temporada, métrica) faz parte do dado
+TABELAS_COM_INDICE = {"tendencias", "jogadores_temporada"}
+
+
+def escrever_json(resultado, caminho):
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump(analise.para_json(resultado), arquivo, ensure_ascii=False, indent=2)
+
+
+def escrever_csv(resultado, diretorio):
+    caminhos = []
+    for nome in TABELAS_CSV:
+        caminho = os.path.join(diretorio, f"{nome}.csv")
+        resultado[nome].to_csv(caminho, index=nome in TABELAS_COM_INDICE)
+        caminhos.append(caminho)
+    return caminhos
+
+
+def _tabela_html(tabela, formato="{:.4f}"):
+    if hasattr(tabela, "to_frame"):
+        tabela = tabela.to_frame()
+    return tabela.to_html(float_format=formato.format, border=0, classes="tabela")
+
+
+def escrever_html(resultado, caminho):
+    partes = [
+        "<!doctype html><html lang='pt-br'><head><meta charset='utf-8'>",
+        "<title>Relatório de Desempenho - Ituano</title>",
+        "<style>body{font-family:sans-serif;margin:2rem}.tabela{border-collapse:collapse;margin:.5rem 0 1.5rem}"
+        ".tabela td,.tabela th{padding:.25rem .75rem;border-bottom:1px solid #ddd;text-align:right}</style>",
+        "</head><body><h1>Relatório de Desempenho - Ituano</h1>",
+    ]
+    for ano, temporada in resultado["temporadas"].items():
+        inferior, superior = temporada["ic_gols_por_jogador"]
+        top_inferior, top_superior = temporada["ic_top3_gols_por_minuto"]
+        partes += [
+            f"<h2>Temporada {ano}</h2>",
+            f"<p><b>Média de gols por jogador:</b> {temporada['media_gols_por_jogador']:.2f} "
+            f"(IC 95%: {inferior:.2f} a {superior:.2f})</p>",
+            f"<p><b>Jogos com pelo menos 1 gol:</b> {temporada['proporcao_jogos_com_gol']:.1%} "
+            f"de {temporada['partidas']} partidas</p>",
+            "<h3>Top 5 artilheiros</h3>", _tabela_html(temporada["artilheiros"], "{:.0f}"),
+            "<h3>Top 3 por gols por minuto</h3>", _tabela_html(temporada["top3_eficiencia"]),
+            f"<p>IC 95% da média de gols por minuto do Top 3: {top_inferior:.4f} a {top_superior:.4f}</p>",
+            "<h3>Passes certos</h3>", _tabela_html(temporada["passes"]["mais_passes"], "{:.0f}"),
+            "<h3>Acerto de passe</h3>", _tabela_html(temporada["passes"]["melhor_acerto"]),
+        ]
+    tendencia = resultado["tendencia"]
+    partes += [
+        "<h2>Comparação entre anos (Top 3)</h2>", _tabela_html(resultado["comparacoes"]),
+        "<h2>Testes t de Welch (Top 3, todos os pares de anos)</h2>", _tabela_html(resultado["testes_top3"]),
+        "<h2>Testes z de proporção de jogos com gol</h2>", _tabela_html(resultado["testes_jogos_com_gol"]),
+        "<h2>Expectativa de gols em 10 partidas</h2>", _tabela_html(resultado["projecao_10_partidas"], "{:.2f}"),
+        f"<h2>Tendência</h2><p>Inclinação: {tendencia['inclinacao_por_ano']:.6f} gols/minuto por ano "
+        f"({tendencia['atuacoes']} atuações).</p>",
+        "<h3>Tendência anual por métrica</h3>", _tabela_html(resultado["tendencias"], "{:.4g}"),
+        "</body></html>",
+    ]
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        arquivo.write("\n".join(partes))
+
+
+def gerar(caminho_csv=dados.CSV_PADRAO, saida="relatorios", formatos=FORMATOS):
+    """Calcula o relatório de todas as temporadas e grava os formatos pedidos."""
+    os.makedirs(saida, exist_ok=True)
+    df, agregados = analise.carregar(caminho_csv)
+    resultado = analise.relatorio(df, agregados)
+
+    arquivos = []
+    if "json" in formatos:
+        arquivos.append(os.path.join(saida, "relatorio.json"))
+        escrever_json(resultado, arquivos[-1])
+    if "html" in formatos:
+        arquivos.append(os.path.join(saida, "relatorio.html"))
+        escrever_html(resultado, arquivos[-1])
+    if "csv" in formatos:
+        arquivos += escrever_csv(resultado, saida)
+    return arquivos
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--csv", default=dados.CSV_PADRAO, help="CSV de partidas")
+    parser.add_argument("--saida", default="relatorios", help="diretório de saída")
+    parser.add_argument("--formatos", nargs="+", choices=FORMATOS, default=list(FORMATOS))
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    arquivos = gerar(args.csv, args.saida, args.formatos)
+    for arquivo in arquivos:
+        print(arquivo)
+    print(f"{len(arquivos)} arquivos gerados em {time.perf_counter() - inicio:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
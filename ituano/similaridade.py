@@ -0,0 +1,172 @@
+"""Busca de jogadores semelhantes por estatísticas por 90 minutos.
+
+Cada jogador-temporada com minutos suficientes vira um vetor com as
+contagens ``statistics_*`` por 90 minutos (e a nota média), padronizado por
+z-score sobre todo o conjunto. A busca é exata e vetorizada: uma
+multiplicação matriz-vetor sobre a matriz em ``float32`` (cosseno) ou a
+identidade ``|x - q|² = |x|² - 2 x·q + |q|²`` com as normas pré-calculadas
+(euclidiana), seguida de ``argpartition``.
+
+O índice guarda as somas por jogador-temporada e a versão de cada
+temporada. ``atualizar`` relê e reagrega só as temporadas cuja versão mudou
+(ver ``agregados.SomasPorTemporada``); média, desvio e normas são recalculados a partir
+das somas numa única operação vetorizada.
+"""
+
+import numpy as np
+import pandas as pd
+
+from ituano.agregados import SomasPorTemporada
+
+# Contagens por partida usadas como atributos. Ficam de fora os minutos (base
+# do "por 90"), a nota (entra como média), as disputas de pênaltis e eventos
+# raros demais (um gol contra isolado dominaria a distância após o z-score).
+EVENTOS_RAROS = [
+    "statistics_hit_woodwork", "statistics_clearance_off_line", "statistics_penalty_conceded",
+    "statistics_penalty_won", "statistics_error_lead_to_a_goal", "statistics_penalty_miss",
+    "statistics_own_goals", "statistics_penalty_save", "statistics_error_lead_to_a_shot",
+    "statistics_last_man_tackle",
+]
+ATRIBUTOS = [
+    "statistics_total_pass", "statistics_accurate_pass", "statistics_total_long_balls",
+    "statistics_accurate_long_balls", "statistics_duel_won", "statistics_total_clearance",
+    "statistics_was_fouled", "statistics_saved_shots_from_inside_the_box", "statistics_saves",
+    "statistics_touches", "statistics_possession_lost_ctrl", "statistics_total_cross",
+    "statistics_accurate_cross", "statistics_aerial_lost", "statistics_duel_lost", "statistics_total_contest",
+    "statistics_won_contest", "statistics_interception_won", "statistics_fouls", "statistics_key_pass",
+    "statistics_aerial_won", "statistics_challenge_lost", "statistics_total_tackle",
+    "statistics_blocked_scoring_attempt", "statistics_outfielder_block", "statistics_dispossessed",
+    "statistics_on_target_scoring_attempt", "statistics_goals", "statistics_shot_off_target",
+    "statistics_goal_assist", "statistics_big_chance_created", "statistics_total_offside",
+    "statistics_big_chance_missed", "statistics_punches", "statistics_good_high_claim",
+    "statistics_total_keeper_sweeper", "statistics_accurate_keeper_sweeper", "statistics_expected_goals",
+    "statistics_expected_assists",
+]
+NOTA = "statistics_rating"
+COLUNAS_SIMILARIDADE = ["ano", "player_name", "statistics_minutes_played", NOTA] + ATRIBUTOS
+
+METRICAS_DISTANCIA = ("cosseno", "euclidiana")
+
+# Abaixo disso o "por 90" é ruído demais para comparar jogadores
+MINIMO_MINUTOS = 270
+
+
+def somas_temporada(df):
+    """Somas por jogador-temporada: minutos, atributos e nota (soma e contagem).
+
+    Atributos não registrados numa temporada (nenhum valor na temporada
+    inteira, como xG antes de 2025) ficam NaN; nas demais, NA conta como zero.
+    """
+    jogou = df[df["statistics_minutes_played"] > 0]
+    grupos = jogou.groupby(["ano", "player_name"], observed=True)
+    somas = grupos[["statistics_minutes_played"] + ATRIBUTOS].sum().astype("float64")
+    somas["nota_soma"] = grupos[NOTA].sum().astype("float64")
+    somas["nota_n"] = grupos[NOTA].count()
+
+    registrados = jogou.groupby("ano", observed=True)[ATRIBUTOS].count() > 0
+    anos = somas.index.get_level_values("ano")
+    somas[ATRIBUTOS] = somas[ATRIBUTOS].where(registrados.reindex(anos).to_numpy())
+    return somas.rename(columns={"statistics_minutes_played": "minutos"})
+
+
+def _consultar(estado, posicao, k, metrica):
+    k = min(k, len(estado["chaves"]) - 1)
+    if k <= 0:
+        return np.array([], dtype=int), np.array([])
+    if metrica == "cosseno":
+        pontuacao = estado["unitaria"] @ estado["unitaria"][posicao]
+        pontuacao[posicao] = -np.inf
+        melhores = np.argpartition(-pontuacao, k)[:k]
+        melhores = melhores[np.argsort(-pontuacao[melhores])]
+    elif metrica == "euclidiana":
+        consulta = estado["matriz"][posicao]
+        pontuacao = estado["normas_quadradas"] - 2 * (estado["matriz"] @ consulta) + estado["normas_quadradas"][posicao]
+        pontuacao[posicao] = np.inf
+        melhores = np.argpartition(pontuacao, k)[:k]
+        melhores = melhores[np.argsort(pontuacao[melhores])]
+        pontuacao = np.sqrt(np.maximum(pontuacao, 0))
+    else:
+        raise ValueError(f"métrica desconhecida: {metrica!r} (use {', '.join(METRICAS_DISTANCIA)})")
+    return melhores, pontuacao[melhores]
+
+
+class IndiceSimilaridade(SomasPorTemporada):
+    """Índice de vizinhos mais próximos sobre jogador-temporada."""
+
+    COLUNAS = COLUNAS_SIMILARIDADE
+
+    def __init__(self, minimo_minutos=MINIMO_MINUTOS):
+        self.minimo_minutos = minimo_minutos
+        self._estado = None
+        super().__init__()
+
+    def somar(self, df):
+        """Somas por jogador-temporada (ver ``somas_temporada``)."""
+        return somas_temporada(df)
+
+    def _montar(self):
+        self._estado = self._indexar(self._somas[self._somas["minutos"] >= self.minimo_minutos])
+
+    def _indexar(self, somas):
+
+        por90 = somas[ATRIBUTOS].div(somas["minutos"], axis=0) * 90
+        por90[NOTA] = somas["nota_soma"] / somas["nota_n"].where(somas["nota_n"] > 0)
+        media = por90.mean()
+        desvio = por90.std(ddof=0)
+        # Atributos constantes (ou nunca registrados) não distinguem ninguém
+        usados = desvio.index[desvio > 0]
+        padronizado = ((por90[usados] - media[usados]) / desvio[usados]).fillna(0.0)
+
+        matriz = np.ascontiguousarray(padronizado.to_numpy(dtype="float32"))
+        normas = np.linalg.norm(matriz, axis=1)
+        return {
+            "chaves": somas.index,
+            "minutos": somas["minutos"].to_numpy(),
+            "por90": por90,
+            "atributos": list(usados),
+            "matriz": matriz,
+            "normas_quadradas": normas ** 2,
+            "unitaria": matriz / np.where(normas > 0, normas, 1.0)[:, None],
+        }
+
+    def __len__(self):
+        return 0 if self._estado is None else len(self._estado["chaves"])
+
+    def chaves(self):
+        """Índice (``ano``, ``player_name``) dos jogadores-temporada indexados."""
+        return self._estado["chaves"]
+
+    def por90(self):
+        """Atributos por 90 (antes da padronização) de cada jogador-temporada."""
+        return self._estado["por90"]
+
+    def consultar(self, posicao, k=10, metrica="cosseno"):
+        """Os ``k`` vizinhos do item na ``posicao``: (posições, pontuações).
+
+        Cosseno: pontuação é a similaridade (maior = mais parecido).
+        Euclidiana: pontuação é a distância (menor = mais parecido).
+        """
+        return _consultar(self._estado, posicao, k, metrica)
+
+    def semelhantes(self, jogador, ano, k=10, metrica="cosseno", outros_jogadores=False):
+        """Tabela dos ``k`` jogadores-temporada mais parecidos com ``jogador`` em ``ano``.
+
+        Com ``outros_jogadores=True`` as demais temporadas do próprio jogador
+        são descartadas.
+        """
+        estado = self._estado
+        chaves = estado["chaves"]
+        posicao = chaves.get_loc((ano, jogador))
+        nomes = chaves.get_level_values("player_name")
+        extras = int((nomes == jogador).sum()) - 1 if outros_jogadores else 0
+        melhores, pontuacao = _consultar(estado, posicao, k + extras, metrica)
+        coluna = "similaridade" if metrica == "cosseno" else "distancia"
+        tabela = pd.DataFrame({
+            "ano": chaves.get_level_values("ano")[melhores],
+            "player_name": nomes[melhores],
+            "minutos": estado["minutos"][melhores],
+            coluna: pontuacao,
+        })
+        if outros_jogadores:
+            tabela = tabela[tabela["player_name"] != jogador]
+        return tabela.head(k).reset_index(drop=True)
@@ -0,0 +1,154 @@
+"""Tendências por temporada das métricas de eficiência (mínimos quadrados fechados).
+
+Cada métrica é ajustada como ``y = intercepto + inclinacao x ano`` sobre
+todas as atuações em que ela existe. Como ``x`` (o ano) é constante dentro
+da temporada, o ajuste depende só de ``n``, ``Σy`` e ``Σy²`` de cada
+temporada: as estatísticas suficientes. O modelo guarda essas somas por
+temporada e por versão; ``atualizar`` relê só as temporadas cuja versão
+mudou (ver ``agregados.SomasPorTemporada``) e o ajuste de todas as métricas é uma conta
+vetorizada sobre a tabela temporada x métrica, sem reler as atuações.
+"""
+
+import numpy as np
+import pandas as pd
+
+from ituano import metricas
+from ituano.agregados import SomasPorTemporada
+from ituano.importacoes import importar
+
+METRICAS_TENDENCIA = ["gols_por_minuto", "pass_accuracy", "xg_p90", "nota"]
+
+ROTULOS_TENDENCIA = {
+    "gols_por_minuto": "Gols por minuto",
+    "pass_accuracy": "Acerto de passe",
+    "xg_p90": "xG por 90",
+    "nota": "Nota",
+}
+
+COLUNAS_TENDENCIA = [
+    "ano", "statistics_goals", "statistics_minutes_played", "statistics_accurate_pass", "statistics_total_pass",
+    "statistics_expected_goals", "statistics_rating",
+]
+
+CONFIANCA = 0.95
+
+
+def observacoes(df):
+    """Valor de cada métrica por atuação (NaN onde a métrica não se aplica).
+
+    Só contam atuações com minutos jogados; gols por minuto exige gols
+    registrados, como na regressão original do dashboard.
+    """
+    minutos = df["statistics_minutes_played"].to_numpy(dtype="float64", na_value=np.nan)
+    jogou = minutos > 0
+    xg = df["statistics_expected_goals"].to_numpy(dtype="float64", na_value=np.nan)
+    nota = df["statistics_rating"].to_numpy(dtype="float64", na_value=np.nan)
+    valores = pd.DataFrame({
+        "ano": df["ano"].to_numpy(),
+        "gols_por_minuto": metricas.gols_por_minuto(df).to_numpy(),
+        "pass_accuracy": metricas.pass_accuracy(df).to_numpy(),
+        "xg_p90": 90 * xg / np.where(jogou, minutos, np.nan),
+        "nota": nota,
+    }, index=df.index)
+    valores.loc[~jogou, METRICAS_TENDENCIA] = np.nan
+    return valores
+
+
+def somas_temporada(obs):
+    """Estatísticas suficientes por temporada: colunas (``n``/``soma``/``soma_quadrados``, métrica)."""
+    anos = obs["ano"].astype("int64")
+    valores = obs[METRICAS_TENDENCIA]
+    partes = {
+        "n": valores.groupby(anos).count(),
+        "soma": valores.groupby(anos).sum(),
+        "soma_quadrados": (valores ** 2).groupby(anos).sum(),
+    }
+    return pd.concat(partes, axis=1).astype("float64").rename_axis("ano")
+
+
+def ajustar(somas, confianca=CONFIANCA):
+    """Ajusta todas as métricas de uma vez a partir de ``somas_temporada``.
+
+    Retorna uma linha por métrica com inclinação, intercepto, erro padrão e
+    IC da inclinação, p-valor (H0: inclinação = 0), R² e os termos usados
+    por ``faixa``. Métricas com menos de duas temporadas ficam com NaN.
+    """
+    stats = importar("scipy.stats")
+
+    anos = somas.index.to_numpy(dtype="float64")[:, None]
+    n = somas["n"].to_numpy()
+    soma = somas["soma"].to_numpy()
+    total = n.sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        media_ano = (n * anos).sum(axis=0) / total
+        media = soma.sum(axis=0) / total
+        desvio_ano = anos - media_ano
+        sxx = (n * desvio_ano ** 2).sum(axis=0)
+        sxy = (desvio_ano * soma).sum(axis=0)
+        syy = somas["soma_quadrados"].to_numpy().sum(axis=0) - total * media ** 2
+        valido = sxx > 0
+        inclinacao = np.where(valido, sxy / sxx, np.nan)
+        graus = total - 2
+        residuo = np.where(graus > 0, np.maximum(syy - inclinacao * sxy, 0.0) / graus, np.nan)
+        erro_padrao = np.sqrt(residuo / sxx)
+        t = stats.t.ppf(0.5 + confianca / 2, np.where(graus > 0, graus, np.nan))
+        p_valor = 2 * stats.t.sf(np.abs(inclinacao / erro_padrao), np.where(graus > 0, graus, np.nan))
+        r2 = np.where(syy > 0, inclinacao * sxy / syy, np.nan)
+
+    return pd.DataFrame({
+        "atuacoes": total.astype("int64"),
+        "temporadas": (n > 0).sum(axis=0),
+        "inclinacao": inclinacao,
+        "intercepto": media - inclinacao * media_ano,
+        "erro_padrao_inclinacao": erro_padrao,
+        "ic_inclinacao_inferior": inclinacao - t * erro_padrao,
+        "ic_inclinacao_superior": inclinacao + t * erro_padrao,
+        "p_valor": p_valor,
+        "r2": r2,
+        "media_ano": media_ano,
+        "sxx": sxx,
+        "variancia_residual": residuo,
+        "t": t,
+    }, index=pd.Index(list(somas["n"].columns), name="metrica"))
+
+
+def faixa(coeficientes, metrica, anos):
+    """Reta ajustada e faixa de confiança da média de ``metrica`` em cada um dos ``anos``."""
+    c = coeficientes.loc[metrica]
+    anos = np.asarray(anos, dtype="float64")
+    previsao = c["intercepto"] + c["inclinacao"] * anos
+    margem = c["t"] * np.sqrt(c["variancia_residual"] * (1 / c["atuacoes"] + (anos - c["media_ano"]) ** 2 / c["sxx"]))
+    return pd.DataFrame({
+        "ano": anos.astype("int64"),
+        "previsao": previsao,
+        "inferior": previsao - margem,
+        "superior": previsao + margem,
+    })
+
+
+class ModeloTendencias(SomasPorTemporada):
+    """Tendências de ``METRICAS_TENDENCIA``, atualizadas por temporada."""
+
+    COLUNAS = COLUNAS_TENDENCIA
+
+    def __init__(self, confianca=CONFIANCA):
+        self.confianca = confianca
+        self._coeficientes = None
+        super().__init__()
+
+    def somar(self, df):
+        """Estatísticas suficientes por temporada (ver ``somas_temporada``)."""
+        return somas_temporada(observacoes(df))
+
+    def _montar(self):
+        self._coeficientes = ajustar(self._somas, self.confianca)
+
+    def coeficientes(self):
+        """Coeficientes de todas as métricas (ver ``ajustar``)."""
+        return self._coeficientes
+
+    def faixa(self, metrica, anos=None):
+        """Reta e faixa de confiança de ``metrica`` nos ``anos`` (padrão: temporadas com a métrica)."""
+        if anos is None:
+            anos = self._somas.index[self._somas[("n", metrica)] > 0]
+        return faixa(self._coeficientes, metrica, anos)
@@ -0,0 +1 @@
+"""Páginas do dashboard. Cada módulo expõe ``DEPENDENCIAS`` e ``render()``."""
@@ -0,0 +1,233 @@
+"""Dados compartilhados pelas páginas do dashboard."""
+
+import contextlib
+import json
+import os
+import time
+
+import pandas as pd
+import streamlit as st
+
+from ituano import dataset, graficos, perfil, reamostragem
+
+csv_path = "dados-completos-Ituano.csv"
+
+# Diretório com CSVs de vários clubes/temporadas; sem ele, usa o CSV único
+diretorio_dataset = os.environ.get("ITUANO_DATASET")
+
+# Intervalo (s) entre verificações de novos dados em cada sessão aberta
+INTERVALO_ATUALIZACAO = 5
+
+# Perfil de execução ligado por padrão (ITUANO_PERFIL=1); sem isso, só pela sidebar
+PERFIL_PADRAO = os.environ.get("ITUANO_PERFIL", "") not in ("", "0")
+# Reruns medidos guardados na sessão para o painel e a exportação
+HISTORICO_PERFIL = 50
+
+# Colunas efetivamente usadas pelo dashboard
+COLUNAS_GOLS = ["ano", "player_name", "statistics_goals", "statistics_minutes_played"]
+COLUNAS_PASSES = ["statistics_accurate_pass", "statistics_total_pass"]
+COLUNAS_PLACAR = ["home_or_away", "home_score", "away_score"]
+COLUNAS_DASHBOARD = COLUNAS_GOLS + COLUNAS_PASSES + COLUNAS_PLACAR
+
+
+class Dependencias:
+    """Dados de que uma página precisa.
+
+    Só as colunas declaradas são lidas, e apenas quando a página é renderizada.
+    ``versao()`` é usada como chave dos caches da página: se os dados não
+    mudaram, nada é recalculado.
+    """
+
+    def __init__(self, colunas=(), usa_agregados=False):
+        self.colunas = list(colunas)
+        self.usa_agregados = usa_agregados
+
+    def versao(self, anos=None):
+        """Versão dos dados; com ``anos``, só dessas temporadas."""
+        if not self.colunas and not self.usa_agregados:
+            return None
+        return fonte().versao(anos)
+
+    def dados(self, anos=None):
+        """Linhas com as métricas derivadas, restritas às colunas declaradas."""
+        with perfil.secao("leitura de dados"):
+            return fonte().dados(self.colunas, anos=anos)
+
+    def agregados(self):
+        with perfil.secao("agregados"):
+            return fonte().agregados()
+
+    def anos(self):
+        return fonte().anos()
+
+    def versoes_anos(self):
+        """``{ano: versao}`` de cada temporada disponível."""
+        return fonte().versoes_anos()
+
+    def incremental(self, classe):
+        """Instância de ``classe`` (``agregados.SomasPorTemporada``) da fonte ativa, em dia com os dados.
+
+        A instância é mantida entre versões: só as temporadas novas ou
+        alteradas são relidas (com as colunas declaradas aqui).
+        """
+        modelo = _incremental(classe, fonte().chave())
+        with perfil.secao(f"{classe.__name__}.atualizar"):
+            modelo.atualizar(self.versoes_anos(), lambda anos: self.dados(anos=anos))
+        return modelo
+
+
+# Uma instância por classe e fonte de dados, compartilhada entre sessões
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _incremental(classe, chave_fonte):
+    return classe()
+
+
+def fonte():
+    """Fonte de dados ativa: o CSV único ou o recorte escolhido do dataset."""
+    if not diretorio_dataset:
+        return dataset.FonteCSV(csv_path)
+    selecao = st.session_state.get("selecao_dataset")
+    base = dataset.abrir(diretorio_dataset)
+    if selecao is None:
+        clubes = base.clubes()
+        selecao = dataset.Selecao(clubes[0] if clubes else None)
+    return dataset.FonteDataset(base, selecao)
+
+
+@st.fragment(run_every=INTERVALO_ATUALIZACAO)
+def acompanhar_versao():
+    """Reexecuta a página quando os dados mudam (ex.: após ``python -m ituano.ingestao``).
+
+    Roda como fragmento periódico: a verificação custa um ``stat`` do CSV e
+    só dispara um rerun completo se a versão mudou. Os caches das temporadas
+    não afetadas continuam válidos.
+    """
+    versao = fonte().versao()
+    anterior = st.session_state.get("versao_dados")
+    st.session_state["versao_dados"] = versao
+    if anterior is not None and anterior != versao:
+        st.rerun()
+
+
+def seletor_dataset():
+    """Filtros de clube, temporadas e torneios na sidebar (modo dataset).
+
+    A seleção fica em ``st.session_state["selecao_dataset"]`` e é aplicada na
+    leitura: só as partições e torneios escolhidos saem do disco.
+    """
+    if not diretorio_dataset:
+        return None
+    base = dataset.abrir(diretorio_dataset)
+    with st.sidebar.expander("🏟️ Clube e temporadas", expanded=True):
+        clubes = base.clubes()
+        if not clubes:
+            st.warning(f"Nenhum CSV encontrado em {diretorio_dataset}")
+            return None
+        clube = st.selectbox("Clube", clubes, key="dataset_clube")
+        anos = st.multiselect("Temporadas", base.anos(clube), key="dataset_anos", placeholder="Todas")
+        torneios = st.multiselect(
+            "Torneios", base.torneios(clube, anos), key="dataset_torneios", placeholder="Todos")
+        # Nenhuma temporada marcada é o mesmo que todas
+        selecao = dataset.Selecao(clube, anos or None, torneios)
+        st.caption(f"{base.linhas(selecao):,} linhas selecionadas")
+    st.session_state["selecao_dataset"] = selecao
+    return selecao
+
+
+def plotly(grafico, parametros, versao, construir, **kwargs):
+    """Exibe uma figura Plotly vinda do cache de figuras do processo."""
+    inicio = time.perf_counter()
+    with perfil.secao(f"gráfico {grafico}"):
+        figura = graficos.cache.obter(versao, grafico, parametros, perfil.medir("construção")(construir))
+        with perfil.secao("envio"):
+            st.plotly_chart(figura, **kwargs)
+    graficos.cache.registrar_render(grafico, time.perf_counter() - inicio)
+
+
+def imagem(grafico, parametros, versao, construir_png):
+    """Exibe um gráfico matplotlib já renderizado em PNG e guardado em cache."""
+    inicio = time.perf_counter()
+    with perfil.secao(f"gráfico {grafico}"):
+        png = graficos.cache.obter(versao, grafico, parametros, perfil.medir("construção")(construir_png))
+        with perfil.secao("envio"):
+            st.image(png)
+    graficos.cache.registrar_render(grafico, time.perf_counter() - inicio)
+
+
+def opcoes_reamostragem():
+    """Controles do modo bootstrap/permutação na sidebar.
+
+    Retorna ``None`` com o modo desligado, ou os parâmetros de reamostragem.
+    """
+    with st.sidebar.expander("🎲 Reamostragem"):
+        if not st.toggle("Bootstrap e permutação", key="reamostragem_ativa"):
+            return None
+        return {
+            "n_reamostras": st.select_slider(
+                "Reamostras", [1_000, 10_000, 50_000, 100_000, 500_000, 1_000_000], value=10_000,
+                key="reamostragem_n"),
+            "semente": int(st.number_input("Semente", min_value=0, value=42, step=1, key="reamostragem_semente")),
+            "tempo_max": st.slider(
+                "Tempo máximo por comparação (s)", 0.1, 5.0, 1.0, step=0.1, key="reamostragem_tempo"),
+            "processos": int(st.number_input(
+                "Processos", min_value=1, max_value=os.cpu_count() or 1, value=1, key="reamostragem_processos",
+                help=f"Usados a partir de {reamostragem.MIN_REAMOSTRAS_PARALELO:,} reamostras; abaixo disso, em série.")),
+        }
+
+
+@contextlib.contextmanager
+def perfilar():
+    """Mede o rerun inteiro quando o perfil está ligado na sidebar.
+
+    Produz o ``Perfil`` do rerun (ou ``None``). Ao final do bloco o painel
+    mostra as seções (``perfil.secao``) e o histórico da sessão, exportável
+    em JSON e CSV.
+    """
+    with st.sidebar.expander("🩺 Perfil de execução"):
+        ativo = st.toggle("Medir cada rerun", value=PERFIL_PADRAO, key="perfil_ativo")
+        memoria = st.toggle(
+            "Pico de memória", value=True, key="perfil_memoria", disabled=not ativo,
+            help="tracemalloc: alocações do Python e do NumPy; deixa o rerun mais lento",
+        )
+        painel = st.container()
+    if not ativo:
+        yield None
+        return
+
+    medicao = perfil.Perfil(memoria=memoria)
+    with medicao.execucao():
+        yield medicao
+
+    historico = st.session_state.setdefault("perfil_historico", [])
+    historico.append({"instante": time.strftime("%Y-%m-%d %H:%M:%S"), **medicao.resumo()})
+    del historico[:-HISTORICO_PERFIL]
+    _painel_perfil(painel, medicao, historico)
+
+
+def _painel_perfil(painel, medicao, historico):
+    with painel:
+        total, pico, rss = st.columns(3)
+        total.metric("Rerun", f"{medicao.duracao * 1000:.0f} ms")
+        pico.metric("Pico", f"{medicao.pico_mb:.1f} MB" if medicao.memoria_medida else "—")
+        rss.metric("RSS máx.", f"{medicao.rss_pico_mb:.0f} MB")
+        if medicao.memoria and not medicao.memoria_medida:
+            st.caption("Outra execução estava medindo memória: neste rerun, só o RSS do processo.")
+        st.dataframe(medicao.tabela(), hide_index=True, column_config={
+            "ms": st.column_config.NumberColumn(format="%.1f"),
+            "pico_mb": st.column_config.NumberColumn("pico (MB)", format="%.2f"),
+        })
+        if len(historico) > 1:
+            st.caption("Duração dos últimos reruns (ms)")
+            st.line_chart([execucao["ms"] for execucao in historico], height=120)
+        linhas = [
+            {"instante": execucao["instante"], "pagina": execucao["nome"], **secao}
+            for execucao in historico for secao in execucao["secoes"]
+        ]
+        exportar_json, exportar_csv = st.columns(2)
+        exportar_json.download_button(
+            "JSON", json.dumps(historico, ensure_ascii=False, indent=2), "perfil.json", "application/json",
+            key="perfil_json",
+        )
+        exportar_csv.download_button(
+            "CSV", pd.DataFrame(linhas).to_csv(index=False), "perfil.csv", "text/csv", key="perfil_csv",
+        )
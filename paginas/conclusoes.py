@@ -0,0 +1,231 @@
+"""Conclusões: destaques por temporada, tendência e projeção de gols."""
+
+import streamlit as st
+
+from ituano import analise, graficos, perfil, reamostragem, tendencias
+from ituano.importacoes import importar
+from paginas import comum
+from paginas.comum import COLUNAS_GOLS, Dependencias
+
+DEPENDENCIAS = Dependencias(
+    COLUNAS_GOLS + [coluna for coluna in tendencias.COLUNAS_TENDENCIA if coluna not in COLUNAS_GOLS],
+    usa_agregados=True,
+)
+
+
+@st.cache_data(show_spinner=False)
+@perfil.medir()
+def _destaques(versao):
+    # IC do Top 3 de todas as temporadas de uma vez
+    return analise.destaques_por_ano(DEPENDENCIAS.agregados(), 3)
+
+
+@st.cache_data(show_spinner=False)
+@perfil.medir()
+def _bootstrap_destaques(versao, opcoes):
+    ag = DEPENDENCIAS.agregados()
+    df = DEPENDENCIAS.dados()
+    return {ano: reamostragem.bootstrap_top_eficiencia(df, ag, ano, 3, **opcoes) for ano in ag.anos}
+
+
+@st.cache_data(show_spinner=False)
+@perfil.medir()
+def _observacoes(versao):
+    # Valor de cada métrica por atuação, só para as caixas do gráfico
+    return tendencias.observacoes(DEPENDENCIAS.dados())
+
+
+def _figura_tendencia(observacoes, metrica, faixa):
+    Figure = importar("matplotlib.figure").Figure
+    sns = importar("seaborn")
+
+    valores = observacoes.dropna(subset=[metrica])
+    anos = sorted(valores["ano"].unique())
+    # Caixas ficam nas posições 0..n-1; a reta é desenhada nas mesmas posições
+    posicoes = [anos.index(ano) for ano in faixa["ano"]]
+
+    # Figure avulsa (fora do pyplot): não fica registrada globalmente e é
+    # liberada assim que o PNG é gerado
+    fig3 = Figure(figsize=(8, 5))
+    ax3 = fig3.subplots()
+    sns.boxplot(x="ano", y=metrica, data=valores, order=anos, ax=ax3)
+    ax3.fill_between(posicoes, faixa["inferior"], faixa["superior"], color='red', alpha=0.15, label='IC 95% da Tendência')
+    ax3.plot(posicoes, faixa["previsao"], color='red', linestyle='--', label='Tendência Linear')
+    ax3.set_ylabel(tendencias.ROTULOS_TENDENCIA[metrica])
+    ax3.set_title(f'Tendência Geral: {tendencias.ROTULOS_TENDENCIA[metrica]} (Todos os Jogadores em Campo)')
+    ax3.legend()
+    return graficos.png_matplotlib(fig3)
+
+
+def _figura_expectativa(comparacoes_df):
+    go = importar("plotly.graph_objects")
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        x=comparacoes_df["ano"],
+        y=comparacoes_df["gols_esperados_inferior"],
+        name='Mínimo Esperado (IC 95%)',
+        marker_color='rgb(199, 0, 57)'
+    ))
+
+    fig.add_trace(go.Bar(
+        x=comparacoes_df["ano"],
+        y=comparacoes_df["gols_esperados_media"] - comparacoes_df["gols_esperados_inferior"],
+        name='Esperado Médio',
+        marker_color='rgb(255, 195, 0)'
+    ))
+
+    fig.add_trace(go.Bar(
+        x=comparacoes_df["ano"],
+        y=comparacoes_df["gols_esperados_superior"] - comparacoes_df["gols_esperados_media"],
+        name='Máximo Esperado (IC 95%)',
+        marker_color='rgb(144, 238, 144)'
+    ))
+
+    fig.update_layout(
+        barmode='stack',
+        title='Expectativa de Gols para 10 Partidas dos Top 3 Jogadores (por Ano)',
+        xaxis_title='Ano',
+        yaxis_title='Gols Esperados em 10 Partidas',
+        template='plotly_white',
+        height=500
+    )
+    return fig
+
+
+def render():
+    st.header("Conclusões Gerais da Análise")
+    st.markdown("""
+    Com base nos dados analisados ao longo dos anos, é possível obter uma visão mais clara do desempenho ofensivo dos jogadores do Ituano e entender como isso impacta nos resultados do time.
+
+    ### ✅ Melhores Jogadores por Eficiência (Gols por Minuto Jogado)
+    """)
+
+    versao = DEPENDENCIAS.versao()
+    destaques, comparacoes_df = _destaques(versao)
+    opcoes = comum.opcoes_reamostragem()
+    bootstrap = _bootstrap_destaques(versao, opcoes) if opcoes else {}
+
+    for ano, top_ano, intervalo in destaques:
+        st.subheader(f"Destaques de {ano}")
+
+        st.markdown("**Top 3 Jogadores com Maior Eficiência Ofensiva:**")
+        st.dataframe(top_ano.style.format({
+            "statistics_goals": "{:.0f}",
+            "statistics_minutes_played": "{:.0f}",
+            "gols_por_minuto": "{:.4f}"
+        }))
+
+        st.markdown(f"**Intervalo de Confiança (95%) da média de gols por minuto:** ({intervalo[0]:.4f}, {intervalo[1]:.4f})")
+        if ano in bootstrap:
+            ic = bootstrap[ano]
+            st.markdown(
+                f"**Intervalo bootstrap (95%, {ic['reamostras']:,} reamostras das partidas):** "
+                f"({ic['limite_inferior']:.4f}, {ic['limite_superior']:.4f})"
+            )
+
+        st.markdown(f"""
+        Com esses dados, podemos estimar que, considerando a média de gols por minuto dos três jogadores mais eficientes de {ano}, caso cada um deles atue por 90 minutos em uma partida, o time poderia esperar algo entre **{intervalo[0]*90:.2f}** e **{intervalo[1]*90:.2f} gols por jogo** vindos desse trio. 
+        Isso significa que, ao longo de várias partidas, a produção ofensiva do time, apenas com esses três atletas, tenderia a ficar dentro desse intervalo.
+        """)
+
+    # Comparação entre anos
+    st.markdown("""
+    ### 📊 Comparação Entre os Anos (Consistência dos Top 3 Jogadores)
+    Abaixo, comparamos a **amplitude** dos intervalos de confiança de cada ano. Quanto menor a amplitude, maior a **consistência** na eficiência ofensiva entre os Top 3 do ano.
+    """)
+
+    st.dataframe(comparacoes_df.style.format({
+        "media": "{:.4f}",
+        "limite_inferior": "{:.4f}",
+        "limite_superior": "{:.4f}",
+        "amplitude": "{:.4f}"
+    }))
+
+    # ✅ Análise de Tendência com Regressão Linear Baseada nos Jogadores Individuais
+    st.markdown("""
+    ### 📈 Tendência Geral da Eficiência Ofensiva (Regressão Linear)
+    Aplicamos uma regressão considerando **todos os jogadores que marcaram gols**, para verificar se a eficiência do elenco tem melhorado ou caído ao longo dos anos.
+
+    Essa abordagem permite:
+    - **Detectar a consistência geral do grupo**, e não apenas de poucos destaques.
+    - **Avaliar o potencial do elenco como um todo**.
+    - **Planejar ajustes de elenco** com base em dados reais e históricos.
+    """)
+
+    modelo = DEPENDENCIAS.incremental(tendencias.ModeloTendencias)
+    coeficientes = modelo.coeficientes()
+
+    metrica = st.radio(
+        "Métrica", tendencias.METRICAS_TENDENCIA, format_func=tendencias.ROTULOS_TENDENCIA.get, horizontal=True,
+        key="tendencia_metrica",
+    )
+    ajuste = coeficientes.loc[metrica]
+    if ajuste["temporadas"] < 2:
+        st.info(f"{tendencias.ROTULOS_TENDENCIA[metrica]}: registrada em menos de duas temporadas, sem tendência a ajustar.")
+    else:
+        faixa = modelo.faixa(metrica)
+        comum.imagem("fig3", metrica, versao, lambda: _figura_tendencia(_observacoes(versao), metrica, faixa))
+        st.caption(
+            f"Inclinação: {ajuste['inclinacao']:.4g} por ano (IC 95%: {ajuste['ic_inclinacao_inferior']:.4g} a "
+            f"{ajuste['ic_inclinacao_superior']:.4g}; p = {ajuste['p_valor']:.3g}; {int(ajuste['atuacoes']):,} atuações)"
+        )
+
+    with st.expander("Tendência de todas as métricas"):
+        st.dataframe(
+            coeficientes[analise.COLUNAS_TENDENCIAS].rename(index=tendencias.ROTULOS_TENDENCIA).style.format(precision=4)
+        )
+
+    st.markdown("""
+    A linha vermelha no gráfico mostra a **tendência geral** de crescimento ou queda na eficiência ofensiva do Ituano. 
+    Essa visão permite que o clube **não dependa apenas da intuição ou do momento atual**, mas sim de uma **análise histórica e preditiva** para suas decisões esportivas e estratégicas.
+    """)
+
+    # ✅ Interpretação dos Resultados da Regressão e Boxplot
+    st.markdown("""
+    **O que o gráfico revela:**
+    - Apesar de alguns destaques individuais em temporadas passadas, a **tendência geral é de queda ou estagnação na eficiência ofensiva**.
+    - Isso indica que o elenco, como um todo, **não tem evoluído em capacidade ofensiva**, o que pode comprometer o desempenho em campeonatos futuros.
+    - O clube deve **avaliar o desempenho coletivo**, não apenas de artilheiros isolados, e considerar **reforços, treinamentos específicos ou mudanças táticas** para reverter esse cenário.
+    """)
+
+
+    # 📊 Expectativa de gols para 10 partidas
+    st.markdown("""
+    ### 🎯 Expectativa de Gols para 10 Partidas (Top 3 Jogadores de Cada Ano)
+    A seguir, apresentamos a projeção de gols esperados para 10 jogos completos (90 minutos) considerando os três jogadores mais eficientes de cada temporada. O gráfico mostra o intervalo inferior, a média e o intervalo superior de gols esperados.
+    """)
+
+    comparacoes_df = analise.projecao_gols(comparacoes_df, partidas=10)
+
+    comum.plotly("fig_expectativa", None, versao, lambda: _figura_expectativa(comparacoes_df), use_container_width=True)
+
+    st.markdown("""
+    Essa projeção oferece uma visão prática do potencial ofensivo do time ao longo de 10 partidas completas, considerando o desempenho dos 3 principais finalizadores de cada temporada. 
+
+    Um valor médio elevado indica um setor ofensivo produtivo e consistente, enquanto amplitudes muito grandes alertam para a irregularidade ou dependência de poucos atletas para marcar gols. 
+
+    A comissão técnica pode, por exemplo, traçar metas de gols baseadas nesses números ou identificar temporadas com menor potencial ofensivo e agir no mercado de transferências para corrigir isso.
+    """)
+
+    # ✅ Adição: Variação no Desempenho incluindo 2025
+    st.markdown("""
+    ### 📉 Variação no Desempenho por Ano
+    - **2022**: Ano de maior destaque ofensivo, com a média de gols por jogador acima das outras temporadas. Jogadores como *Rafael Elias* e *Gabriel Barros* foram grandes protagonistas.
+    - **2023**: Queda visível na produtividade ofensiva, com menos jogadores se destacando e um declínio na eficiência geral.
+    - **2024**: Estagnação ofensiva, com poucos jogadores mantendo uma taxa regular de gols por minuto, o que pode indicar problemas no ataque ou esquema tático.
+    - **2025**: Pequena recuperação na média, mas a **amplitude ainda alta** revela que o time segue **dependendo de poucos jogadores**, o que mantém um risco estratégico.
+
+    ### ⚠️ Dependência de Poucos Jogadores
+    A análise revelou que em várias temporadas o Ituano dependeu de poucos jogadores para marcar a maior parte dos gols. Essa dependência é arriscada, especialmente em caso de lesões ou transferências.
+
+    ### 📈 Eficiência nos Passes
+    A análise de passes mostrou que:
+    - Alguns jogadores não só realizaram muitos passes certos como também mantiveram alta taxa de acerto.
+    - Quando ponderado por tempo em campo, foi possível identificar jogadores com alta contribuição tática, garantindo a manutenção da posse de bola e organização ofensiva.
+
+    ### 🧠 Considerações Finais
+    - Jogadores com alta taxa de **gols por minuto** e **passes certos por minuto** demonstram ser mais eficientes taticamente e tecnicamente.
+    - A comissão técnica pode utilizar essas métricas para decisões mais embasadas em escalações, substituições e reforços para as próximas temporadas.
+    """)
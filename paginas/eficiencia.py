@@ -0,0 +1,231 @@
+"""Eficiência ofensiva: gols e passes por temporada e testes de hipótese."""
+
+import pandas as pd
+import streamlit as st
+
+from ituano import analise, estatistica, perfil, reamostragem
+from ituano.importacoes import importar
+from paginas import comum
+from paginas.comum import COLUNAS_GOLS, COLUNAS_PASSES, Dependencias
+
+DEPENDENCIAS = Dependencias(COLUNAS_GOLS + COLUNAS_PASSES, usa_agregados=True)
+
+
+@st.cache_data(show_spinner=False)
+@perfil.medir()
+def _estatisticas(versao):
+    # Todas as temporadas e todos os pares de temporadas de uma vez
+    return analise.estatisticas_temporadas(DEPENDENCIAS.agregados())
+
+
+@st.cache_data(show_spinner=False)
+@perfil.medir()
+def _resumo_ano(versao, ano):
+    return (
+        analise.resumo_gols(DEPENDENCIAS.agregados(), ano),
+        analise.eficiencia_passes(DEPENDENCIAS.dados(anos=[ano])),
+    )
+
+
+@st.cache_data(show_spinner=False)
+@perfil.medir()
+def _gols_por_minuto(versao, anos):
+    df = DEPENDENCIAS.dados(anos=list(anos))
+    return df[df["statistics_minutes_played"] > 0]
+
+
+@st.cache_data(show_spinner=False)
+@perfil.medir()
+def _permutacao(versao, teste, ano_a, ano_b, opcoes):
+    ag = DEPENDENCIAS.agregados()
+    if teste == "top3":
+        return reamostragem.permutacao_top_gpm(ag, ano_a, ano_b, 3, **opcoes)
+    return reamostragem.permutacao_jogos_com_gol(ag, ano_a, ano_b, **opcoes)
+
+
+def _mostrar_permutacao(resultado):
+    arranjos = "todos os arranjos" if resultado["exato"] else f"{resultado['permutacoes']:,} permutações"
+    st.markdown(f"**Valor de p (permutação, {arranjos}):** {resultado['p_valor']:.4f}")
+
+
+def _selecionar_anos(anos, padrao, chave):
+    """Dois selectboxes lado a lado; o segundo não oferece o ano do primeiro."""
+    coluna_a, coluna_b = st.columns(2)
+    indice_a = anos.index(padrao[0]) if padrao[0] in anos else 0
+    ano_a = coluna_a.selectbox("Ano A", anos, index=indice_a, key=f"{chave}_a")
+    restantes = [ano for ano in anos if ano != ano_a]
+    indice_b = restantes.index(padrao[1]) if padrao[1] in restantes else 0
+    ano_b = coluna_b.selectbox("Ano B", restantes, index=indice_b, key=f"{chave}_b")
+    return ano_a, ano_b
+
+
+def render():
+    px = importar("plotly.express")
+
+    st.header("Eficiência Ofensiva dos Jogadores")
+    st.subheader("Seleção de Ano")
+    anos = DEPENDENCIAS.anos()
+    opcoes = comum.opcoes_reamostragem()
+    if not anos:
+        st.warning("Nenhuma temporada disponível para a seleção atual.")
+        return
+    selected_year = st.selectbox("Selecione o Ano", anos)
+    versao = DEPENDENCIAS.versao()
+    # Chave só da temporada escolhida: ingerir outra temporada não invalida estes caches
+    versao_ano = DEPENDENCIAS.versao([selected_year])
+    gols, passes = _resumo_ano(versao_ano, selected_year)
+    gols_jogadores, mean_gols, conf_int = gols["gols_jogadores"], gols["media"], gols["intervalo"]
+
+    st.subheader("Média e Intervalo de Confiança de Gols")
+
+    st.markdown(f"**Média de gols por jogador:** {mean_gols:.2f}")
+    st.markdown(f"**Intervalo de confiança (95%):** ({conf_int[0]:.2f}, {conf_int[1]:.2f})")
+
+    st.subheader("Top 5 Artilheiros e Piores Marcadores")
+    melhores = gols["melhores"]
+    piores = gols["piores"]
+
+    st.write("**Top 5 Artilheiros:**")
+    st.dataframe(melhores)
+
+    st.write("**Jogadores com Menos Gols:**")
+    st.dataframe(piores)
+
+    st.subheader("Visualizações de Dados")
+    comum.plotly("bar_fig", selected_year, versao_ano, lambda: px.bar(
+        melhores, x=melhores.index, y=melhores.values, title="Top 5 Artilheiros do Ituano",
+        labels={"x": "Jogador", "y": "Gols"}))
+
+    comum.plotly("hist_fig", selected_year, versao_ano, lambda: px.histogram(
+        gols_jogadores, nbins=10, title="Distribuição de Gols por Jogador"))
+
+    st.subheader("Eficiência de Passes")
+    st.markdown("**Jogadores com mais passes certos:**")
+    st.dataframe(passes["mais_passes"])
+
+    st.markdown("**Melhores taxas de acerto de passe:**")
+    st.dataframe(passes["melhor_acerto"])
+
+    st.markdown("**Passes certos por minuto jogado:**")
+    st.dataframe(passes["por_minuto"])
+
+    with st.expander("Intervalo de confiança (95%) de gols por minuto por jogador"):
+        ic_jogadores = _estatisticas(versao)["ic_jogadores"]
+        if selected_year in ic_jogadores.index.get_level_values("ano"):
+            st.dataframe(
+                ic_jogadores.loc[selected_year].sort_values("media", ascending=False)
+                [["n", "media", "limite_inferior", "limite_superior"]]
+                .style.format({"media": "{:.4f}", "limite_inferior": "{:.4f}", "limite_superior": "{:.4f}"})
+            )
+
+        st.markdown("**Todos os pares de temporadas (Top 3 por gols por minuto, Welch):**")
+        st.dataframe(_estatisticas(versao)["welch_top3"], hide_index=True)
+
+    # NOVA SEÇÃO — Testes de Hipótese
+    st.header("📊 Testes de Hipótese Estatística")
+    if len(anos) < 2:
+        st.info("Os testes comparam duas temporadas: selecione um recorte com pelo menos dois anos.")
+        return
+
+    # Hipótese 1: Média de gols por minuto dos Top 3 de dois anos (padrão: 2022 vs 2023)
+    ano_a, ano_b = _selecionar_anos(anos, (2022, 2023), "hipotese1")
+    st.subheader(f"Comparação: Média de Gols por Minuto (Top 3 - {ano_a} x {ano_b})")
+
+    teste = estatistica.par(_estatisticas(versao)["welch_top3"], ano_a, ano_b)
+    p_value = teste["p_valor"]
+    versao_par = DEPENDENCIAS.versao([ano_a, ano_b])
+    df_gpm = _gols_por_minuto(versao_par, (ano_a, ano_b))
+
+    st.markdown(f"**Valor de p:** {p_value:.4f}")
+    if opcoes:
+        _mostrar_permutacao(_permutacao(versao_par, "top3", ano_a, ano_b, opcoes))
+
+    comum.plotly("fig_box1", (ano_a, ano_b), versao_par, lambda: px.box(
+        df_gpm,
+        x="ano", y="gols_por_minuto",
+        title=f"Distribuição de Gols por Minuto ({ano_a} x {ano_b})"))
+
+    st.markdown(f"""
+    **Teste realizado:** Teste t para duas amostras independentes (Welch’s t-test)
+
+    **Hipóteses**
+    - **H₀:** As médias de gols por minuto dos Top 3 jogadores de {ano_a} e {ano_b} são iguais.
+    - **H₁:** As médias são diferentes.
+
+    O boxplot exibe a variação das médias de gols por minuto por jogador. O valor de p indica se a diferença entre os anos é estatisticamente significativa:
+    - Se p < 0.05 → existe diferença significativa.
+    - Se p ≥ 0.05 → não há diferença estatística.
+
+    **Nível de significância adotado:** 5%.
+    """)
+
+    if p_value < 0.05:
+        st.markdown(f"✅ Como o valor de p é menor que 0.05, **rejeitamos a hipótese nula**. Há evidências de que a média de gols por minuto dos Top 3 de {ano_a} é diferente da de {ano_b}.")
+    else:
+        st.markdown(f"⚠️ Como o valor de p é maior que 0.05, **não rejeitamos a hipótese nula**. Não há evidências de diferença significativa entre as médias de gols por minuto dos Top 3 de {ano_a} e {ano_b}.")
+
+    # Justificativa de Gestão para o Primeiro Gráfico
+    st.header("Como esse resultado ajuda o Ituano?")
+    st.markdown("""
+    O gráfico acima compara o rendimento **individual** dos principais jogadores em termos de gols por minuto, permitindo que a comissão técnica avalie **quais perfis de atletas** têm mantido ou melhorado sua performance.
+
+    Essas informações ajudam o Ituano a:
+    - Decidir sobre **renovações e contratações**.
+    - Identificar **quem deve receber maior tempo de jogo**.
+    - Reforçar o **planejamento tático** com base em jogadores mais eficientes.
+
+    Basear essas decisões em **dados concretos** reduz o risco de decisões equivocadas por percepções subjetivas.
+    """)
+
+    # Hipótese 2: Proporção de jogos com pelo menos 1 gol em dois anos (padrão: 2022 vs 2024)
+    ano_c, ano_d = _selecionar_anos(anos, (2022, 2024), "hipotese2")
+    st.subheader(f"Comparação: Proporção de Jogos com Pelo Menos 1 Gol ({ano_c} x {ano_d})")
+
+    versao_par = DEPENDENCIAS.versao([ano_c, ano_d])
+    teste = estatistica.par(_estatisticas(versao)["z_jogos_com_gol"], ano_c, ano_d)
+    p1, p2, z_stat, p_value_z = teste["p_a"], teste["p_b"], teste["z"], teste["p_valor"]
+
+    st.markdown(f"**Estatística z:** {z_stat:.4f}")
+    st.markdown(f"**Valor de p:** {p_value_z:.4f}")
+    if opcoes:
+        _mostrar_permutacao(_permutacao(versao_par, "jogos_com_gol", ano_c, ano_d, opcoes))
+
+    proportion_df = pd.DataFrame({
+        'Ano': [str(ano_c), str(ano_d)],
+        'Proporção de Jogos com Gol': [p1, p2]
+    })
+
+    comum.plotly("fig_bar", (ano_c, ano_d), versao_par, lambda: px.bar(
+        proportion_df, x='Ano', y='Proporção de Jogos com Gol',
+        title=f'Proporção de Jogos com Pelo Menos 1 Gol ({ano_c} x {ano_d})', text_auto='.2%'))
+
+    st.markdown(f"""
+    **Teste realizado:** Teste de Proporção para duas amostras independentes (Z para proporção)
+
+    **Hipóteses**
+    - **H₀:** As proporções de jogos com pelo menos 1 gol em {ano_c} e {ano_d} são iguais.
+    - **H₁:** As proporções são diferentes.
+
+    O gráfico acima mostra as proporções em cada ano. O valor de p indica a significância da diferença:
+    - Se p < 0.05 → existe diferença significativa.
+    - Se p ≥ 0.05 → não há diferença estatística.
+
+    **Nível de significância adotado:** 5%.
+    """)
+
+    if p_value_z < 0.05:
+        st.markdown(f"✅ Como o valor de p é menor que 0.05, **rejeitamos a hipótese nula**. Há evidências de que o desempenho ofensivo em termos de marcar gols mudou entre {ano_c} e {ano_d}.")
+    else:
+        st.markdown(f"⚠️ Como o valor de p é maior que 0.05, **não rejeitamos a hipótese nula**. Não há evidências de diferença significativa no desempenho ofensivo entre {ano_c} e {ano_d}.")
+
+    st.header("Como esse resultado ajuda o Ituano?")
+    st.markdown("""
+    O gráfico acima mostra a **frequência com que o Ituano consegue marcar gols por temporada**, fornecendo uma visão **coletiva do desempenho ofensivo** do time.
+
+    Essas informações ajudam o Ituano a:
+    - **Avaliar a evolução ou regressão do time** como um todo no ataque.
+    - Sustentar **decisões sobre a continuidade da comissão técnica**.
+    - Identificar a **necessidade de reforços ofensivos**.
+
+    Este monitoramento permite que o clube tome **decisões estratégicas mais seguras e baseadas em dados reais**, ao invés de apenas percepções ou achismos.
+    """)
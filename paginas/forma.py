@@ -0,0 +1,61 @@
+"""Forma dos jogadores: métricas em janelas móveis ao longo das partidas."""
+
+import streamlit as st
+
+from ituano import forma, perfil
+from ituano.importacoes import importar
+from paginas import comum
+from paginas.comum import Dependencias
+
+DEPENDENCIAS = Dependencias(forma.COLUNAS_FORMA)
+
+
+# cache_resource: a tabela de todos os jogadores é compartilhada sem cópia
+# (cache_data serializaria a tabela inteira a cada rerun); não modificar
+@st.cache_resource(show_spinner=False, max_entries=8)
+@perfil.medir()
+def _forma(versao, janela, por_temporada):
+    return forma.calcular(DEPENDENCIAS.dados(), janela, por_temporada)
+
+
+def render():
+    px = importar("plotly.express")
+
+    st.header("Forma dos Jogadores")
+    st.markdown("""
+    Métricas calculadas nas **últimas N partidas** em que o jogador entrou em campo, em ordem de temporada e jogo.
+    As taxas por 90 minutos e o acerto de passe são razões das somas da janela; a nota é a média das notas da janela.
+    """)
+
+    coluna_janela, coluna_temporada = st.columns(2)
+    janela = coluna_janela.slider("Janela (partidas)", 1, 15, forma.JANELA_PADRAO, key="forma_janela")
+    por_temporada = coluna_temporada.toggle("Reiniciar a janela a cada temporada", key="forma_por_temporada")
+
+    versao = DEPENDENCIAS.versao()
+    tabela = _forma(versao, janela, por_temporada)
+    jogadores = forma.jogadores(tabela)
+    if not jogadores:
+        st.warning("Nenhum jogador com minutos registrados na seleção atual.")
+        return
+
+    jogador = st.selectbox("Jogador (ordenados por partidas disputadas)", jogadores, key="forma_jogador")
+    metricas = st.multiselect(
+        "Métricas", list(forma.METRICAS_FORMA), default=["gols_p90", "nota", "pass_accuracy"],
+        format_func=forma.ROTULOS_FORMA.get, key="forma_metricas",
+    )
+
+    linha_do_tempo = forma.linha_do_tempo(tabela, jogador)
+    st.caption(f"{len(linha_do_tempo)} partidas com minutos jogados")
+    for metrica in metricas:
+        if linha_do_tempo[metrica].isna().all():
+            st.info(f"{forma.ROTULOS_FORMA[metrica]}: sem dados para {jogador}.")
+            continue
+        comum.plotly(
+            "forma", (jogador, janela, por_temporada, metrica), versao, lambda metrica=metrica: px.line(
+                linha_do_tempo, x="partida", y=metrica, color=linha_do_tempo["ano"].astype(str), markers=True,
+                hover_name="rotulo",
+                title=f"{forma.ROTULOS_FORMA[metrica]} — últimas {janela} partidas ({jogador})",
+                labels={"partida": "Partida", metrica: forma.ROTULOS_FORMA[metrica], "color": "Temporada"}))
+
+    with st.expander("Tabela da linha do tempo"):
+        st.dataframe(linha_do_tempo.set_index("rotulo").drop(columns=["ano", "jogo"]))
@@ -0,0 +1,37 @@
+"""Página inicial: contexto do problema e perguntas investigativas."""
+
+import streamlit as st
+
+from paginas.comum import Dependencias
+
+DEPENDENCIAS = Dependencias()
+
+
+def render():
+    st.title("Análise de Desempenho Esportivo - Ituano")
+    st.header("Descrição do Problema e Contexto do Mercado")
+    st.markdown("""
+    O desempenho esportivo de um clube de futebol é um fator determinante para sua competitividade, crescimento e posicionamento no cenário nacional e internacional. 
+
+    Neste estudo, nosso **foco principal** é analisar a **performance individual dos jogadores** do Ituano ao longo dos anos. Queremos entender como cada atleta contribui para o sucesso ofensivo da equipe, identificando os jogadores mais eficientes e aqueles cujo desempenho pode estar abaixo do esperado.
+
+    Dessa forma, vamos investigar:
+    - Quais jogadores apresentam um desempenho mais consistente ao longo das temporadas?
+    - Existe um padrão de artilheiros que se repete anualmente ou há muita variação?
+    - O Ituano tem uma dependência excessiva de poucos jogadores para marcar gols?
+
+    ### Evolução do Ituano ao Longo dos Anos
+    Além do foco nos jogadores, também podemos observar se a equipe como um todo tem melhorado, piorado ou mantido um desempenho estável. 
+
+    Fatores que podem influenciar essa performance incluem mudanças na escalação, novas contratações, alterações táticas e até mesmo aspectos físicos e psicológicos dos jogadores. 
+
+    **Melhoria, Piora ou Estagnação:** Os dados irão indicar se houve um progresso contínuo ou se o time tem enfrentado dificuldades ofensivas em algumas temporadas específicas. Essa informação pode ser crucial para treinadores e gestores do clube.
+
+    ### Perguntas Investigativas
+    Com base nisso, nossa análise busca responder:
+    - O Ituano tem melhorado sua performance ofensiva ao longo dos anos?
+    - Os gols marcados estão distribuídos de forma equilibrada entre os jogadores ou dependem de poucos artilheiros?
+    - Existe uma variação significativa no desempenho dos jogadores entre temporadas?
+    - O Ituano possui jogadores consistentes que se destacam regularmente?
+    - Como a equipe pode otimizar seu desempenho com base nos dados analisados?
+    """)
@@ -0,0 +1,54 @@
+"""Jogadores semelhantes: vizinhos mais próximos por estatísticas por 90 minutos."""
+
+import streamlit as st
+
+from ituano import similaridade
+from paginas.comum import Dependencias
+
+DEPENDENCIAS = Dependencias(similaridade.COLUNAS_SIMILARIDADE)
+
+# Colunas por 90 exibidas ao lado dos vizinhos
+COLUNAS_RESUMO = {
+    "statistics_goals": "Gols/90",
+    "statistics_expected_goals": "xG/90",
+    "statistics_key_pass": "Passes-chave/90",
+    "statistics_accurate_pass": "Passes certos/90",
+    "statistics_duel_won": "Duelos ganhos/90",
+    "statistics_interception_won": "Interceptações/90",
+    "statistics_rating": "Nota",
+}
+
+
+def render():
+    st.header("Jogadores Semelhantes")
+    st.markdown(f"""
+    Cada jogador-temporada com pelo menos **{similaridade.MINIMO_MINUTOS} minutos** é descrito pelas estatísticas
+    da partida **por 90 minutos** (e pela nota média), padronizadas pela média e desvio de todos os jogadores.
+    A busca retorna os vizinhos mais próximos por similaridade de cosseno ou distância euclidiana.
+    """)
+
+    indice = DEPENDENCIAS.incremental(similaridade.IndiceSimilaridade)
+    if len(indice) < 2:
+        st.warning("Jogadores insuficientes na seleção atual para comparar.")
+        return
+
+    chaves = indice.chaves()
+    opcoes = sorted(zip(chaves.get_level_values("player_name"), chaves.get_level_values("ano")))
+    jogador, ano = st.selectbox(
+        "Jogador e temporada", opcoes, format_func=lambda opcao: f"{opcao[0]} ({opcao[1]})", key="similar_jogador")
+
+    coluna_metrica, coluna_k, coluna_outros = st.columns(3)
+    metrica = coluna_metrica.radio(
+        "Métrica", similaridade.METRICAS_DISTANCIA, format_func=str.capitalize, horizontal=True, key="similar_metrica")
+    k = coluna_k.slider("Vizinhos", 3, 25, 10, key="similar_k")
+    outros = coluna_outros.toggle("Ignorar outras temporadas do jogador", value=True, key="similar_outros")
+
+    vizinhos = indice.semelhantes(jogador, ano, k, metrica, outros_jogadores=outros)
+    por90 = indice.por90()[list(COLUNAS_RESUMO)].rename(columns=COLUNAS_RESUMO)
+    referencia = por90.loc[[(ano, jogador)]].reset_index()
+    tabela = vizinhos.join(por90, on=["ano", "player_name"])
+
+    st.subheader(f"Referência: {jogador} ({ano})")
+    st.dataframe(referencia.style.format(precision=2), hide_index=True)
+    st.subheader("Mais parecidos")
+    st.dataframe(tabela.style.format(precision=2), hide_index=True)